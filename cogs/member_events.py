@@ -10,14 +10,26 @@ from discord.ext import commands
 import logging
 from utils import astra_db_ops
 import asyncio
+import time
 from datetime import datetime, timedelta
 
 class MemberEventsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.verification_cog = None
+        # (monotonic time, formatted timestamp) reused across leave bursts
+        self._ts_cache: tuple[float, str] | None = None
         logging.info("MemberEventsCog initialized")
 
+    def _leave_timestamp(self) -> str:
+        """Return a relative Discord timestamp, reused for up to one second."""
+        now = time.monotonic()
+        if self._ts_cache and now - self._ts_cache[0] < 1.0:
+            return self._ts_cache[1]
+        formatted = discord.utils.format_dt(discord.utils.utcnow(), 'R')
+        self._ts_cache = (now, formatted)
+        return formatted
+
     async def cog_load(self):
         """Initialize the cog."""
         logging.info("Loading MemberEventsCog...")
@@ -39,10 +51,12 @@ class MemberEventsCog(commands.Cog):
             
             # Handle verification cleanup if member was in verification process
             if self.verification_cog:
-                verification_data = self.verification_cog.get_verification_data(member.id, member.guild.id)
+                verification_data = await self.verification_cog.get_verification_data(member.id, member.guild.id)
                 if verification_data:
                     # Delete verification channel if it exists
-                    channel = member.guild.get_channel(verification_data["channel_id"])
+                    # Skip the REST call entirely when it would just fail with Forbidden
+                    can_manage_channels = member.guild.me.guild_permissions.manage_channels
+                    channel = member.guild.get_channel(verification_data["channel_id"]) if can_manage_channels else None
                     if channel:
                         try:
                             await channel.delete()
@@ -51,16 +65,17 @@ class MemberEventsCog(commands.Cog):
                             logging.error(f"Failed to delete verification channel for {member.name}: {e}")
                     
                     # Clean up verification data
-                    self.verification_cog.delete_verification_data(member.id, member.guild.id)
+                    await self.verification_cog.delete_verification_data(member.id, member.guild.id)
                     logging.debug(f"Cleaned up verification data for {member.name}")
             
             # Notify admins about member leaving (regardless of verification status)
             if self.verification_cog:
-                settings = self.verification_cog.get_guild_settings(member.guild.id)
+                settings = await self.verification_cog.get_guild_settings(member.guild.id)
                 if isinstance(settings, dict):
                     admin_channel_name = settings.get("admin_channel_name")
                     if admin_channel_name:
-                        admin_channel = discord.utils.get(member.guild.channels, name=admin_channel_name)
+                        admin_channel_id = self.verification_cog.get_channel_id(member.guild, admin_channel_name)
+                        admin_channel = member.guild.get_channel(admin_channel_id) if admin_channel_id else None
                         if admin_channel:
                             embed = discord.Embed(
                                 title="👋 Member Left",
@@ -68,7 +83,7 @@ class MemberEventsCog(commands.Cog):
                                     f"**User:** {member.mention}\n"
                                     f"**ID:** {member.id}\n"
                                     f"**Roles:** {', '.join(role.name for role in roles) if roles else 'None'}\n"
-                                    f"**Time:** {discord.utils.format_dt(discord.utils.utcnow(), 'R')}"
+                                    f"**Time:** {self._leave_timestamp()}"
                                 ),
                                 color=discord.Color.orange()
                             )
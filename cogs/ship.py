@@ -10,229 +10,389 @@ Design notes:
 - Uses minimal image compositing (Pillow) for PixxieBot-style layout.
 """
 
+import asyncio
+import bisect
 import io
 import logging
+import os
 import random
+import threading
+from collections import OrderedDict
 
+import aiohttp
 import discord
-import requests
 from discord import app_commands
 from discord.ext import commands
 from PIL import Image, ImageDraw, ImageFont
 
-from configs.ship_messages import SHIP_MESSAGES
+from configs.ship_messages import SELF_SHIP_MESSAGES, SHIP_MESSAGES
 from utils import error_handler
 
 
+# Hot-path aliases, resolved once instead of on every ship
+_BytesIO = io.BytesIO
+_Draw = ImageDraw.Draw
+_LANCZOS = Image.Resampling.LANCZOS
+_open_image = Image.open
+
+AVATAR_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+AVATAR_CACHE_MAX = 256
+COMPOSITE_CACHE_MAX = 128  # ~30KB of WebP each
+
+FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
+    "C:/Windows/Fonts/arialbd.ttf",  # Windows
+)
+# Resolved once at import; None means only Pillow's built-in bitmap font is available
+_FONT_PATH = next((path for path in FONT_CANDIDATES if os.path.exists(path)), None)
+_FONT_CACHE: dict[int, ImageFont.ImageFont | ImageFont.FreeTypeFont] = {}
+
+
+def _get_font(size: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+    """Return a bold font at the given size, parsing each TTF size only once."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype(_FONT_PATH, size) if _FONT_PATH else ImageFont.load_default()
+        except (OSError, IOError):
+            font = ImageFont.load_default()
+        _FONT_CACHE[size] = font
+    return font
+
+
+# Composite layout: two avatars flanking a vertical progress bar (wider bar for thicker text)
+AVATAR_SIZE = 256  # Small avatars to minimize memory
+COMPOSITE_WIDTH = 600
+COMPOSITE_HEIGHT = 300
+BAR_WIDTH = 80
+_PADDING = 20
+_AVATAR_SPACING = (COMPOSITE_WIDTH - (2 * _PADDING) - BAR_WIDTH - (2 * AVATAR_SIZE)) // 3
+AVATAR1_X = _PADDING + _AVATAR_SPACING
+BAR_X = AVATAR1_X + AVATAR_SIZE + _AVATAR_SPACING
+AVATAR2_X = BAR_X + BAR_WIDTH + _AVATAR_SPACING
+AVATAR_Y = (COMPOSITE_HEIGHT - AVATAR_SIZE) // 2
+
+
+# Pre-rendered static layers, copied/pasted per ship instead of allocating and filling
+# fresh buffers every time. The empty bar (+1px, matching rectangle's inclusive bounds)
+# is pasted after the avatars since it overlaps their inner edges.
+_BACKGROUND_TEMPLATE = Image.new("RGB", (COMPOSITE_WIDTH, COMPOSITE_HEIGHT), color=(32, 34, 37))  # Discord dark gray
+_EMPTY_BAR = Image.new("RGB", (BAR_WIDTH + 1, AVATAR_SIZE + 1), color=(30, 32, 35))  # Darker for contrast
+
+# Filled bar color tiers: red below 40%, gold from 40%, green from 70%
+_BAR_COLOR_CUTS = (40, 70)
+_BAR_COLORS = ((231, 76, 60), (241, 196, 15), (46, 204, 113))
+
+
+def _decode_avatar(data: bytes | bytearray, size: int) -> Image.Image:
+    """Decode downloaded avatar bytes into a square RGB image of the given size."""
+    image = _open_image(_BytesIO(data))
+    # JPEG sources larger than needed decode at a reduced DCT scale; no-op for other formats
+    image.draft("RGB", (size, size))
+    # Store avatars in the canvas mode so pasting is a plain copy with no per-ship conversion
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    else:
+        image.load()
+    # The CDN already serves the requested size; only assets it can't resize need resampling
+    if image.size != (size, size):
+        image = image.resize((size, size), _LANCZOS)
+    return image
+
+
+# FreeType faces are shared via _FONT_CACHE and aren't safe to render from two threads at once
+_TEXT_LOCK = threading.Lock()
+
+# Per-thread scratch buffer reused for encoding so each ship doesn't grow a fresh BytesIO
+_ENCODE_BUFFER = threading.local()
+SHIP_IMAGE_FILENAME = "ship_compatibility.webp"
+
+
+def _encode_image(image: Image.Image) -> bytes:
+    """Encode an image as WebP into a reused scratch buffer."""
+    buffer = getattr(_ENCODE_BUFFER, "buffer", None)
+    if buffer is None:
+        buffer = _ENCODE_BUFFER.buffer = _BytesIO()
+    buffer.seek(0)
+    buffer.truncate(0)
+    # Lossy WebP encodes several times faster than DEFLATE-based PNG and uploads smaller
+    image.save(buffer, format="WEBP", quality=85, method=4)
+    return buffer.getvalue()
+
+
+# Upper bounds (inclusive) of each verdict tier, in the order of _MESSAGE_BUCKETS
+_MESSAGE_THRESHOLDS = (30, 50, 70, 85)
+_MESSAGE_FALLBACK = ("The universe is thinking… try again! 🔄",)
+_MESSAGE_BUCKETS = tuple(
+    tuple(SHIP_MESSAGES.get(category) or _MESSAGE_FALLBACK)
+    for category in ("low", "medium_low", "medium", "high", "very_high")
+)
+
+
+def _build_progress_bar(percentage: int) -> str:
+    filled = percentage // 5  # 20 blocks total, each block is 5%
+    return f"`{'█' * filled}{'░' * (20 - filled)}` {percentage}%"
+
+
+def _build_embed_color(percentage: int) -> discord.Color:
+    if percentage >= 70:
+        return discord.Color.green()
+    if percentage >= 40:
+        return discord.Color.gold()
+    return discord.Color.red()
+
+
+def _build_heart_emoji(percentage: int) -> str:
+    if percentage >= 70:
+        return "❤️"  # Red heart for high compatibility
+    if percentage >= 40:
+        return "💛"  # Yellow heart for medium compatibility
+    return "💔"  # Broken heart for low compatibility
+
+
+# Only 101 possible percentages, so per-ship embed decorations are simple table lookups
+_PROGRESS_BARS = tuple(_build_progress_bar(p) for p in range(101))
+_EMBED_COLORS = tuple(_build_embed_color(p) for p in range(101))
+_HEART_EMOJIS = tuple(_build_heart_emoji(p) for p in range(101))
+
+
 class ShipCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._session: aiohttp.ClientSession | None = None
+        # Decoded, resized RGB avatars keyed by Discord's asset hash (LRU order)
+        self._avatar_cache: OrderedDict[str, Image.Image] = OrderedDict()
+        self._avatar_locks: dict[str, asyncio.Lock] = {}
+        # Encoded composites keyed by (avatar1 hash, avatar2 hash, percentage) (LRU order)
+        self._composite_cache: OrderedDict[tuple[str, str, int], bytes] = OrderedDict()
+
+    async def cog_load(self):
+        """Open a pooled keep-alive session for avatar downloads."""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+        )
 
-    async def create_composite_image(
-        self, user1: discord.Member, user2: discord.Member, percentage: int
-    ) -> discord.File | None:
-        """Create a composite image with two avatars and a vertical progress bar.
+    async def cog_unload(self):
+        """Close the avatar download session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
 
-        Resource usage:
-        - Memory: ~1-2MB peak (temporary, cleaned immediately)
-        - CPU: <100ms for simple compositing
-        - No disk I/O (all in-memory with BytesIO)
+    async def _fetch_avatar(self, user: discord.Member, size: int) -> bytearray:
+        """Download a user's avatar bytes, pre-sized by the Discord CDN, through the shared session.
 
-        Returns:
-            discord.File if successful, None if image generation fails (falls back to embed-only).
+        The body is streamed into a single buffer sized from Content-Length rather
+        than accumulating chunks and joining them.
+        """
+        url = user.display_avatar.replace(size=size, format="png").url
+        async with self._session.get(url, timeout=AVATAR_FETCH_TIMEOUT) as response:
+            response.raise_for_status()
+            buffer = bytearray(response.content_length or 0)
+            offset = 0
+            async for chunk in response.content.iter_any():
+                end = offset + len(chunk)
+                if end <= len(buffer):
+                    buffer[offset:end] = chunk
+                else:
+                    # Missing or understated Content-Length: grow as needed
+                    buffer[offset:] = chunk
+                offset = end
+            del buffer[offset:]
+            return buffer
+
+    async def _get_avatar(self, user: discord.Member, size: int) -> Image.Image:
+        """Return the user's avatar as a resized RGB image, served from the LRU when possible.
+
+        Cached images are shared between requests and must never be mutated in place.
         """
+        key = user.display_avatar.key
+        cached = self._avatar_cache.get(key)
+        if cached is not None:
+            self._avatar_cache.move_to_end(key)
+            return cached
+
+        # One download per avatar even when several ships race on the same miss
+        lock = self._avatar_locks.setdefault(key, asyncio.Lock())
         try:
-            # Download avatars (small size: 256x256 to minimize memory)
-            avatar_size = 256
-            composite_width = 600
-            composite_height = 300
-
-            # Download user1 avatar
-            avatar1_response = requests.get(
-                user1.display_avatar.url, timeout=5, params={"size": avatar_size}
-            )
-            avatar1_response.raise_for_status()
-            avatar1_img = Image.open(io.BytesIO(avatar1_response.content))
-            avatar1_img = avatar1_img.resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
-
-            # Download user2 avatar
-            avatar2_response = requests.get(
-                user2.display_avatar.url, timeout=5, params={"size": avatar_size}
-            )
-            avatar2_response.raise_for_status()
-            avatar2_img = Image.open(io.BytesIO(avatar2_response.content))
-            avatar2_img = avatar2_img.resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
-
-            # Create composite canvas
-            composite = Image.new("RGB", (composite_width, composite_height), color=(32, 34, 37))  # Discord dark gray
-
-            # Calculate positions (wider bar for better text readability and thicker text)
-            padding = 20
-            bar_width = 80  # Wider bar for better visibility and thicker text
-            available_width = composite_width - (2 * padding) - bar_width
-            avatar_spacing = (available_width - (2 * avatar_size)) // 3
-
-            avatar1_x = padding + avatar_spacing
-            bar_x = avatar1_x + avatar_size + avatar_spacing
-            avatar2_x = bar_x + bar_width + avatar_spacing
-            avatar_y = (composite_height - avatar_size) // 2
-
-            # Paste avatars
-            composite.paste(avatar1_img, (avatar1_x, avatar_y))
-            composite.paste(avatar2_img, (avatar2_x, avatar_y))
-            
-            bar_y_start = avatar_y
-            bar_height = avatar_size
-            filled_height = int((percentage / 100) * bar_height)
+            async with lock:
+                cached = self._avatar_cache.get(key)
+                if cached is None:
+                    data = await self._fetch_avatar(user, size)
+                    cached = await asyncio.to_thread(_decode_avatar, data, size)
+                    self._avatar_cache[key] = cached
+                    if len(self._avatar_cache) > AVATAR_CACHE_MAX:
+                        self._avatar_cache.popitem(last=False)
+                return cached
+        finally:
+            self._avatar_locks.pop(key, None)
+
+    def _build_composite_sync(
+        self, avatar1_img: Image.Image, avatar2_img: Image.Image, percentage: int
+    ) -> bytes:
+        """Render the ship composite and return the encoded image bytes. Runs in a worker thread."""
+        # Start from the pre-rendered background canvas
+        composite = _BACKGROUND_TEMPLATE.copy()
+
+        # Paste avatars, then the empty bar on top
+        composite.paste(avatar1_img, (AVATAR1_X, AVATAR_Y))
+        composite.paste(avatar2_img, (AVATAR2_X, AVATAR_Y))
+        composite.paste(_EMPTY_BAR, (BAR_X, AVATAR_Y))
+
+        bar_x = BAR_X
+        bar_width = BAR_WIDTH
+        bar_y_start = AVATAR_Y
+        bar_height = AVATAR_SIZE
+        filled_height = int((percentage / 100) * bar_height)
+
+        draw = _Draw(composite)
+
+        # Filled portion (color based on percentage)
+        bar_color = _BAR_COLORS[bisect.bisect_right(_BAR_COLOR_CUTS, percentage)]
+        draw.rectangle(
+            [
+                (bar_x, bar_y_start + bar_height - filled_height),
+                (bar_x + bar_width, bar_y_start + bar_height),
+            ],
+            fill=bar_color,
+        )
 
-            draw = ImageDraw.Draw(composite)
+        # Add percentage text on bar - ensure it fits within bar width
+        try:
+            text = f"{percentage}%"
 
-            # Bar background (dark)
-            draw.rectangle(
-                [(bar_x, bar_y_start), (bar_x + bar_width, bar_y_start + bar_height)],
-                fill=(30, 32, 35),  # Darker background for better contrast
-            )
+            # Start with a larger, thicker font size for better visibility
+            font_size = 36  # Larger for thicker, more prominent text
+            available_width = bar_width - 8  # Leave 4px padding on each side
 
-            # Filled portion (color based on percentage)
-            if percentage >= 70:
-                bar_color = (46, 204, 113)  # Green
-            elif percentage >= 40:
-                bar_color = (241, 196, 15)  # Gold
-            else:
-                bar_color = (231, 76, 60)  # Red
-
-            draw.rectangle(
-                [
-                    (bar_x, bar_y_start + bar_height - filled_height),
-                    (bar_x + bar_width, bar_y_start + bar_height),
-                ],
-                fill=bar_color,
-            )
+            with _TEXT_LOCK:
+                font = _get_font(font_size)
 
-            # Add percentage text on bar - ensure it fits within bar width
-            try:
-                text = f"{percentage}%"
-                
-                # Start with a larger, thicker font size for better visibility
-                font_size = 36  # Larger for thicker, more prominent text
-                font = None
-                font_paths = [
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
-                    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
-                    "C:/Windows/Fonts/arialbd.ttf",  # Windows
-                ]
-                
-                # Try to load a font, scaling down if text doesn't fit
-                max_attempts = 3
-                for attempt in range(max_attempts):
-                    for path in font_paths:
-                        try:
-                            font = ImageFont.truetype(path, font_size)
-                            break
-                        except (OSError, IOError):
-                            continue
-                    
-                    if font is None:
-                        # Fallback to default font
-                        font = ImageFont.load_default()
-                    
-                    # Check if text fits within bar width (with some padding)
-                    bbox = draw.textbbox((0, 0), text, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    available_width = bar_width - 8  # Leave 4px padding on each side
-                    
-                    if text_width <= available_width:
-                        break  # Text fits, use this font size
-                    
-                    # Text too wide, reduce font size and try again
-                    font_size = int(font_size * 0.85)  # Reduce by 15%
-                    font = None
-                
-                if font is None:
-                    font = ImageFont.load_default()
-                
-                # Get final text dimensions and position
+                # Measure once; text width scales ~linearly with font size, so solve
+                # for the largest size that fits instead of shrinking step by step
                 bbox = draw.textbbox((0, 0), text, font=font)
                 text_width = bbox[2] - bbox[0]
+                if text_width > available_width:
+                    font_size = max(8, int(font_size * available_width / text_width))
+                    font = _get_font(font_size)
+                    bbox = draw.textbbox((0, 0), text, font=font)
+                    text_width = bbox[2] - bbox[0]
+
                 text_height = bbox[3] - bbox[1]
                 text_x = bar_x + (bar_width - text_width) // 2
                 text_y = bar_y_start + (bar_height - text_height) // 2
 
-                # Draw text with strong black outline for good contrast on all bar colors
-                # White text with black outline works well on red, gold, and green
-                outline_width = 2  # Stronger outline for better readability
-                for adj_x in range(-outline_width, outline_width + 1):
-                    for adj_y in range(-outline_width, outline_width + 1):
-                        if adj_x != 0 or adj_y != 0:
-                            draw.text((text_x + adj_x, text_y + adj_y), text, fill=(0, 0, 0), font=font)
-                
-                # White text on top - good contrast on red, gold, and green bars
-                draw.text((text_x, text_y), text, fill=(255, 255, 255), font=font)
-            except Exception as e:
-                logging.warning(f"Failed to render text on bar: {e}")
-                # If font rendering fails, skip text (bar still visible)
-                pass
-
-            # Convert to bytes
-            img_bytes = io.BytesIO()
-            composite.save(img_bytes, format="PNG", optimize=True)
-            img_bytes.seek(0)
-
-            return discord.File(img_bytes, filename="ship_compatibility.png")
+                # White text with a strong black outline (rendered in one pass by Pillow)
+                # gives good contrast on red, gold, and green bars
+                draw.text(
+                    (text_x, text_y),
+                    text,
+                    fill=(255, 255, 255),
+                    font=font,
+                    stroke_width=2,
+                    stroke_fill=(0, 0, 0),
+                )
+        except Exception as e:
+            logging.warning(f"Failed to render text on bar: {e}")
+            # If font rendering fails, skip text (bar still visible)
+            pass
+
+        return _encode_image(composite)
+
+    def _get_cached_composite(self, key: tuple[str, str, int]) -> bytes | None:
+        """Return previously rendered composite bytes for this pairing, if any."""
+        image_bytes = self._composite_cache.get(key)
+        if image_bytes is not None:
+            self._composite_cache.move_to_end(key)
+        return image_bytes
+
+    def _store_composite(self, key: tuple[str, str, int], image_bytes: bytes) -> None:
+        """Remember rendered composite bytes, evicting the least recently used entry."""
+        self._composite_cache[key] = image_bytes
+        if len(self._composite_cache) > COMPOSITE_CACHE_MAX:
+            self._composite_cache.popitem(last=False)
+
+    async def create_composite_image(
+        self, user1: discord.Member, user2: discord.Member, percentage: int
+    ) -> discord.File | None:
+        """Create a composite image with two avatars and a vertical progress bar.
+
+        Resource usage:
+        - Memory: ~1-2MB peak (temporary, cleaned immediately), plus bounded avatar/composite caches
+        - CPU: <100ms for simple compositing, none on a composite cache hit
+        - No disk I/O (all in-memory with BytesIO)
+
+        Returns:
+            discord.File if successful, None if image generation fails (falls back to embed-only).
+        """
+        try:
+            # Left/right placement matters, so the key is ordered
+            key = (user1.display_avatar.key, user2.display_avatar.key, percentage)
+            image_bytes = self._get_cached_composite(key)
+            if image_bytes is None:
+                # Download both avatars concurrently (cache hits skip the network entirely)
+                avatar1_img, avatar2_img = await asyncio.gather(
+                    self._get_avatar(user1, AVATAR_SIZE), self._get_avatar(user2, AVATAR_SIZE)
+                )
+
+                # Pillow work runs off the event loop so other commands stay responsive
+                image_bytes = await asyncio.to_thread(
+                    self._build_composite_sync, avatar1_img, avatar2_img, percentage
+                )
+                self._store_composite(key, image_bytes)
+            return discord.File(_BytesIO(image_bytes), filename=SHIP_IMAGE_FILENAME)
 
         except Exception as e:
             logging.warning(f"Failed to create composite image, falling back to embed-only: {e}")
             return None
 
+    async def create_self_ship_image(self, user: discord.Member, percentage: int) -> discord.File | None:
+        """Create (or reuse) the composite for a user shipped with themselves.
+
+        Needs a single avatar fetch and decode, shared by both sides of the image.
+        """
+        try:
+            avatar_key = user.display_avatar.key
+            key = (avatar_key, avatar_key, percentage)
+            image_bytes = self._get_cached_composite(key)
+            if image_bytes is None:
+                avatar_img = await self._get_avatar(user, AVATAR_SIZE)
+                image_bytes = await asyncio.to_thread(
+                    self._build_composite_sync, avatar_img, avatar_img, percentage
+                )
+                self._store_composite(key, image_bytes)
+            return discord.File(_BytesIO(image_bytes), filename=SHIP_IMAGE_FILENAME)
+
+        except Exception as e:
+            logging.warning(f"Failed to create self-ship image, falling back to embed-only: {e}")
+            return None
+
     def generate_compatibility(self) -> int:
         """Generate a random compatibility percentage (0-100)."""
         return random.randint(0, 100)
 
     def create_progress_bar(self, percentage: int) -> str:
         """Create a visual progress bar using Unicode blocks."""
-        filled = int(percentage / 5)  # 20 blocks total, each block is 5%
-        empty = 20 - filled
-        bar = "█" * filled + "░" * empty
-        return f"`{bar}` {percentage}%"
+        return _PROGRESS_BARS[percentage]
 
     def get_embed_color(self, percentage: int) -> discord.Color:
         """Return embed color based on compatibility percentage."""
-        if percentage >= 70:
-            return discord.Color.green()
-        if percentage >= 40:
-            return discord.Color.gold()
-        return discord.Color.red()
+        return _EMBED_COLORS[percentage]
 
     def get_heart_emoji(self, percentage: int) -> str:
         """Get dynamic heart emoji based on compatibility percentage."""
-        if percentage >= 70:
-            return "❤️"  # Red heart for high compatibility
-        elif percentage >= 40:
-            return "💛"  # Yellow heart for medium compatibility
-        else:
-            return "💔"  # Broken heart for low compatibility
+        return _HEART_EMOJIS[percentage]
 
     def get_clever_message(self, percentage: int) -> str:
         """Pick a message template based on compatibility percentage."""
-        if percentage <= 30:
-            category = "low"
-        elif percentage <= 50:
-            category = "medium_low"
-        elif percentage <= 70:
-            category = "medium"
-        elif percentage <= 85:
-            category = "high"
-        else:
-            category = "very_high"
-
-        # Defensive fallback: if messages are missing, return a generic line
-        messages = SHIP_MESSAGES.get(category) or []
-        if not messages:
-            return "The universe is thinking… try again! 🔄"
-        return random.choice(messages)
+        return random.choice(_MESSAGE_BUCKETS[bisect.bisect_left(_MESSAGE_THRESHOLDS, percentage)])
 
     def create_ship_embed(
-        self, user1: discord.Member, user2: discord.Member, percentage: int, has_image: bool = False
+        self,
+        user1: discord.Member,
+        user2: discord.Member,
+        percentage: int,
+        has_image: bool = False,
+        verdict_message: str | None = None,
     ) -> discord.Embed:
         """Create the ship compatibility embed.
 
@@ -241,26 +401,20 @@ class ShipCog(commands.Cog):
             user2: Second user
             percentage: Compatibility percentage (0-100)
             has_image: If True, composite image will be attached (don't show duplicate info in embed)
+            verdict_message: Verdict to show; picked from the percentage tier when omitted
         """
         # Dynamic heart emoji based on percentage
         heart_emoji = self.get_heart_emoji(percentage)
-        
+        if verdict_message is None:
+            verdict_message = self.get_clever_message(percentage)
+
         embed = discord.Embed(
             title="💕 Ship Compatibility 💕",
             description=f"**{user1.display_name}** {heart_emoji} **{user2.display_name}**",
             color=self.get_embed_color(percentage),
         )
 
-        if has_image:
-            # When image is present, only show the verdict (image shows the percentage)
-            # Bold text with better spacing (no quote format)
-            verdict_message = self.get_clever_message(percentage)
-            embed.add_field(
-                name="💬 The Verdict",
-                value=f"**{verdict_message}**",
-                inline=False,
-            )
-        else:
+        if not has_image:
             # Fallback: show avatars and compatibility info if composite image failed
             embed.set_author(name=user1.display_name, icon_url=user1.display_avatar.url)
             embed.set_thumbnail(url=user2.display_avatar.url)
@@ -271,14 +425,14 @@ class ShipCog(commands.Cog):
                 value=f"**{percentage}%**\n{self.create_progress_bar(percentage)}",
                 inline=False,
             )
-            
-            # Bold text with better spacing (no quote format)
-            verdict_message = self.get_clever_message(percentage)
-            embed.add_field(
-                name="💬 The Verdict",
-                value=f"**{verdict_message}**",
-                inline=False,
-            )
+
+        # When image is present, only the verdict is shown (image shows the percentage)
+        # Bold text with better spacing (no quote format)
+        embed.add_field(
+            name="💬 The Verdict",
+            value=f"**{verdict_message}**",
+            inline=False,
+        )
 
         embed.set_footer(text="🔄 Use the command again for a new result!")
         return embed
@@ -325,11 +479,19 @@ class ShipCog(commands.Cog):
         try:
             percentage = self.generate_compatibility()
 
-            # Try to create composite image (PixxieBot-style layout)
-            image_file = await self.create_composite_image(user1, user2, percentage)
+            if user1.id == user2.id:
+                # Self-ship: one avatar, cached render, and a canned verdict
+                image_file = await self.create_self_ship_image(user1, percentage)
+                verdict_message = random.choice(SELF_SHIP_MESSAGES)
+            else:
+                # Try to create composite image (PixxieBot-style layout)
+                image_file = await self.create_composite_image(user1, user2, percentage)
+                verdict_message = None
             has_image = image_file is not None
 
-            embed = self.create_ship_embed(user1, user2, percentage, has_image=has_image)
+            embed = self.create_ship_embed(
+                user1, user2, percentage, has_image=has_image, verdict_message=verdict_message
+            )
             await self._send_ship_embed(source, embed=embed, image_file=image_file, is_slash=is_slash)
         except Exception as e:
             command_name = "ship" if not is_slash else "ship"
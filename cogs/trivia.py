@@ -12,6 +12,9 @@ The cog supports both traditional prefix commands (using discord.ext.commands) a
 Usage:
   Simply load this cog into your Discord bot to enable interactive trivia commands for your server.
 """
+import asyncio
+import time
+
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -19,9 +22,57 @@ from utils import astra_db_ops
 from utils import error_handler
 from games import trivia_game
 
+# Seconds a user's !mystats result is served from memory before re-querying the DB
+STATS_CACHE_TTL = 10
+STATS_CACHE_MAX = 1024  # users
+
+# Slash command choices, built once at import
+_ACTION_CHOICES = [
+    app_commands.Choice(name="Start", value="start"),
+    app_commands.Choice(name="Stop", value="stop"),
+    app_commands.Choice(name="Leaderboard", value="leaderboard"),
+]
+_SPEED_CHOICES = [
+    app_commands.Choice(name="Slow", value="slow"),
+    app_commands.Choice(name="Fast", value="fast"),
+]
+_CATEGORY_CHOICES = [
+    app_commands.Choice(name="History", value="History"),
+    app_commands.Choice(name="Science", value="Science"),
+    app_commands.Choice(name="Geography", value="Geography"),
+    app_commands.Choice(name="Sports", value="Sports"),
+    app_commands.Choice(name="Movies", value="Movies"),
+    app_commands.Choice(name="Animals", value="Animals"),
+    app_commands.Choice(name="Music", value="Music"),
+    app_commands.Choice(name="Video Games", value="Video Games"),
+    app_commands.Choice(name="Technology", value="Technology"),
+    app_commands.Choice(name="Literature", value="Literature"),
+    app_commands.Choice(name="Mythology", value="Mythology"),
+    app_commands.Choice(name="Food & Drink", value="Food & Drink"),
+    app_commands.Choice(name="Celebrities", value="Celebrities"),
+    app_commands.Choice(name="Riddles & Brain Teasers", value="Riddles"),
+    app_commands.Choice(name="Space & Astronomy", value="Space"),
+    app_commands.Choice(name="Cars & Automobiles", value="Cars"),
+    app_commands.Choice(name="Marvel & DC", value="Comics"),
+    app_commands.Choice(name="Holidays & Traditions", value="Holidays"),
+]
+
 class TriviaCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._stats_cache: dict[int, tuple[float, dict]] = {}  # user_id -> (fetched_at, stats)
+        self._lb_cache: tuple[int, str] | None = None  # (trivia_game.LEADERBOARD_VERSION, rendered)
+
+    async def _get_leaderboard(self) -> str:
+        """Return the rendered leaderboard, rebuilding it only after scores have changed."""
+        version = trivia_game.LEADERBOARD_VERSION
+        if self._lb_cache and self._lb_cache[0] == version:
+            return self._lb_cache[1]
+        leaderboard = await asyncio.to_thread(trivia_game.create_trivia_leaderboard)
+        # An empty board may just be a failed DB read; don't pin it until the next score
+        if leaderboard != trivia_game.EMPTY_LEADERBOARD:
+            self._lb_cache = (version, leaderboard)
+        return leaderboard
 
     @commands.command(name="trivia")
     async def trivia(self, ctx, action: str, category: str = None, speed: str = "slow"):
@@ -55,16 +106,32 @@ class TriviaCog(commands.Cog):
                 await trivia_game.stop_trivia(ctx, guild_id, self.bot)
 
             elif action.lower() == "leaderboard":
-                await ctx.send(trivia_game.create_trivia_leaderboard())
+                await ctx.send(await self._get_leaderboard())
         except Exception as e:
             await error_handler.handle_error(e, ctx, "trivia")
 
+    def _cache_stats(self, user_id: int, fetched_at: float, stats: dict):
+        # Entries stay in fetch order, so expired ones are always at the front
+        self._stats_cache.pop(user_id, None)
+        while self._stats_cache:
+            oldest = next(iter(self._stats_cache))
+            if fetched_at - self._stats_cache[oldest][0] < STATS_CACHE_TTL and len(self._stats_cache) < STATS_CACHE_MAX:
+                break
+            del self._stats_cache[oldest]
+        self._stats_cache[user_id] = (fetched_at, stats)
+
     @commands.command(name="mystats")
     async def my_stats(self, ctx):
         """View your personal trivia statistics (correct and wrong answers)."""
         try:
             user_id = ctx.author.id
-            stats = astra_db_ops.get_user_stats(user_id)
+            now = time.monotonic()
+            cached = self._stats_cache.get(user_id)
+            if cached and now - cached[0] < STATS_CACHE_TTL:
+                stats = cached[1]
+            else:
+                stats = await asyncio.to_thread(astra_db_ops.get_user_stats, user_id)
+                self._cache_stats(user_id, now, stats)
 
             await ctx.send(
                 f"📊 **{ctx.author.display_name}'s Trivia Stats:**\n✅ Correct Answers: {stats['correct']}\n❌ Wrong Answers: {stats['wrong']}"
@@ -78,35 +145,7 @@ class TriviaCog(commands.Cog):
         category="Select a trivia category (required for start, optional for stop)",
         speed="Choose the pace of the trivia game (slow or fast)"
     )
-    @app_commands.choices(action=[
-        app_commands.Choice(name="Start", value="start"),
-        app_commands.Choice(name="Stop", value="stop"),
-        app_commands.Choice(name="Leaderboard", value="leaderboard")
-    ])
-    @app_commands.choices(speed=[
-        app_commands.Choice(name="Slow", value="slow"),
-        app_commands.Choice(name="Fast", value="fast")
-    ])
-    @app_commands.choices(category=[
-        app_commands.Choice(name="History", value="History"),
-        app_commands.Choice(name="Science", value="Science"),
-        app_commands.Choice(name="Geography", value="Geography"),
-        app_commands.Choice(name="Sports", value="Sports"),
-        app_commands.Choice(name="Movies", value="Movies"),
-        app_commands.Choice(name="Animals", value="Animals"),
-        app_commands.Choice(name="Music", value="Music"),
-        app_commands.Choice(name="Video Games", value="Video Games"),
-        app_commands.Choice(name="Technology", value="Technology"),
-        app_commands.Choice(name="Literature", value="Literature"),
-        app_commands.Choice(name="Mythology", value="Mythology"),
-        app_commands.Choice(name="Food & Drink", value="Food & Drink"),
-        app_commands.Choice(name="Celebrities", value="Celebrities"),
-        app_commands.Choice(name="Riddles & Brain Teasers", value="Riddles"),
-        app_commands.Choice(name="Space & Astronomy", value="Space"),
-        app_commands.Choice(name="Cars & Automobiles", value="Cars"),
-        app_commands.Choice(name="Marvel & DC", value="Comics"),
-        app_commands.Choice(name="Holidays & Traditions", value="Holidays")
-    ])
+    @app_commands.choices(action=_ACTION_CHOICES, speed=_SPEED_CHOICES, category=_CATEGORY_CHOICES)
     async def slash_trivia(self, interaction: discord.Interaction, action: str, category: str = None, speed: str = "slow"):
         """
         Start, stop, or view trivia game leaderboard (slash command).
@@ -128,7 +167,7 @@ class TriviaCog(commands.Cog):
             elif action == "stop":
                 await trivia_game.stop_trivia(interaction, guild_id, self.bot, is_slash=True)
             elif action == "leaderboard":
-                await interaction.response.send_message(trivia_game.create_trivia_leaderboard())
+                await interaction.response.send_message(await self._get_leaderboard())
         except Exception as e:
             await error_handler.handle_error(e, interaction, "trivia")
 
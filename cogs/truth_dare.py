@@ -14,169 +14,382 @@ Features:
   - Clean embed presentation with question formatting
 """
 
+import asyncio
+import aiohttp
 import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
 import os
-import requests
 import random
+import re
+import time
+from collections import deque
+from typing import NamedTuple, Optional
 from dotenv import load_dotenv
 
 # Import existing utilities
 from utils import astra_db_ops
 from utils import openai_utils
 from utils import error_handler
+from utils.circuit_breaker import CircuitBreaker
 from configs import prompts
 
 load_dotenv()
 
+# Seconds a question source is given before the next fallback is raced alongside it.
+# The LLM is never hedged: it's slow by nature, and only chosen first for variety.
+HEDGE_DELAYS = {"api": 0.3, "database": 0.5, "llm": None}
+
+# Source priority orders, drawn with randomization: 75% API, 20% Database, 5% LLM first
+# (API is the final fallback otherwise)
+SOURCE_ORDERS = (("api", "database", "llm"), ("database", "llm", "api"), ("llm", "api"))
+SOURCE_ORDER_WEIGHTS = (75, 20, 5)
+
+# Truth or Dare API timeouts: fail fast on dead connections, then retry once after a short
+# jittered backoff so a transient blip doesn't fall through to a slower source
+API_TIMEOUT = aiohttp.ClientTimeout(total=3, connect=1, sock_read=2)
+API_ATTEMPTS = 2
+API_RETRY_BACKOFF = 0.1
+
+# Recently fetched API questions are kept per (type, rating) and occasionally re-served,
+# absorbing request bursts and covering brief API outages
+API_CACHE_TTL = 60
+API_CACHE_SIZE = 50
+API_CACHE_MIN_ENTRIES = 5
+API_CACHE_HIT_CHANCE = 0.3
+
+# Game types picked by the "Random" action
+RANDOM_ACTIONS = ("truth", "dare", "wyr", "nhie", "paranoia")
+
+# Requested types that get their own extra button next to Truth/Dare/Random
+CONTEXTUAL_ACTIONS = ("wyr", "nhie", "paranoia")
+
+# Truth or Dare Bot API endpoint per question type
+API_ENDPOINTS = {
+    "truth": "truth",
+    "dare": "dare",
+    "wyr": "wyr",
+    "nhie": "nhie",
+    "paranoia": "paranoia",
+}
+
+# LLM prompt per (question type, rating)
+LLM_PROMPTS = {
+    ("truth", "PG"): prompts.truth_pg_prompt,
+    ("truth", "PG13"): prompts.truth_pg13_prompt,
+    ("truth", "R"): prompts.truth_r_prompt,
+    ("dare", "PG"): prompts.dare_pg_prompt,
+    ("dare", "PG13"): prompts.dare_pg13_prompt,
+    ("dare", "R"): prompts.dare_r_prompt,
+    ("wyr", "PG"): prompts.wyr_pg_prompt,
+    ("wyr", "PG13"): prompts.wyr_pg13_prompt,
+    ("wyr", "R"): prompts.wyr_r_prompt,
+    ("nhie", "PG"): prompts.nhie_pg_prompt,
+    ("nhie", "PG13"): prompts.nhie_pg13_prompt,
+    ("nhie", "R"): prompts.nhie_r_prompt,
+    ("paranoia", "PG"): prompts.paranoia_pg_prompt,
+    ("paranoia", "PG13"): prompts.paranoia_pg13_prompt,
+    ("paranoia", "R"): prompts.paranoia_r_prompt,
+}
+
+QUESTION_ICONS = {
+    "truth": "🗣️",
+    "dare": "⚡",
+    "wyr": "🤔",
+    "nhie": "🙋",
+    "paranoia": "👁️",
+}
+
+# Consistent button colors for different actions
+BUTTON_STYLES = {
+    "truth": discord.ButtonStyle.success,      # Green
+    "dare": discord.ButtonStyle.danger,        # Red
+    "random": discord.ButtonStyle.primary,     # Blue
+    "wyr": discord.ButtonStyle.primary,        # Blue
+    "nhie": discord.ButtonStyle.primary,       # Blue
+    "paranoia": discord.ButtonStyle.primary,   # Blue
+}
+
+# Embed color per (question type, rating); other types use EMBED_COLOR_DEFAULT
+EMBED_COLORS = {
+    ("truth", "PG"): 0x00ff00,     # Green
+    ("truth", "PG13"): 0x00ff00,   # Green
+    ("truth", "R"): 0xff0000,      # Dark Red
+    ("dare", "PG"): 0xff6b6b,      # Light Red
+    ("dare", "PG13"): 0xff6b6b,    # Light Red
+    ("dare", "R"): 0xff0000,       # Dark Red
+}
+EMBED_COLOR_DEFAULT = 0x0099ff  # Blue for WYR, NHIE, and others
+
+
+class QuestionResult(NamedTuple):
+    """A question picked by TruthDareCog.get_question and where it came from."""
+    question: str
+    source: str  # "api", "database" or "llm"
+    creator: str
+    question_type: str
+    rating: str
+    question_id: Optional[str] = None
+    is_ai: bool = False
+
+class StaleResult(Exception):
+    """Raised by a question source that failed but can still serve an older result.
+
+    _guarded reports the failure to the source's circuit breaker and returns the result anyway.
+    """
+    def __init__(self, result: QuestionResult):
+        super().__init__("source failed; serving a cached result")
+        self.result = result
+
+
 class TruthDareCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.api_base_url = os.getenv("TRUTH_DARE_API_URL", "https://api.truthordarebot.xyz/v1")
+        self._session = None
+        self._breakers = {name: CircuitBreaker(f"tod-{name}") for name in HEDGE_DELAYS}
+        self._api_cache = {}  # (question_type, rating) -> deque of (fetched_at, question, question_id)
+        self._views = {}  # (current_action, rating, requested_type) -> TruthDareView
+
+    async def cog_load(self):
+        """Open a pooled HTTP session for the Truth or Dare API and register the persistent buttons."""
+        self.bot.add_dynamic_items(ActionButton)
+        self._session = aiohttp.ClientSession(
+            timeout=API_TIMEOUT,
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        )
+
+    async def cog_unload(self):
+        """Close the Truth or Dare API session and unregister the persistent buttons."""
+        self.bot.remove_dynamic_items(ActionButton)
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def get_api_question(self, question_type: str, rating: str = "PG13"):
+        """Get a question from the Truth or Dare Bot API, sometimes served from recent results."""
+        recent = self._api_cache.setdefault((question_type, rating), deque(maxlen=API_CACHE_SIZE))
+        now = time.monotonic()
+        while recent and now - recent[0][0] >= API_CACHE_TTL:
+            recent.popleft()
+        if len(recent) >= API_CACHE_MIN_ENTRIES and random.random() < API_CACHE_HIT_CHANCE:
+            # Oldest first, so a re-served question is the one players saw longest ago
+            _, question, question_id = recent.popleft()
+            return question, question_id
+
+        question, question_id = await self._request_api_question(question_type, rating)
+        if question:
+            recent.append((now, question, question_id))
+        return question, question_id
 
-    def get_api_question(self, question_type: str, rating: str = "PG13"):
-        """Get a question from the Truth or Dare Bot API."""
+    async def _request_api_question(self, question_type: str, rating: str):
+        """Fetch one question from the API; raises if the API is unreachable or returns an error."""
+        endpoint = API_ENDPOINTS.get(question_type)
+        if not endpoint:
+            return None, None
+
+        url = f"{self.api_base_url}/{endpoint}?rating={rating}"
         try:
-            # Map our types to API endpoints
-            endpoint_map = {
-                "truth": "truth",
-                "dare": "dare", 
-                "wyr": "wyr",
-                "nhie": "nhie",
-                "paranoia": "paranoia"
-            }
-            
-            endpoint = endpoint_map.get(question_type)
-            if not endpoint:
-                return None, None
-                
-            url = f"{self.api_base_url}/{endpoint}?rating={rating}"
-                
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                question = data.get("question", "")
-                question_id = data.get("id", "API")
-                logging.debug(f"API {question_type} response: {question}")
-                return question, question_id
+            for attempt in range(API_ATTEMPTS):
+                try:
+                    async with self._session.get(url) as response:
+                        response.raise_for_status()
+                        data = await response.json(content_type=None)
+                    break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == API_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(random.uniform(0, API_RETRY_BACKOFF * 2 ** attempt))
         except Exception as e:
             logging.error(f"Error getting API question: {e}")
-        return None, None
+            raise
+        question = data.get("question", "")
+        question_id = data.get("id", "API")
+        logging.debug(f"API {question_type} response: {question}")
+        return question, question_id
 
     async def get_llm_question(self, question_type: str, rating: str = "PG13"):
-        """Get a question from LLM using existing prompts."""
+        """Get a question from LLM using existing prompts (raises if the LLM call fails)."""
+        prompt = LLM_PROMPTS.get((question_type, rating))
+        if not prompt:
+            return None, None
         try:
-            # Map to prompt variables
-            prompt_map = {
-                ("truth", "PG"): prompts.truth_pg_prompt,
-                ("truth", "PG13"): prompts.truth_pg13_prompt,
-                ("truth", "R"): prompts.truth_r_prompt,
-                ("dare", "PG"): prompts.dare_pg_prompt,
-                ("dare", "PG13"): prompts.dare_pg13_prompt,
-                ("dare", "R"): prompts.dare_r_prompt,
-                ("wyr", "PG"): prompts.wyr_pg_prompt,
-                ("wyr", "PG13"): prompts.wyr_pg13_prompt,
-                ("wyr", "R"): prompts.wyr_r_prompt,
-                ("nhie", "PG"): prompts.nhie_pg_prompt,
-                ("nhie", "PG13"): prompts.nhie_pg13_prompt,
-                ("nhie", "R"): prompts.nhie_r_prompt,
-                ("paranoia", "PG"): prompts.paranoia_pg_prompt,
-                ("paranoia", "PG13"): prompts.paranoia_pg13_prompt,
-                ("paranoia", "R"): prompts.paranoia_r_prompt,
-            }
-            
-            prompt = prompt_map.get((question_type, rating))
-            if prompt:
-                question = await openai_utils.generate_openai_response(prompt)
-                logging.debug(f"LLM {question_type} response: {question}")
-                return question, "AI"
+            question = await openai_utils.generate_openai_response(prompt)
         except Exception as e:
             logging.error(f"Error getting LLM question: {e}")
-        return None, None
+            raise
+        logging.debug(f"LLM {question_type} response: {question}")
+        return question, "AI"
+
+    async def get_database_question(self, question_type: str, rating: str = "PG13"):
+        """Get a question from the database, along with its submitter, id and stored source.
 
-    def get_database_question(self, question_type: str, rating: str = "PG13"):
-        """Get a question from the database."""
+        Returns Nones when no question matches; raises if the database can't be read.
+        """
         try:
-            question_data = astra_db_ops.get_random_truth_dare_question(question_type, rating)
-            if question_data:
-                question = question_data.get("question", "")
-                submitted_by = question_data.get("submitted_by", "Unknown")
-                logging.debug(f"Database {question_type} response: {question}")
-                return question, submitted_by, question_data.get("_id")
+            question_data = await asyncio.to_thread(
+                astra_db_ops.get_random_truth_dare_question, question_type, rating
+            )
         except Exception as e:
             logging.error(f"Error getting database question: {e}")
-        return None, None, None
+            raise
+        if question_data:
+            question = question_data.get("question", "")
+            submitted_by = question_data.get("submitted_by", "Unknown")
+            logging.debug(f"Database {question_type} response: {question}")
+            return question, submitted_by, question_data.get("_id"), question_data.get("source")
+        return None, None, None, None
 
-    async def get_question(self, question_type: str, rating: str = "PG13", guild_id: str = None, 
-                          guild_name: str = None, user_id: str = None, username: str = None, 
-                          command_name: str = "tod"):
-        """Get a question using the priority: API -> Database -> LLM with randomization."""
-        # Add randomization: 75% API, 20% Database, 5% LLM
-        rand = random.random()
-        
-        if rand < 0.75:
-            # Try API first (75% chance)
-            question, question_id = self.get_api_question(question_type, rating)
-            if question:
-                return question, "api", "API", question_type, rating, question_id
-        
-        if rand < 0.95:
-            # Try database (20% chance)
-            question_data = self.get_database_question(question_type, rating)
-            if question_data and question_data[0]: # Check if question_data is not None and has a question
-                question, submitted_by, question_id = question_data
-                # Check if this is an AI-generated question by looking at the source
-                is_ai_question = self.is_ai_generated_question(question_id)
-                return question, "database", submitted_by, question_type, rating, question_id, is_ai_question
-        
-        # Fallback to LLM (5% chance or if others fail)
+    async def _fetch_from_api(self, question_type: str, rating: str):
+        try:
+            question, question_id = await self.get_api_question(question_type, rating)
+        except Exception as e:
+            recent = self._api_cache.get((question_type, rating))
+            if not recent:
+                raise
+            # API is failing; a recently seen question beats falling through to a slower source
+            _, question, question_id = recent.popleft()
+            raise StaleResult(QuestionResult(question, "api", "API", question_type, rating, question_id)) from e
+        if question:
+            return QuestionResult(question, "api", "API", question_type, rating, question_id)
+        return None
+
+    async def _fetch_from_database(self, question_type: str, rating: str):
+        question_data = await self.get_database_question(question_type, rating)
+        if question_data and question_data[0]: # Check if question_data is not None and has a question
+            question, submitted_by, question_id, stored_source = question_data
+            # AI-generated questions are stored with source "llm"
+            is_ai_question = stored_source == "llm"
+            return QuestionResult(question, "database", submitted_by, question_type, rating, question_id, is_ai_question)
+        return None
+
+    async def _fetch_from_llm(self, question_type: str, rating: str):
         question, creator_id = await self.get_llm_question(question_type, rating)
         if question:
-            # Store AI-generated question in database for future use
-            question_id = self.save_ai_question(question, question_type, rating, guild_id, 
+            return QuestionResult(question, "llm", creator_id, question_type, rating, is_ai=True)
+        return None
+
+    async def _guarded(self, name: str, factory, force: bool = False):
+        """Run a source fetch and report its outcome to that source's circuit breaker.
+
+        Only exceptions (errors, timeouts) count as failures; a source that has no question
+        for this type/rating is healthy. Returns None without calling the source if its
+        breaker refuses (unless forced).
+        """
+        breaker = self._breakers[name]
+        if not breaker.allow() and not force:
+            return None
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            breaker.abandon()
+            raise
+        except StaleResult as e:
+            breaker.record(False)
+            return e.result
+        except Exception:
+            breaker.record(False)
+            raise
+        breaker.record(True)
+        return result
+
+    async def _hedged_fetch(self, sources):
+        """Return the first non-empty result from (name, coroutine factory) sources in priority order.
+
+        Each source gets a head start of HEDGE_DELAYS[name] seconds before the next one is
+        launched alongside it (immediately if everything in flight has failed). Once a result
+        arrives the remaining requests are cancelled, so a slow source costs at most its hedge
+        delay instead of its full timeout. When several finish together, the higher priority wins.
+        """
+        loop = asyncio.get_running_loop()
+        priority = {}
+        pending = set()
+        queued = list(sources)
+        next_launch_at = loop.time()
+        try:
+            while queued or pending:
+                if queued and (not pending or loop.time() >= next_launch_at):
+                    name, factory = queued.pop(0)
+                    task = asyncio.create_task(factory())
+                    priority[task] = len(priority)
+                    pending.add(task)
+                    hedge_delay = HEDGE_DELAYS.get(name)
+                    next_launch_at = loop.time() + hedge_delay if hedge_delay is not None else float("inf")
+                    continue
+
+                timeout = None
+                if queued and next_launch_at != float("inf"):
+                    timeout = max(0, next_launch_at - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=priority.get):
+                    if not task.cancelled() and task.exception() is None and task.result():
+                        return task.result()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_question(self, question_type: str, rating: str = "PG13", guild_id: str = None, 
+                          guild_name: str = None, user_id: str = None, username: str = None, 
+                          command_name: str = "tod") -> Optional[QuestionResult]:
+        """Get a question using the priority: API -> Database -> LLM with randomization.
+
+        Sources are raced with hedging (see _hedged_fetch) rather than tried one timeout at a time.
+        Returns None if no source produced a question.
+        """
+        fetchers = {
+            "api": lambda: self._fetch_from_api(question_type, rating),
+            "database": lambda: self._fetch_from_database(question_type, rating),
+            "llm": lambda: self._fetch_from_llm(question_type, rating),
+        }
+        order = random.choices(SOURCE_ORDERS, weights=SOURCE_ORDER_WEIGHTS)[0]
+        sources = [(name, fetchers[name]) for name in order]
+
+        # Skip sources whose breaker is open; if every one is, try them all anyway
+        available = [source for source in sources if self._breakers[source[0]].state != "open"]
+        force = not available
+        sources = [(name, lambda name=name, factory=factory: self._guarded(name, factory, force))
+                   for name, factory in (available or sources)]
+
+        result = await self._hedged_fetch(sources)
+        if not result:
+            return None
+
+        if result.source == "llm":
+            # Store AI-generated question in database for future use (only the winning one)
+            question_id = await self.save_ai_question(result.question, result.question_type, result.rating, guild_id, 
                                                 guild_name, user_id, username, command_name)
-            return question, "llm", creator_id, question_type, rating, question_id, True
-        
-        # If all fail, try API as final fallback
-        question, question_id = self.get_api_question(question_type, rating)
-        if question:
-            return question, "api", "API", question_type, rating, question_id, False
-            
-        return None, None, None, None, None, None, False
+            return result._replace(question_id=question_id)
+        return result
+
+    def get_view(self, current_action: str, rating: str, requested_type=None):
+        """Return the shared button view for this action/rating; button clicks are routed by custom_id."""
+        key = (current_action, rating, requested_type)
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = TruthDareView(current_action, rating, requested_type)
+        return view
 
     def get_embed_color(self, question_type: str, rating: str):
         """Get appropriate embed color based on question type and rating."""
-        if question_type == "truth":
-            return 0x00ff00 if rating == "PG" else 0x00ff00 if rating == "PG13" else 0xff0000  # Green for PG, Light Red for PG13, Dark Red for R
-        elif question_type == "dare":
-            return 0xff6b6b if rating in ["PG", "PG13"] else 0xff0000  # Light Red for PG/PG13, Dark Red for R
-        else:
-            return 0x0099ff  # Blue for WYR, NHIE, and others
+        return EMBED_COLORS.get((question_type, rating), EMBED_COLOR_DEFAULT)
 
     def get_question_icon(self, question_type: str):
         """Get appropriate icon based on question type."""
-        icon_map = {
-            "truth": "🗣️",
-            "dare": "⚡", 
-            "wyr": "🤔",
-            "nhie": "🙋",
-            "paranoia": "👁️"
-        }
-        return icon_map.get(question_type, "🎯")
+        return QUESTION_ICONS.get(question_type, "🎯")
 
     def get_rating_icon(self, rating: str):
         """Get appropriate icon based on rating."""
         return "👨‍👩‍👧‍👦" if rating in ["PG", "PG13"] else "🔞"
 
-    def save_ai_question(self, question: str, question_type: str, rating: str, 
+    async def save_ai_question(self, question: str, question_type: str, rating: str, 
                         guild_id: str = None, guild_name: str = None, user_id: str = None,
                         username: str = None, command_name: str = "tod"):
         """Save AI-generated question to database and return question ID."""
         try:
             # Save to database and get the actual database ID
-            question_id = astra_db_ops.save_truth_dare_question(
+            question_id = await asyncio.to_thread(
+                astra_db_ops.save_truth_dare_question,
                 guild_id=guild_id or "global",
                 user_id=user_id or "ai_system",
                 question=question,
@@ -199,12 +412,12 @@ class TruthDareCog(commands.Cog):
             logging.error(f"Error saving AI question: {e}")
             return None
 
-    def is_ai_generated_question(self, question_id: str):
+    async def is_ai_generated_question(self, question_id: str):
         """Check if a question is AI-generated by looking at its source in the database."""
         try:
             if not question_id:
                 return False
-            question_data = astra_db_ops.get_truth_dare_question_by_id(question_id)
+            question_data = await asyncio.to_thread(astra_db_ops.get_truth_dare_question_by_id, question_id)
             if question_data:
                 return question_data.get("source") == "llm"
             return False
@@ -212,6 +425,48 @@ class TruthDareCog(commands.Cog):
             logging.error(f"Error checking if question is AI-generated: {e}")
             return False
 
+    async def _send_question(self, interaction: discord.Interaction, action: str, rating: str, requested_type=None):
+        """Fetch a question and post it as a follow-up with the game buttons and feedback reactions."""
+        # Get question
+        guild_id = str(interaction.guild_id) if interaction.guild_id else None
+        guild_name = interaction.guild.name if interaction.guild else None
+        user_id = str(interaction.user.id)
+        username = interaction.user.display_name
+        result = await self.get_question(action, rating, guild_id, guild_name, user_id, username, "tod")
+        if not result or not result.question:
+            await interaction.followup.send("❌ Sorry, I couldn't generate a question right now. Try again later!")
+            return
+        
+        # Update last_used for database questions
+        if result.question_id and result.source != "api":
+            await asyncio.to_thread(astra_db_ops.update_question_last_used, result.question_id)
+        
+        # Create clean embed
+        embed = discord.Embed(
+            description=f"### **{result.question}**",
+            color=self.get_embed_color(result.question_type, result.rating)
+        )
+        embed.set_author(name=f"Requested by {interaction.user.display_name}")
+        
+        # Add metadata in footer
+        embed.set_footer(text=f"Type: {result.question_type.upper()} | Rating: {result.rating} | ID: {result.question_id if result.question_id else 'N/A'}")
+        
+        view = self.get_view(action, rating, requested_type)
+        
+        message = await interaction.followup.send(embed=embed, view=view)
+        
+        # Add emoji reactions only for questions that need feedback
+        if result.question_id and result.source != "api":  # Don't add reactions for TOD API questions
+            # Reactions and the metadata save (for reaction tracking) are independent
+            await asyncio.gather(
+                message.add_reaction("👍"),
+                message.add_reaction("👎"),
+                asyncio.to_thread(
+                    astra_db_ops.add_message_metadata,
+                    result.question_id, str(message.id), str(interaction.guild_id), str(interaction.channel_id)
+                ),
+            )
+
     @app_commands.command(name="tod", description="Start a Truth or Dare game")
     @app_commands.choices(action=[
         app_commands.Choice(name="Truth", value="truth"),
@@ -239,51 +494,9 @@ class TruthDareCog(commands.Cog):
             
             # Handle random action
             if action == "random":
-                action = random.choice(["truth", "dare", "wyr", "nhie", "paranoia"])
-            
-            # Get question
-            guild_id = str(interaction.guild_id) if interaction.guild_id else None
-            guild_name = interaction.guild.name if interaction.guild else None
-            user_id = str(interaction.user.id)
-            username = interaction.user.display_name
-            result = await self.get_question(action, category, guild_id, guild_name, user_id, username, "tod")
-            if len(result) < 3:
-                await interaction.followup.send("❌ Sorry, I couldn't generate a question right now. Try again later!")
-                return
-                
-            question, source, creator, question_type, rating = result[:5]
-            question_id = result[5] if len(result) > 5 else None
-            is_ai_question = result[6] if len(result) > 6 else False
-            
-            if not question:
-                await interaction.followup.send("❌ Sorry, I couldn't generate a question right now. Try again later!")
-                return
-            
-            # Update last_used for database questions
-            if question_id and source != "api":
-                astra_db_ops.update_question_last_used(question_id)
-            
-            # Create clean embed
-            embed = discord.Embed(
-                description=f"### **{question}**",
-                color=self.get_embed_color(question_type, rating)
-            )
-            embed.set_author(name=f"Requested by {interaction.user.display_name}")
-            
-            # Add metadata in footer
-            embed.set_footer(text=f"Type: {question_type.upper()} | Rating: {rating} | ID: {question_id if question_id else 'N/A'}")
-            
-            # Create view with improved buttons
-            view = TruthDareView(action, category, self, requested_type=action)
-            
-            message = await interaction.followup.send(embed=embed, view=view)
+                action = random.choice(RANDOM_ACTIONS)
             
-            # Add emoji reactions only for questions that need feedback
-            if question_id and source != "api":  # Don't add reactions for TOD API questions
-                await message.add_reaction("👍")
-                await message.add_reaction("👎")
-                # Save message metadata for reaction tracking
-                astra_db_ops.add_message_metadata(question_id, str(message.id), str(interaction.guild_id), str(interaction.channel_id))
+            await self._send_question(interaction, action, category, requested_type=action)
             
         except Exception as e:
             await error_handler.handle_error(e, interaction, "tod")
@@ -316,7 +529,8 @@ class TruthDareCog(commands.Cog):
                 return
             
             # Save to database
-            question_id = astra_db_ops.save_truth_dare_question(
+            question_id = await asyncio.to_thread(
+                astra_db_ops.save_truth_dare_question,
                 guild_id=str(interaction.guild.id),
                 user_id=str(interaction.user.id),
                 question=question,
@@ -343,48 +557,47 @@ class TruthDareCog(commands.Cog):
             await error_handler.handle_error(e, interaction, "tod-submit")
 
 class TruthDareView(discord.ui.View):
-    def __init__(self, current_action: str, current_rating: str, cog_instance, requested_type=None):
+    def __init__(self, current_action: str, current_rating: str, requested_type=None):
         super().__init__(timeout=None)  # No timeout - buttons work indefinitely
-        self.current_action = current_action
-        self.current_rating = current_rating
-        self.cog = cog_instance
-        self.requested_type = requested_type
         
         # Add action buttons
-        self.add_item(ActionButton("Truth", "truth", current_action, current_rating, cog_instance, requested_type))
-        self.add_item(ActionButton("Dare", "dare", current_action, current_rating, cog_instance, requested_type))
-        self.add_item(ActionButton("Random", "random", current_action, current_rating, cog_instance, requested_type))
+        self.add_item(ActionButton("truth", current_rating, requested_type, "Truth", current_action))
+        self.add_item(ActionButton("dare", current_rating, requested_type, "Dare", current_action))
+        self.add_item(ActionButton("random", current_rating, requested_type, "Random", current_action))
         
         # Add contextual button if user specifically requested WYR/NHIE/Paranoia
-        if requested_type in ["wyr", "nhie", "paranoia"]:
-            self.add_item(ActionButton(requested_type.upper(), requested_type, current_action, current_rating, cog_instance, requested_type))
-
-class ActionButton(discord.ui.Button):
-    def __init__(self, label: str, action: str, current_action: str, current_rating: str, cog_instance, requested_type=None):
-        # Use consistent colors for different actions
-        style_map = {
-            "truth": discord.ButtonStyle.success,      # Green
-            "dare": discord.ButtonStyle.danger,        # Red
-            "random": discord.ButtonStyle.primary,     # Blue
-            "wyr": discord.ButtonStyle.primary,        # Blue
-            "nhie": discord.ButtonStyle.primary,       # Blue
-            "paranoia": discord.ButtonStyle.primary,   # Blue
-        }
-        
+        if requested_type in CONTEXTUAL_ACTIONS:
+            self.add_item(ActionButton(requested_type, current_rating, requested_type, requested_type.upper(), current_action))
+
+class ActionButton(discord.ui.DynamicItem[discord.ui.Button], template=r"tod:(?P<action>[a-z]+):(?P<rating>[A-Z0-9]+):(?P<requested_type>[a-z]*)"):
+    """
+    Truth or Dare button whose state lives in its custom_id (tod:<action>:<rating>:<requested_type>).
+    
+    Registered once with bot.add_dynamic_items, so clicks are routed by custom_id after restarts
+    and no per-message view has to be kept around.
+    """
+    def __init__(self, action: str, current_rating: str, requested_type=None, label: str = None, current_action: str = None):
         # Get base style
-        base_style = style_map.get(action, discord.ButtonStyle.primary)
+        base_style = BUTTON_STYLES.get(action, discord.ButtonStyle.primary)
+        label = label or action.upper()
         
         # If this is the current action, add an emoji prefix to indicate it's active
         if action == current_action:
             label = f"✓ {label}"  # Add checkmark to show it's the current action
         
-        super().__init__(label=label, style=base_style)
+        super().__init__(discord.ui.Button(
+            label=label,
+            style=base_style,
+            custom_id=f"tod:{action}:{current_rating}:{requested_type or ''}"
+        ))
         self.action = action
-        self.current_action = current_action
         self.current_rating = current_rating
-        self.cog = cog_instance
         self.requested_type = requested_type
 
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str]):
+        return cls(match["action"], match["rating"], match["requested_type"] or None)
+
     async def callback(self, interaction: discord.Interaction):
         try:
             # Immediately acknowledge the interaction to prevent timeout
@@ -397,52 +610,12 @@ class ActionButton(discord.ui.Button):
                 pass  # Ignore if original message can't be edited
             
             # Handle random action
-            if self.action == "random":
-                self.action = random.choice(["truth", "dare", "wyr", "nhie", "paranoia"])
-            
-            # Get question
-            guild_id = str(interaction.guild_id) if interaction.guild_id else None
-            guild_name = interaction.guild.name if interaction.guild else None
-            user_id = str(interaction.user.id)
-            username = interaction.user.display_name
-            result = await self.cog.get_question(self.action, self.current_rating, guild_id, guild_name, user_id, username, "tod")
-            if len(result) < 3:
-                await interaction.followup.send("❌ Sorry, I couldn't generate a question right now. Try again later!")
-                return
-                
-            question, source, creator, question_type, rating = result[:5]
-            question_id = result[5] if len(result) > 5 else None
-            is_ai_question = result[6] if len(result) > 6 else False
-            
-            if not question:
-                await interaction.followup.send("❌ Sorry, I couldn't generate a question right now. Try again later!")
-                return
-            
-            # Update last_used for database questions
-            if question_id and source != "api":
-                astra_db_ops.update_question_last_used(question_id)
-            
-            # Create clean embed
-            embed = discord.Embed(
-                description=f"### **{question}**",
-                color=self.cog.get_embed_color(question_type, rating)
-            )
-            embed.set_author(name=f"Requested by {interaction.user.display_name}")
-            
-            # Add metadata in footer
-            embed.set_footer(text=f"Type: {question_type.upper()} | Rating: {rating} | ID: {question_id if question_id else 'N/A'}")
-            
-            # Create new view
-            view = TruthDareView(self.action, self.current_rating, self.cog, requested_type=self.requested_type)
-            
-            message = await interaction.followup.send(embed=embed, view=view)
+            action = self.action
+            if action == "random":
+                action = random.choice(RANDOM_ACTIONS)
             
-            # Add emoji reactions only for questions that need feedback
-            if question_id and source != "api":  # Don't add reactions for TOD API questions
-                await message.add_reaction("👍")
-                await message.add_reaction("👎")
-                # Save message metadata for reaction tracking
-                astra_db_ops.add_message_metadata(question_id, str(message.id), str(interaction.guild_id), str(interaction.channel_id))
+            cog = interaction.client.get_cog("TruthDareCog")
+            await cog._send_question(interaction, action, self.current_rating, requested_type=self.requested_type)
             
         except Exception as e:
             await error_handler.handle_error(e, interaction, "tod")
@@ -460,7 +633,9 @@ class FeedbackButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         try:
             # Record feedback
-            success = astra_db_ops.record_question_feedback(self.question_id, self.feedback_type)
+            success = await asyncio.to_thread(
+                astra_db_ops.record_question_feedback, self.question_id, self.feedback_type
+            )
             
             if success:
                 if self.feedback_type == "positive":
@@ -5,16 +5,167 @@ This module defines a utility cog for the Discord bot, providing common helper c
 It includes ping, help, bot status (samosa), and listservers.
 """
 
+import asyncio
 import base64
+import datetime
 import logging
+import math
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 
-from utils import astra_db_ops
+from utils.astra_db_ops import (
+    save_bot_status_channel,
+    bulk_clear_status_channels,
+    load_bot_status_channels,
+    update_guild_custom_bot_icon,
+    list_registered_servers
+)
 from utils import error_handler
 
 
+def create_help_embed():
+    """Create a comprehensive help embed with all bot commands organized by category."""
+    embed = discord.Embed(
+        title="🤖 SamosaBot - Command Help",
+        description="A feature-rich Discord bot with games, jokes, facts, and more!",
+        color=discord.Color.blue()
+    )
+    
+    # Games Section
+    embed.add_field(
+        name="🎉 Games",
+        value=(
+            "`/trivia start <category>` - Start interactive trivia game\n"
+            "`/trivia stop` - Stop current trivia game\n"
+            "`/trivia leaderboard` - View top players\n"
+            "`!trivia start <category> [fast/slow]` - Start trivia (prefix)\n"
+            "`!trivia stop` - Stop trivia (prefix)\n"
+            "`!mystats` - View your trivia stats\n"
+            "`/tod` - Truth or Dare game (with buttons)\n"
+            "`/tod-submit` - Submit your own questions"
+        ),
+        inline=False
+    )
+    
+    # Entertainment Section
+    embed.add_field(
+        name="🤣 Entertainment",
+        value=(
+            "`/joke <category>` - Get jokes (dad, insult, general, dark, spooky)\n"
+            "`!joke <category>` - Get joke (prefix)\n"
+            "`/joke-submit` - Submit your own joke\n"
+            "`/fact` - Get random general fact\n"
+            "`/fact animals` - Get random animal fact\n"
+            "`!fact` - Get fact (prefix)\n"
+            "`/fact-submit` - Submit your own fact\n"
+            "`/ship <user1> [user2]` - Check compatibility between two users\n"
+            "`!ship @user1 [@user2]` - Ship compatibility (prefix)\n"
+            "`/pickup` - Get a pickup line\n"
+            "`!pickup` - Get pickup line (prefix)\n"
+            "`/roast @user` - Generate playful roast\n"
+            "`!roast @user` - Roast user (prefix)\n"
+            "`!compliment @user` - Generate compliment\n"
+            "`!fortune` - Get AI-generated fortune"
+        ),
+        inline=False
+    )
+    
+    # Community Section
+    embed.add_field(
+        name="💬 Community",
+        value=(
+            "`/confession <message>` - Submit an anonymous confession\n"
+            "`/confession-setup` - Configure confession settings (admin only)\n"
+            "`/confession-view <id>` - View a confession by ID (admin only)\n"
+            "`/confession-history` - List confession history with pagination (admin only)\n"
+            "\n*Confessions are analyzed for sentiment and may be auto-approved or queued for review*"
+        ),
+        inline=False
+    )
+    
+    # AI & Questions Section
+    embed.add_field(
+        name="🤖 AI & Questions",
+        value=(
+            "`/ask <question>` - Ask AI anything or generate images\n"
+            "`!asksamosa <question>` - Ask AI (prefix)\n"
+            "`/qotd` - Get Question of the Day\n"
+            "`!qotd` - Get QOTD (prefix)\n"
+            "`!setqotdchannel <channel>` - Set QOTD channel (admin)\n"
+            "`!startqotd` - Start daily QOTD schedule (admin)"
+        ),
+        inline=False
+    )
+    
+    # Utility Section
+    embed.add_field(
+        name="🔧 Utility",
+        value=(
+            "`!ping` - Check bot response time\n"
+            "`!help` - Show this help message\n"
+            "`/help` - Show help (slash command)"
+        ),
+        inline=False
+    )
+
+    # Admin Section
+    embed.add_field(
+        name="⚙️ Admin",
+        value=(
+            "`/samosa botstatus [channel]` - Send bot status updates every 30 min (admin)\n"
+            "`/samosa disable` - Disable bot status updates (admin)\n"
+            "`/samosa seticon <image>` - Set guild-specific bot avatar — PNG/JPG/WEBP, max 8 MB (Manage Server)\n"
+            "`/samosa removeicon` - Revert bot to global default avatar (Manage Server)"
+        ),
+        inline=False
+    )
+    
+    # Clan Events Section
+    embed.add_field(
+        name="🏆 Clan Events",
+        value=(
+            "`/event list` - See all events and their activities & points\n"
+            "`/event leaderboard [member] [event]` - Scores and clan rankings\n"
+            "**Mod only:**\n"
+            "`/events setup` - Configure clans, channels, and mod roles\n"
+            "`/events settings` - View current configuration\n"
+            "`/event create` - Create a new event (multi-step)\n"
+            "`/event start/stop <event>` - Start or end an event\n"
+            "`/event award @member <event> <activity>` - Award points\n"
+            "`/event adjust @member <event> <pts> <reason>` - Adjust points with audit trail\n"
+            "`/event setbanner <event> <image>` - Upload a PNG/JPG/WEBP banner image"
+        ),
+        inline=False
+    )
+
+    # Additional Info
+    embed.add_field(
+        name="💡 Tips",
+        value=(
+            "• Use **slash commands** (`/`) for the best experience\n"
+            "• Many commands use **interactive buttons** for easy navigation\n"
+            "• Rate content with 👍/👎 reactions to help improve the bot\n"
+            "• Submit your own questions, jokes, and facts to grow the community!"
+        ),
+        inline=False
+    )
+    
+    embed.set_footer(text="Use !help or /help anytime to see this message")
+    
+    return embed
+
+
+# Bot status updates go out on the hour and half hour (UTC) rather than drifting with uptime
+STATUS_TIMES = [datetime.time(hour=h, minute=m) for h in range(24) for m in (0, 30)]
+# Each guild's send is delayed by (guild_id % STATUS_STAGGER_SECONDS) seconds to spread the burst
+STATUS_STAGGER_SECONDS = 30
+
+
+# The help content is static, so it's built once at import and shared by !help and /help
+HELP_EMBED = create_help_embed()
+
+
 class UtilsCog(commands.Cog):
     """
     A Cog that contains utility commands for the bot.
@@ -29,6 +180,9 @@ class UtilsCog(commands.Cog):
 
     _ALLOWED_ICON_EXTS = (".png", ".jpg", ".jpeg", ".webp")
     _MAX_ICON_BYTES = 8 * 1024 * 1024  # 8 MB
+    _MESSAGE_CHUNK_LIMIT = 1900  # Leaves headroom under Discord's 2000-character limit
+    _STATUS_MESSAGE = "✅ **SamosaBot is up and running!** 🔥"
+    _STATUS_SEND_CONCURRENCY = 10  # Parallel status messages per tick, to stay clear of rate limits
 
     samosa_group = app_commands.Group(name="samosa", description="Bot administration commands")
 
@@ -40,161 +194,72 @@ class UtilsCog(commands.Cog):
             bot (commands.Bot): The Discord bot instance.
         """
         self.bot = bot
+        # int guild_id -> int status channel id, loaded in cog_load and kept in sync by _set_status_channel
+        self._status_channels = {}
 
-    @tasks.loop(minutes=30)
-    async def bot_status_task(self):
-        """Send periodic bot status updates."""
-        bot_status_channels = astra_db_ops.load_bot_status_channels()
-        for guild_id, channel_id in bot_status_channels.items():
-            if channel_id is None:
-                logging.warning(f"No channel set for guild {guild_id}. Skipping status update.")
-                continue
-            try:
-                channel = self.bot.get_channel(int(channel_id))
-                if channel:
-                    await channel.send("✅ **SamosaBot is up and running!** 🔥")
-                else:
-                    logging.warning(f"Could not find channel {channel_id} for guild {guild_id}. Removing entry.")
-                    astra_db_ops.save_bot_status_channel(guild_id, None)
-            except Exception as e:
-                logging.error(f"Error sending bot status update for guild {guild_id}: {e}")
+    async def _set_status_channel(self, guild_id, channel_id):
+        """Persist a guild's status channel (None disables updates) and mirror it in memory."""
+        await asyncio.to_thread(save_bot_status_channel, guild_id, channel_id)
+        if channel_id is None:
+            self._status_channels.pop(guild_id, None)
+        else:
+            self._status_channels[guild_id] = channel_id
 
-    async def cog_load(self):
-        """Start bot status task if channels are stored."""
-        bot_status_channels = astra_db_ops.load_bot_status_channels()
-        if bot_status_channels and not self.bot_status_task.is_running():
+    async def _apply_status_config(self, guild_id, channel_id):
+        """Enable status updates in channel_id (or disable them if None) and return the reply text."""
+        await self._set_status_channel(guild_id, channel_id)
+        if channel_id is None:
+            # No guild left to update: stop waking up until one is configured again
+            if not self._status_channels and self.bot_status_task.is_running():
+                self.bot_status_task.cancel()
+            return "✅ Bot status updates have been disabled for this server."
+        if not self.bot_status_task.is_running():
             self.bot_status_task.start()
+        return f"✅ Bot status updates will be sent to <#{channel_id}> every 30 minutes."
 
-    def create_help_embed(self):
-        """Create a comprehensive help embed with all bot commands organized by category."""
-        embed = discord.Embed(
-            title="🤖 SamosaBot - Command Help",
-            description="A feature-rich Discord bot with games, jokes, facts, and more!",
-            color=discord.Color.blue()
-        )
-        
-        # Games Section
-        embed.add_field(
-            name="🎉 Games",
-            value=(
-                "`/trivia start <category>` - Start interactive trivia game\n"
-                "`/trivia stop` - Stop current trivia game\n"
-                "`/trivia leaderboard` - View top players\n"
-                "`!trivia start <category> [fast/slow]` - Start trivia (prefix)\n"
-                "`!trivia stop` - Stop trivia (prefix)\n"
-                "`!mystats` - View your trivia stats\n"
-                "`/tod` - Truth or Dare game (with buttons)\n"
-                "`/tod-submit` - Submit your own questions"
-            ),
-            inline=False
-        )
-        
-        # Entertainment Section
-        embed.add_field(
-            name="🤣 Entertainment",
-            value=(
-                "`/joke <category>` - Get jokes (dad, insult, general, dark, spooky)\n"
-                "`!joke <category>` - Get joke (prefix)\n"
-                "`/joke-submit` - Submit your own joke\n"
-                "`/fact` - Get random general fact\n"
-                "`/fact animals` - Get random animal fact\n"
-                "`!fact` - Get fact (prefix)\n"
-                "`/fact-submit` - Submit your own fact\n"
-                "`/ship <user1> [user2]` - Check compatibility between two users\n"
-                "`!ship @user1 [@user2]` - Ship compatibility (prefix)\n"
-                "`/pickup` - Get a pickup line\n"
-                "`!pickup` - Get pickup line (prefix)\n"
-                "`/roast @user` - Generate playful roast\n"
-                "`!roast @user` - Roast user (prefix)\n"
-                "`!compliment @user` - Generate compliment\n"
-                "`!fortune` - Get AI-generated fortune"
-            ),
-            inline=False
-        )
-        
-        # Community Section
-        embed.add_field(
-            name="💬 Community",
-            value=(
-                "`/confession <message>` - Submit an anonymous confession\n"
-                "`/confession-setup` - Configure confession settings (admin only)\n"
-                "`/confession-view <id>` - View a confession by ID (admin only)\n"
-                "`/confession-history` - List confession history with pagination (admin only)\n"
-                "\n*Confessions are analyzed for sentiment and may be auto-approved or queued for review*"
-            ),
-            inline=False
-        )
-        
-        # AI & Questions Section
-        embed.add_field(
-            name="🤖 AI & Questions",
-            value=(
-                "`/ask <question>` - Ask AI anything or generate images\n"
-                "`!asksamosa <question>` - Ask AI (prefix)\n"
-                "`/qotd` - Get Question of the Day\n"
-                "`!qotd` - Get QOTD (prefix)\n"
-                "`!setqotdchannel <channel>` - Set QOTD channel (admin)\n"
-                "`!startqotd` - Start daily QOTD schedule (admin)"
-            ),
-            inline=False
-        )
-        
-        # Utility Section
-        embed.add_field(
-            name="🔧 Utility",
-            value=(
-                "`!ping` - Check bot response time\n"
-                "`!help` - Show this help message\n"
-                "`/help` - Show help (slash command)"
-            ),
-            inline=False
-        )
+    async def _send_status(self, guild_id, channel_id, semaphore):
+        """Send the status message to one guild; return False if its channel no longer exists."""
+        guild = self.bot.get_guild(guild_id)
+        channel = guild.get_channel(channel_id) if guild else None
+        if not channel:
+            logging.warning(f"Could not find channel {channel_id} for guild {guild_id}. Removing entry.")
+            return False
+        try:
+            await asyncio.sleep(guild_id % STATUS_STAGGER_SECONDS)
+            async with semaphore:
+                await channel.send(self._STATUS_MESSAGE)
+        except Exception as e:
+            logging.error(f"Error sending bot status update for guild {guild_id}: {e}")
+        return True
 
-        # Admin Section
-        embed.add_field(
-            name="⚙️ Admin",
-            value=(
-                "`/samosa botstatus [channel]` - Send bot status updates every 30 min (admin)\n"
-                "`/samosa disable` - Disable bot status updates (admin)\n"
-                "`/samosa seticon <image>` - Set guild-specific bot avatar — PNG/JPG/WEBP, max 8 MB (Manage Server)\n"
-                "`/samosa removeicon` - Revert bot to global default avatar (Manage Server)"
-            ),
-            inline=False
-        )
-        
-        # Clan Events Section
-        embed.add_field(
-            name="🏆 Clan Events",
-            value=(
-                "`/event list` - See all events and their activities & points\n"
-                "`/event leaderboard [member] [event]` - Scores and clan rankings\n"
-                "**Mod only:**\n"
-                "`/events setup` - Configure clans, channels, and mod roles\n"
-                "`/events settings` - View current configuration\n"
-                "`/event create` - Create a new event (multi-step)\n"
-                "`/event start/stop <event>` - Start or end an event\n"
-                "`/event award @member <event> <activity>` - Award points\n"
-                "`/event adjust @member <event> <pts> <reason>` - Adjust points with audit trail\n"
-                "`/event setbanner <event> <image>` - Upload a PNG/JPG/WEBP banner image"
-            ),
-            inline=False
+    @tasks.loop(time=STATUS_TIMES)
+    async def bot_status_task(self):
+        """Send periodic bot status updates to all configured channels concurrently."""
+        if not self._status_channels:
+            return
+        semaphore = asyncio.Semaphore(self._STATUS_SEND_CONCURRENCY)
+        guild_ids = list(self._status_channels)
+        results = await asyncio.gather(
+            *(self._send_status(guild_id, self._status_channels[guild_id], semaphore) for guild_id in guild_ids)
         )
+        # Drop guilds whose channel is gone, with one DB write once all sends are done
+        stale = [guild_id for guild_id, found in zip(guild_ids, results) if not found]
+        if stale:
+            await asyncio.to_thread(bulk_clear_status_channels, stale)
+            for guild_id in stale:
+                self._status_channels.pop(guild_id, None)
 
-        # Additional Info
-        embed.add_field(
-            name="💡 Tips",
-            value=(
-                "• Use **slash commands** (`/`) for the best experience\n"
-                "• Many commands use **interactive buttons** for easy navigation\n"
-                "• Rate content with 👍/👎 reactions to help improve the bot\n"
-                "• Submit your own questions, jokes, and facts to grow the community!"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="Use !help or /help anytime to see this message")
-        
-        return embed
+    async def cog_load(self):
+        """Load the stored status channels and start the bot status task if there are any."""
+        # The only status-channel read; the task and the samosa commands work off this copy
+        stored = await asyncio.to_thread(load_bot_status_channels)
+        self._status_channels = {
+            int(guild_id): int(channel_id)
+            for guild_id, channel_id in stored.items()
+            if channel_id is not None
+        }
+        if self._status_channels and not self.bot_status_task.is_running():
+            self.bot_status_task.start()
 
     @commands.command(name="help", description="Display all available commands organized by category.")
     async def help_command(self, ctx):
@@ -207,8 +272,7 @@ class UtilsCog(commands.Cog):
         Args:
             ctx (commands.Context): The context of the command invocation.
         """
-        embed = self.create_help_embed()
-        await ctx.send(embed=embed)
+        await ctx.send(embed=HELP_EMBED)
 
     @app_commands.command(name="help", description="Display all available commands organized by category.")
     async def help_slash(self, interaction: discord.Interaction):
@@ -217,8 +281,7 @@ class UtilsCog(commands.Cog):
         
         Shows commands organized by category with usage examples.
         """
-        embed = self.create_help_embed()
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=HELP_EMBED)
 
     @commands.command(name="ping", description="Check the bot's latency.")
     async def ping(self, ctx):
@@ -231,78 +294,90 @@ class UtilsCog(commands.Cog):
         Args:
             ctx (commands.Context): The context of the command invocation.
         """
-        latency = round(self.bot.latency * 1000)
-        await ctx.send(f"Pong! Latency: {latency}ms")
+        latency = self.bot.latency
+        if math.isnan(latency):
+            # No heartbeat acknowledged yet
+            await ctx.send("Pong! Latency not available yet, the bot is still connecting.")
+            return
+        await ctx.send(f"Pong! Latency: {int(latency * 1000 + 0.5)}ms")
+
+    async def _samosa_botstatus(self, ctx, channel):
+        channel_id = channel.id if channel else ctx.channel.id
+        await ctx.send(await self._apply_status_config(ctx.guild.id, channel_id))
+
+    async def _samosa_disable(self, ctx, channel):
+        await ctx.send(await self._apply_status_config(ctx.guild.id, None))
+
+    async def _samosa_seticon(self, ctx, channel):
+        if not ctx.author.guild_permissions.manage_guild:
+            await ctx.send("❌ You need **Manage Server** permission to change the bot's icon.")
+            return
+        if not ctx.message.attachments:
+            await ctx.send("❌ Please attach a PNG, JPG, JPEG, or WEBP image to your message (max 8 MB).")
+            return
+        attachment = ctx.message.attachments[0]
+        if not any(attachment.filename.lower().endswith(ext) for ext in self._ALLOWED_ICON_EXTS):
+            await ctx.send("❌ Unsupported file type. Use PNG, JPG, JPEG, or WEBP.")
+            return
+        if attachment.size > self._MAX_ICON_BYTES:
+            await ctx.send(f"❌ Image too large ({attachment.size // (1024 * 1024)} MB). Max is 8 MB.")
+            return
+        try:
+            image_bytes = await attachment.read()
+            ext = attachment.filename.rsplit('.', 1)[-1].lower()
+            mime = {
+                'png': 'image/png', 'jpg': 'image/jpeg',
+                'jpeg': 'image/jpeg', 'webp': 'image/webp',
+            }.get(ext, 'image/png')
+            b64 = base64.b64encode(image_bytes).decode('utf-8')
+            await ctx.bot.http.edit_member(
+                str(ctx.guild.id), '@me', avatar=f"data:{mime};base64,{b64}"
+            )
+            await asyncio.to_thread(update_guild_custom_bot_icon, str(ctx.guild.id), True)
+            await ctx.send("✅ Guild avatar updated! It may take a moment to propagate.")
+        except Exception as e:
+            await error_handler.handle_error(e, ctx, "samosa seticon")
+
+    async def _samosa_removeicon(self, ctx, channel):
+        if not ctx.author.guild_permissions.manage_guild:
+            await ctx.send("❌ You need **Manage Server** permission.")
+            return
+        try:
+            await ctx.bot.http.edit_member(str(ctx.guild.id), '@me', avatar=None)
+            await asyncio.to_thread(update_guild_custom_bot_icon, str(ctx.guild.id), False)
+            await ctx.send("✅ Guild avatar removed. Bot will show its global default avatar.")
+        except Exception as e:
+            await error_handler.handle_error(e, ctx, "samosa removeicon")
+
+    # !samosa <action> handlers
+    _SAMOSA_ACTIONS = {
+        "botstatus": _samosa_botstatus,
+        "disable": _samosa_disable,
+        "seticon": _samosa_seticon,
+        "removeicon": _samosa_removeicon,
+    }
 
     @commands.command(name="samosa", description="Configure bot status updates or guild avatar")
     async def samosa(self, ctx, action: str, channel: discord.TextChannel = None):
         """Enable bot status updates, disable them, or set/remove the guild avatar."""
-        if action.lower() == "botstatus":
-            channel_id = channel.id if channel else ctx.channel.id
-            guild_id = ctx.guild.id
-            astra_db_ops.save_bot_status_channel(guild_id, channel_id)
-            await ctx.send(f"✅ Bot status updates will be sent to <#{channel_id}> every 30 minutes.")
-            if not self.bot_status_task.is_running():
-                self.bot_status_task.start()
-        elif action.lower() == "disable":
-            guild_id = ctx.guild.id
-            astra_db_ops.save_bot_status_channel(guild_id, None)
-            await ctx.send("✅ Bot status updates have been disabled for this server.")
-        elif action.lower() == "seticon":
-            if not ctx.author.guild_permissions.manage_guild:
-                await ctx.send("❌ You need **Manage Server** permission to change the bot's icon.")
-                return
-            if not ctx.message.attachments:
-                await ctx.send("❌ Please attach a PNG, JPG, JPEG, or WEBP image to your message (max 8 MB).")
-                return
-            attachment = ctx.message.attachments[0]
-            if not any(attachment.filename.lower().endswith(ext) for ext in self._ALLOWED_ICON_EXTS):
-                await ctx.send("❌ Unsupported file type. Use PNG, JPG, JPEG, or WEBP.")
-                return
-            if attachment.size > self._MAX_ICON_BYTES:
-                await ctx.send(f"❌ Image too large ({attachment.size // (1024 * 1024)} MB). Max is 8 MB.")
-                return
-            try:
-                image_bytes = await attachment.read()
-                ext = attachment.filename.rsplit('.', 1)[-1].lower()
-                mime = {
-                    'png': 'image/png', 'jpg': 'image/jpeg',
-                    'jpeg': 'image/jpeg', 'webp': 'image/webp',
-                }.get(ext, 'image/png')
-                b64 = base64.b64encode(image_bytes).decode('utf-8')
-                await ctx.bot.http.edit_member(
-                    str(ctx.guild.id), '@me', avatar=f"data:{mime};base64,{b64}"
-                )
-                astra_db_ops.update_guild_custom_bot_icon(str(ctx.guild.id), True)
-                await ctx.send("✅ Guild avatar updated! It may take a moment to propagate.")
-            except Exception as e:
-                await error_handler.handle_error(e, ctx, "samosa seticon")
-        elif action.lower() == "removeicon":
-            if not ctx.author.guild_permissions.manage_guild:
-                await ctx.send("❌ You need **Manage Server** permission.")
-                return
-            try:
-                await ctx.bot.http.edit_member(str(ctx.guild.id), '@me', avatar=None)
-                astra_db_ops.update_guild_custom_bot_icon(str(ctx.guild.id), False)
-                await ctx.send("✅ Guild avatar removed. Bot will show its global default avatar.")
-            except Exception as e:
-                await error_handler.handle_error(e, ctx, "samosa removeicon")
+        handler = self._SAMOSA_ACTIONS.get(action.lower())
+        if handler is None:
+            await ctx.send(f"❌ Unknown action. Use one of: {', '.join(self._SAMOSA_ACTIONS)}.")
+            return
+        await handler(self, ctx, channel)
 
     @samosa_group.command(name="botstatus", description="Send bot status updates to a channel every 30 minutes")
     @app_commands.describe(channel="Channel for status updates (defaults to current channel)")
     async def samosa_botstatus(self, interaction: discord.Interaction, channel: discord.TextChannel = None):
         channel_id = channel.id if channel else interaction.channel.id
-        guild_id = interaction.guild_id
-        astra_db_ops.save_bot_status_channel(guild_id, channel_id)
-        await interaction.response.send_message(f"✅ Bot status updates will be sent to <#{channel_id}> every 30 minutes.")
-        if not self.bot_status_task.is_running():
-            self.bot_status_task.start()
+        # Acknowledge first so a slow DB write can't expire the interaction
+        await interaction.response.defer(ephemeral=True)
+        await interaction.followup.send(await self._apply_status_config(interaction.guild_id, channel_id), ephemeral=True)
 
     @samosa_group.command(name="disable", description="Disable bot status updates for this server")
     async def samosa_disable(self, interaction: discord.Interaction):
-        guild_id = interaction.guild_id
-        astra_db_ops.save_bot_status_channel(guild_id, None)
-        await interaction.response.send_message("✅ Bot status updates have been disabled for this server.")
+        await interaction.response.defer(ephemeral=True)
+        await interaction.followup.send(await self._apply_status_config(interaction.guild_id, None), ephemeral=True)
 
     @samosa_group.command(name="seticon", description="Set a guild-specific avatar for the bot (Manage Server)")
     @app_commands.describe(image="PNG, JPG, or WEBP image — recommended 512×512 or 1024×1024 px, max 8 MB")
@@ -334,7 +409,7 @@ class UtilsCog(commands.Cog):
             await interaction.client.http.edit_member(
                 str(interaction.guild_id), '@me', avatar=f"data:{mime};base64,{b64}"
             )
-            astra_db_ops.update_guild_custom_bot_icon(str(interaction.guild_id), True)
+            await asyncio.to_thread(update_guild_custom_bot_icon, str(interaction.guild_id), True)
             embed = discord.Embed(
                 title="✅ Guild Avatar Updated",
                 description=(
@@ -362,7 +437,7 @@ class UtilsCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         try:
             await interaction.client.http.edit_member(str(interaction.guild_id), '@me', avatar=None)
-            astra_db_ops.update_guild_custom_bot_icon(str(interaction.guild_id), False)
+            await asyncio.to_thread(update_guild_custom_bot_icon, str(interaction.guild_id), False)
             await interaction.followup.send(
                 "✅ Guild avatar removed. The bot will now show its global default avatar in this server.",
                 ephemeral=True,
@@ -373,16 +448,24 @@ class UtilsCog(commands.Cog):
     @commands.command(name="listservers", description="List servers where the bot is registered")
     async def list_servers(self, ctx):
         """List all servers (guilds) where the bot is registered with installation dates."""
-        servers = astra_db_ops.list_registered_servers()
-        if servers:
-            response_lines = ["📜 **Registered Servers:**"]
-            for server in servers:
-                response_lines.append(
-                    f"**{server['guild_name']}** (ID: {server['guild_id']}), Installed: {server['installed_at']}"
-                )
-            await ctx.send("\n".join(response_lines))
-        else:
+        servers = await asyncio.to_thread(list_registered_servers)
+        if not servers:
             await ctx.send("No registered servers found.")
+            return
+        lines = [
+            f"**{server['guild_name']}** (ID: {server['guild_id']}), Installed: {server['installed_at']}"
+            for server in servers
+        ]
+        # Send in chunks that stay under Discord's 2000-character message limit, joining each chunk once
+        chunk = ["📜 **Registered Servers:**"]
+        length = len(chunk[0])
+        for line in lines:
+            if length + 1 + len(line) > self._MESSAGE_CHUNK_LIMIT:
+                await ctx.send("\n".join(chunk))
+                chunk, length = [], -1
+            chunk.append(line)
+            length += 1 + len(line)
+        await ctx.send("\n".join(chunk))
 
 async def setup(bot):
     """
@@ -11,77 +11,481 @@ It manages the verification process, including:
 """
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 import logging
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Dict, Set, List, Optional, Tuple
 from utils import astra_db_ops, openai_utils
 import asyncio
+import functools
+import re
+import time
+
+# Guild verification settings are read on every join/message/reaction; cache them briefly
+SETTINGS_CACHE_TTL = 60  # seconds
+SETTINGS_CACHE_MAX = 512  # guilds
+
+# Verification attempt logs are queued and written in batches by a background task
+LOG_QUEUE_MAX = 10_000
+LOG_BATCH_SIZE = 50
+LOG_FLUSH_INTERVAL = 1.0  # seconds
+
+# Verification question sets are generated ahead of time so joins don't wait on OpenAI
+QUESTION_POOL_MAX = 64
+QUESTION_POOL_LOW = 16  # Refill whenever fewer sets than this are ready
+QUESTION_REFILL_CONCURRENCY = 4
+QUESTION_POOL_WAIT = 2.0  # seconds a join waits on an empty pool before generating directly
+QUESTION_REFILL_BACKOFF = 30  # seconds to wait after a refill round that generated nothing, doubling...
+QUESTION_REFILL_BACKOFF_MAX = 600  # ...up to this
+
+# Each member's verification events are handled one at a time; different members run concurrently
+VERIFICATION_HANDLER_CONCURRENCY = 20
+
+# Admin review requests are coalesced per channel: up to ADMIN_REVIEW_BATCH members per message
+# (one embed and one row of approve/deny buttons each), sent ADMIN_REVIEW_DEBOUNCE seconds after the first
+ADMIN_REVIEW_BATCH = 5
+ADMIN_REVIEW_DEBOUNCE = 2.0  # seconds
+ADMIN_REVIEW_CUSTOM_ID = r"(?P<action>approve|deny)_(?P<user_id>[0-9]+)"
+
+# How long the setup wizard trusts an admin permission check for the same user
+ADMIN_CHECK_TTL = 30  # seconds
+ADMIN_ONLY_MESSAGE = "❌ You need administrator permissions to use this command."
+
+# Sessions still at the question stage after this long are treated as abandoned and cleaned up
+VERIFICATION_SESSION_TTL = 3600  # seconds
+ABANDONABLE_STAGES = ("verification", "answering", "failed")
+# Sessions at any stage are cleaned up once this old, matching the verification channel's stated lifetime
+VERIFICATION_MAX_AGE = 24 * 3600  # seconds
+
+@dataclass(slots=True)
+class RoleSelectionState:
+    """Role-selection message sent to a member and the roles they've picked so far."""
+    message_id: int
+    selected_roles: Set[int] = field(default_factory=set)
+    timestamp: datetime = field(default_factory=discord.utils.utcnow)
+
+
+@dataclass(frozen=True, slots=True)
+class WizardStep:
+    """One page of the verification setup wizard."""
+    description: str
+    buttons: Tuple[str, ...]  # SetupWizardView button attribute names, in display order
+
+
+@dataclass(frozen=True, slots=True)
+class WizardPicker:
+    """A setup wizard select menu for choosing an existing role or text channel."""
+    setting_key: str
+    label: str  # e.g. "Guest role", used in the select placeholder
+    role_type: Optional[str] = None  # _sort_roles type for role pickers, None for channel pickers
+
+
+def index_active_verifications(verifications: Dict[Tuple[int, int], dict]) -> Dict[int, Dict[int, float]]:
+    """Turn load_all_active_verifications() output into a user_id -> {guild_id: started_at} index."""
+    index: Dict[int, Dict[int, float]] = {}
+    for (user_id, guild_id), doc in verifications.items():
+        index.setdefault(user_id, {})[guild_id] = doc.get("timestamp") or time.time()
+    return index
+
+
+def normalize_answer(text: str) -> str:
+    """Normalize a verification answer for comparison."""
+    return str(text).casefold().strip()
+
+
+def accepted_answers(question: dict) -> List[str]:
+    """Normalized answers accepted for a question ("answer" may be a string or a list of aliases)."""
+    answers = question.get("accepted_answers")
+    if answers is None:
+        answer = question.get("answer", "")
+        answers = [normalize_answer(a) for a in (answer if isinstance(answer, list) else [answer])]
+    return answers
+
+
+def prepare_questions(questions: list) -> list:
+    """Store each question's normalized answers once, so responses don't re-normalize them."""
+    for question in questions:
+        if isinstance(question, dict):
+            question["accepted_answers"] = accepted_answers(question)
+    return questions
+
 
 class VerificationCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        # Load active verifications from database on startup
-        self.active_verifications = astra_db_ops.load_all_active_verifications()
+        # Active verifications are loaded from the database in cog_load. Only which guilds each user
+        # is verifying in (and since when) and their channels are kept in memory; the session data
+        # is read from the database.
+        self.active_verifications: Dict[int, Dict[int, float]] = {}
+        self._session_channels: Dict[Tuple[int, int], int] = {}  # (user_id, guild_id) -> channel_id
+        self._verification_channels: Set[int] = set()  # Channels on_message needs to look at
         self.rules_messages: Dict[int, int] = {}  # guild_id -> message_id
-        self.role_selections: Dict[int, Dict] = {}  # user_id -> selection data
+        self.role_selections: Dict[int, RoleSelectionState] = {}  # user_id -> selection state
         
         # Pagination state
         self.pagination_state: Dict[int, Dict] = {}  # interaction_id -> pagination data
         self.ROLES_PER_PAGE = 25
         
+        # Guild settings cache
+        self._settings_cache: Dict[int, Tuple[float, dict]] = {}  # guild_id -> (fetched_at, settings)
+        
+        # Per-guild name -> role/channel indexes, rebuilt lazily after any role/channel change
+        self._role_index: Dict[int, Dict[str, discord.Role]] = {}
+        self._channel_index: Dict[int, Dict[str, discord.abc.GuildChannel]] = {}
+        
+        # Verification attempt log queue
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX)
+        self._log_batch: List[dict] = []  # Batch being collected by _log_worker, flushed on unload
+        self._log_task = None
+        
+        # Pre-generated verification question sets
+        self._question_pool: asyncio.Queue = asyncio.Queue(maxsize=QUESTION_POOL_MAX)
+        self._question_refill = asyncio.Event()
+        self._question_task = None
+        self._inflight_questions: Dict[int, asyncio.Future] = {}  # guild_id -> direct generation shared by joiners
+        self._pending_deletes: Set[asyncio.Task] = set()  # Scheduled verification channel deletions
+        
+        # Per-member handler serialization: user_id -> [lock, number of handlers holding or waiting on it]
+        self._user_locks: Dict[int, list] = {}
+        self._handler_slots = asyncio.Semaphore(VERIFICATION_HANDLER_CONCURRENCY)
+        
+        # Persistent button views, built once in cog_load and reused for every member
+        self._start_view = None
+        self._rules_view = None
+        self._done_view = None
+        
+        # Admin review requests waiting to be sent, and the edits to already-sent batches
+        self._review_buffer: Dict[int, list] = {}  # admin channel_id -> [(member, review embed)]
+        self._review_flushes: Dict[int, asyncio.Task] = {}  # admin channel_id -> pending flush
+        self._review_locks: Dict[int, asyncio.Lock] = {}  # review message_id -> lock
+        
         logging.info("VerificationCog initialized")
 
     async def cog_load(self):
         """Initialize the cog."""
         logging.info("Loading VerificationCog...")
-        # Reload active verifications from database
-        self.active_verifications = astra_db_ops.load_all_active_verifications()
+        # Load active verifications from database
+        self._index_sessions(await asyncio.to_thread(astra_db_ops.load_all_active_verifications))
+        self._log_task = asyncio.create_task(self._log_worker())
+        self.sweep_abandoned_verifications.start()
+        # Register persistent views so the buttons keep working after a bot restart
+        self._start_view = StartVerificationView(self)
+        self._rules_view = AcknowledgeRulesView(self)
+        self._done_view = DoneSelectingRolesView(self)
+        for view in (self._start_view, self._rules_view, self._done_view):
+            self.bot.add_view(view)
+        self.bot.add_dynamic_items(AdminReviewButton)
 
     async def cog_unload(self):
         """Clean up when the cog is unloaded."""
         logging.info("Unloading VerificationCog...")
         # No need to save active verifications as they are already in the database
-
-    def get_verification_data(self, user_id: int, guild_id: int) -> Optional[Dict]:
+        self.sweep_abandoned_verifications.cancel()
+        for view in (self._start_view, self._rules_view, self._done_view):
+            if view:
+                view.stop()
+        self.bot.remove_dynamic_items(AdminReviewButton)
+        if self._question_task:
+            self._question_task.cancel()
+        # Send any admin reviews still waiting out the debounce
+        for task in self._review_flushes.values():
+            task.cancel()
+        for channel_id in list(self._review_buffer):
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                await self._flush_admin_reviews(channel)
+        # Stop the log writer and flush whatever it hadn't written yet
+        if self._log_task:
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+        pending, self._log_batch = self._log_batch, []
+        while not self._log_queue.empty():
+            pending.append(self._log_queue.get_nowait())
+        await asyncio.to_thread(astra_db_ops.log_verification_attempts_batch, pending)
+
+    def log_attempt(self, **fields):
+        """Queue a verification attempt log entry (see astra_db_ops.log_verification_attempt for fields)."""
+        try:
+            self._log_queue.put_nowait(astra_db_ops.build_verification_attempt(**fields))
+        except asyncio.QueueFull:
+            logging.warning(f"Verification log queue full, dropping {fields.get('stage')} entry")
+
+    async def _log_worker(self):
+        """Write queued verification logs in batches of up to LOG_BATCH_SIZE every LOG_FLUSH_INTERVAL."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._log_batch = [await self._log_queue.get()]
+            deadline = loop.time() + LOG_FLUSH_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._log_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._log_batch = []
+            await asyncio.to_thread(astra_db_ops.log_verification_attempts_batch, batch)
+
+    def _index_sessions(self, verifications: Dict[Tuple[int, int], dict]):
+        """Rebuild the in-memory session indexes from load_all_active_verifications() output."""
+        self.active_verifications = index_active_verifications(verifications)
+        self._session_channels = {
+            key: doc["channel_id"] for key, doc in verifications.items() if doc.get("channel_id")
+        }
+        self._verification_channels = set(self._session_channels.values())
+
+    async def run_for_user(self, user_id: int, handler, *args):
+        """Run a verification handler after any earlier one for the same member has finished."""
+        entry = self._user_locks.get(user_id)
+        if entry is None:
+            entry = self._user_locks[user_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0], self._handler_slots:
+                return await handler(*args)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._user_locks[user_id]
+
+    def has_verification(self, user_id: int, guild_id: int) -> bool:
+        """Whether the member has a verification session in progress in this guild."""
+        return guild_id in self.active_verifications.get(user_id, ())
+
+    async def get_verification_data(self, user_id: int, guild_id: int) -> Optional[Dict]:
         """Get verification data for a user from the database."""
-        return astra_db_ops.get_active_verification(user_id, guild_id)
+        return await asyncio.to_thread(astra_db_ops.get_active_verification, user_id, guild_id)
 
-    def save_verification_data(self, user_id: int, guild_id: int, channel_id: int, data: Dict):
+    async def save_verification_data(self, user_id: int, guild_id: int, channel_id: int, data: Dict):
         """Save verification data to the database."""
-        astra_db_ops.save_active_verification(user_id, guild_id, channel_id, data)
-        # Update local cache
-        if user_id not in self.active_verifications:
-            self.active_verifications[user_id] = {}
-        self.active_verifications[user_id][guild_id] = data
-
-    def delete_verification_data(self, user_id: int, guild_id: int):
+        await asyncio.to_thread(astra_db_ops.save_active_verification, user_id, guild_id, channel_id, data)
+        # Update local index
+        self.active_verifications.setdefault(user_id, {})[guild_id] = data.get("timestamp") or time.time()
+        self._session_channels[(user_id, guild_id)] = channel_id
+        self._verification_channels.add(channel_id)
+
+    async def update_verification_data(self, user_id: int, guild_id: int, verification_data: Dict, **fields):
+        """Apply session changes (stage, progress) to verification_data and persist just those fields."""
+        verification_data.update(fields)
+        await asyncio.to_thread(astra_db_ops.update_active_verification, user_id, guild_id, fields)
+
+    async def delete_verification_data(self, user_id: int, guild_id: int):
         """Delete verification data from the database."""
-        astra_db_ops.delete_active_verification(user_id, guild_id)
-        # Update local cache
-        if user_id in self.active_verifications:
-            if guild_id in self.active_verifications[user_id]:
-                del self.active_verifications[user_id][guild_id]
-            if not self.active_verifications[user_id]:
+        self.forget_verification(user_id, guild_id)
+        await asyncio.to_thread(astra_db_ops.delete_active_verification, user_id, guild_id)
+
+    def forget_verification(self, user_id: int, guild_id: int):
+        """Stop tracking a verification session in memory (messages from the user are no longer handled)."""
+        channel_id = self._session_channels.pop((user_id, guild_id), None)
+        self._verification_channels.discard(channel_id)
+        guilds = self.active_verifications.get(user_id)
+        if guilds is not None:
+            guilds.pop(guild_id, None)
+            if not guilds:
                 del self.active_verifications[user_id]
+                self.role_selections.pop(user_id, None)
+
+    @tasks.loop(minutes=5)
+    async def sweep_abandoned_verifications(self):
+        """
+        Delete sessions (and their channels) stuck at the question stage for VERIFICATION_SESSION_TTL,
+        or at any stage for VERIFICATION_MAX_AGE.
+        """
+        now = time.time()
+        for user_id, guilds in list(self.active_verifications.items()):
+            for guild_id, started_at in list(guilds.items()):
+                if now - started_at < VERIFICATION_SESSION_TTL:
+                    continue
+                try:
+                    data = await asyncio.to_thread(astra_db_ops.get_active_verification, user_id, guild_id)
+                    if (data and data.get("stage") not in ABANDONABLE_STAGES
+                            and now - (data.get("timestamp") or now) < VERIFICATION_MAX_AGE):
+                        # Further along (e.g. waiting for admin review): check again after another TTL
+                        guilds[guild_id] = now
+                        continue
+                    if data:
+                        channel = self.bot.get_channel(data.get("channel_id"))
+                        if channel:
+                            await channel.delete(reason="Verification session abandoned")
+                        await asyncio.to_thread(astra_db_ops.delete_active_verification, user_id, guild_id)
+                    self.forget_verification(user_id, guild_id)
+                    self.log_attempt(
+                        user_id=user_id,
+                        username=data.get("username") if data else None,
+                        guild_id=guild_id,
+                        stage="verification_expired",
+                        success=False
+                    )
+                except Exception as e:
+                    logging.error(f"Error cleaning up abandoned verification for {user_id} in {guild_id}: {e}")
+
+    @sweep_abandoned_verifications.before_loop
+    async def before_sweep(self):
+        await self.bot.wait_until_ready()
+
+    async def get_guild_settings(self, guild_id: int) -> dict:
+        """Get verification settings for a guild (cached for SETTINGS_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        cached = self._settings_cache.get(guild_id)
+        if cached and now - cached[0] < SETTINGS_CACHE_TTL:
+            return cached[1]
+        settings = await asyncio.to_thread(astra_db_ops.get_guild_verification_settings, guild_id)
+        if settings is not None:  # Don't cache lookup errors
+            self._settings_cache.pop(guild_id, None)
+            if len(self._settings_cache) >= SETTINGS_CACHE_MAX:
+                # Drop the oldest entry
+                self._settings_cache.pop(next(iter(self._settings_cache)))
+            self._settings_cache[guild_id] = (now, settings)
+        return settings
+
+    def invalidate_guild_settings(self, guild_id: int):
+        """Forget cached settings for a guild after they've been changed."""
+        self._settings_cache.pop(guild_id, None)
+
+    def _get_role(self, guild: discord.Guild, name: str) -> Optional[discord.Role]:
+        """Look up a guild role by name (first match, like discord.utils.get)."""
+        index = self._role_index.get(guild.id)
+        if index is None:
+            index = self._role_index[guild.id] = {}
+            for role in guild.roles:
+                index.setdefault(role.name, role)
+        return index.get(name)
+
+    def _get_channel(self, guild: discord.Guild, name: str) -> Optional[discord.abc.GuildChannel]:
+        """Look up a guild channel by name (first match, like discord.utils.get)."""
+        index = self._channel_index.get(guild.id)
+        if index is None:
+            index = self._channel_index[guild.id] = {}
+            for channel in guild.channels:
+                index.setdefault(channel.name, channel)
+        return index.get(name)
 
-    def get_guild_settings(self, guild_id: int) -> dict:
-        """Get verification settings for a guild."""
-        return astra_db_ops.get_guild_verification_settings(guild_id)
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self._role_index.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._role_index.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._role_index.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self._channel_index.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._channel_index.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self._channel_index.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._role_index.pop(guild.id, None)
+        self._channel_index.pop(guild.id, None)
+
+    async def _generate_questions(self):
+        """Generate a question set with OpenAI (raises if generation fails)."""
+        questions = await openai_utils.generate_openai_response("Generate 3 verification questions", intent="verification")
+        return prepare_questions(questions)
+
+    async def _question_refiller(self):
+        """Keep at least QUESTION_POOL_LOW question sets ready, generating a few at a time."""
+        backoff = QUESTION_REFILL_BACKOFF
+        while True:
+            if self._question_pool.qsize() >= QUESTION_POOL_LOW:
+                self._question_refill.clear()
+                await self._question_refill.wait()
+                continue
+            count = min(QUESTION_REFILL_CONCURRENCY, QUESTION_POOL_MAX - self._question_pool.qsize())
+            results = await asyncio.gather(
+                *(self._generate_questions() for _ in range(count)), return_exceptions=True
+            )
+            added = 0
+            for questions in results:
+                if isinstance(questions, Exception):
+                    logging.error(f"Error pre-generating verification questions: {questions}")
+                elif not self._question_pool.full():
+                    self._question_pool.put_nowait(questions)
+                    added += 1
+            if added:
+                backoff = QUESTION_REFILL_BACKOFF
+            else:
+                # OpenAI is failing; don't keep paying for calls, and let joins fall back individually
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, QUESTION_REFILL_BACKOFF_MAX)
+
+    async def take_verification_questions(self, guild_id: int):
+        """Get a pre-generated question set, generating one directly if none arrives in time."""
+        # The pool is only filled once some guild with verification enabled has a join
+        if self._question_task is None:
+            self._question_task = asyncio.create_task(self._question_refiller())
+        self._question_refill.set()
+        try:
+            return await asyncio.wait_for(self._question_pool.get(), timeout=QUESTION_POOL_WAIT)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            return await self._generate_questions_once(guild_id)
+        except Exception as e:
+            logging.warning(f"Verification question generation failed, using default questions: {e}")
+            return prepare_questions([dict(q) for q in openai_utils.DEFAULT_VERIFICATION_QUESTIONS])
+
+    async def _generate_questions_once(self, guild_id: int):
+        """Generate questions directly, sharing one in-flight request between a guild's simultaneous joiners."""
+        fut = self._inflight_questions.get(guild_id)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        logging.warning("Verification question pool empty, generating questions directly")
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight_questions[guild_id] = fut
+        try:
+            questions = await self._generate_questions()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            # Retrieve it so a failure nobody else was waiting on isn't reported as never retrieved
+            fut.exception()
+            raise
+        else:
+            fut.set_result(questions)
+            return questions
+        finally:
+            self._inflight_questions.pop(guild_id, None)
+
+    def selected_role_names(self, member: discord.Member, settings: dict) -> List[str]:
+        """Names of the member's roles other than @everyone and the guest role."""
+        guest_role = self._get_role(member.guild, settings["guest_role_name"])
+        guest_role_id = guest_role.id if guest_role else None
+        return [role.name for role in member.roles if not role.is_default() and role.id != guest_role_id]
 
     def get_channel_id(self, guild: discord.Guild, channel_name: str) -> Optional[int]:
         """Get channel ID from channel name."""
-        channel = discord.utils.get(guild.channels, name=channel_name)
+        channel = self._get_channel(guild, channel_name)
         return channel.id if channel else None
 
     async def assign_guest_role(self, member: discord.Member):
         """Assign the Guest role to a new member."""
         try:
-            settings = self.get_guild_settings(member.guild.id)
+            settings = await self.get_guild_settings(member.guild.id)
             if not settings["enabled"]:
                 return
 
-            guest_role = discord.utils.get(member.guild.roles, name=settings["guest_role_name"])
+            guest_role = self._get_role(member.guild, settings["guest_role_name"])
             if not guest_role:
                 # Create the role if it doesn't exist
                 guest_role = await member.guild.create_role(name=settings["guest_role_name"])
@@ -90,7 +494,7 @@ class VerificationCog(commands.Cog):
             logging.info(f"Assigned Guest role to {member.name} ({member.id})")
             
             # Store verification attempt in AstraDB
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=member.id,
                 username=member.name,
                 guild_id=member.guild.id,
@@ -103,7 +507,7 @@ class VerificationCog(commands.Cog):
         """Send a verification challenge to the user."""
         try:
             # Get stored questions
-            verification_data = self.get_verification_data(member.id, member.guild.id)
+            verification_data = await self.get_verification_data(member.id, member.guild.id)
             if not verification_data or "questions" not in verification_data:
                 logging.error(f"No verification questions found for {member.name}")
                 return
@@ -124,15 +528,13 @@ class VerificationCog(commands.Cog):
             message = await channel.send(embed=embed)
             
             # Update verification data
-            verification_data.update({
-                "current_question": 0,
-                "correct_answers": 0,
-                "message_id": message.id,
-                "stage": "answering"
-            })
+            await self.update_verification_data(
+                member.id, member.guild.id, verification_data,
+                current_question=0, correct_answers=0, message_id=message.id, stage="answering"
+            )
             
             # Log verification start
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=member.id,
                 username=member.name,
                 guild_id=member.guild.id,
@@ -145,7 +547,7 @@ class VerificationCog(commands.Cog):
         """Handle the verification button click."""
         try:
             # Get verification data from database
-            verification_data = self.get_verification_data(interaction.user.id, interaction.guild.id)
+            verification_data = await self.get_verification_data(interaction.user.id, interaction.guild.id)
             
             if verification_data:
                 if verification_data["channel_id"] != interaction.channel_id:
@@ -166,11 +568,10 @@ class VerificationCog(commands.Cog):
             questions = verification_data["questions"]
             
             # Update verification data
-            verification_data.update({
-                "current_question": 0,
-                "correct_answers": 0,
-                "stage": "answering"
-            })
+            await self.update_verification_data(
+                interaction.user.id, interaction.guild.id, verification_data,
+                current_question=0, correct_answers=0, stage="answering"
+            )
 
             # Create question embed
             embed = discord.Embed(
@@ -202,26 +603,30 @@ class VerificationCog(commands.Cog):
         """Handle a user's response to the verification challenge."""
         try:
             user_id = message.author.id
-            if user_id not in self.active_verifications:
+            if not self.has_verification(user_id, message.guild.id):
                 return
 
-            verification_data = self.get_verification_data(user_id, message.guild.id)
-            if verification_data["stage"] != "answering":
+            verification_data = await self.get_verification_data(user_id, message.guild.id)
+            if not verification_data or verification_data["stage"] != "answering":
                 return
 
             if verification_data["channel_id"] != message.channel.id:
                 return
 
-            verification_data["attempts"] += 1
             current_question = verification_data["questions"][verification_data["current_question"]]
-
             # Check if the answer is correct
-            if message.content.lower() == current_question["answer"].lower():
-                verification_data["correct_answers"] += 1
-                
-                # Move to next question or complete verification
+            correct = normalize_answer(message.content) in accepted_answers(current_question)
+            progress = {"attempts": verification_data["attempts"] + 1}
+            if correct:
+                progress["correct_answers"] = verification_data["correct_answers"] + 1
                 if verification_data["current_question"] < 2:
-                    verification_data["current_question"] += 1
+                    progress["current_question"] = verification_data["current_question"] + 1
+            # Persist before replying: complete_verification re-reads the session
+            await self.update_verification_data(user_id, message.guild.id, verification_data, **progress)
+
+            if correct:
+                # Move to next question or complete verification
+                if "current_question" in progress:
                     next_question = verification_data["questions"][verification_data["current_question"]]
                     
                     embed = discord.Embed(
@@ -244,38 +649,11 @@ class VerificationCog(commands.Cog):
                 # Wrong answer
                 if verification_data["attempts"] >= 3:
                     # Too many attempts
-                    embed = discord.Embed(
-                        title="❌ Verification Failed",
-                        description=(
-                            "You've exceeded the maximum number of attempts.\n"
-                            "An admin has been notified and will review your case."
-                        ),
-                        color=discord.Color.red()
-                    )
-                    await message.channel.send(embed=embed)
-                    
-                    # Notify admins
-                    settings = self.get_guild_settings(message.guild.id)
-                    admin_channel = discord.utils.get(
-                        message.guild.channels,
-                        name=settings["admin_channel_name"]
-                    )
-                    if admin_channel:
-                        await admin_channel.send(
-                            f"⚠️ {message.author.mention} has failed verification after 3 attempts.\n"
-                            f"Channel: {message.channel.mention}"
-                        )
-                    
-                    # Update verification data
-                    verification_data["stage"] = "failed"
-                    
-                    # Log failure
-                    astra_db_ops.log_verification_attempt(
-                        user_id=user_id,
-                        username=message.author.name,
-                        guild_id=message.guild.id,
-                        stage="verification_failed",
-                        success=False
+                    await self._fail_verification(
+                        message,
+                        verification_data,
+                        "You've exceeded the maximum number of attempts.",
+                        "has failed verification after 3 attempts.",
                     )
                 else:
                     # Still has attempts left
@@ -290,18 +668,50 @@ class VerificationCog(commands.Cog):
                 "❌ An error occurred. Please try again or contact an admin."
             )
 
+    async def _fail_verification(self, message: discord.Message, verification_data: dict,
+                                 reason: str, admin_summary: str):
+        """Mark a verification as failed, tell the user and admins, and log it."""
+        await self.update_verification_data(message.author.id, message.guild.id, verification_data, stage="failed")
+        self.forget_verification(message.author.id, message.guild.id)
+        self.log_attempt(
+            user_id=message.author.id,
+            username=message.author.name,
+            guild_id=message.guild.id,
+            stage="verification_failed",
+            success=False
+        )
+
+        embed = discord.Embed(
+            title="❌ Verification Failed",
+            description=f"{reason}\nAn admin has been notified and will review your case.",
+            color=discord.Color.red()
+        )
+        sends = [message.channel.send(embed=embed)]
+
+        settings = await self.get_guild_settings(message.guild.id)
+        admin_channel = self._get_channel(message.guild, settings["admin_channel_name"])
+        if admin_channel:
+            sends.append(admin_channel.send(
+                f"⚠️ {message.author.mention} {admin_summary}\n"
+                f"Channel: {message.channel.mention}"
+            ))
+        # The user and admin messages are independent; a failure in one shouldn't block the other
+        for result in await asyncio.gather(*sends, return_exceptions=True):
+            if isinstance(result, Exception):
+                logging.error(f"Error sending verification failure notice: {result}")
+
     async def complete_verification(self, message: discord.Message):
         """Handle completion of the verification questions."""
         try:
-            verification_data = self.get_verification_data(message.author.id, message.guild.id)
+            verification_data = await self.get_verification_data(message.author.id, message.guild.id)
             correct_answers = verification_data["correct_answers"]
 
             if correct_answers >= 2:
                 # Get guild settings for role assignment
-                settings = self.get_guild_settings(message.guild.id)
+                settings = await self.get_guild_settings(message.guild.id)
                 
                 # Assign Guest role first
-                guest_role = discord.utils.get(message.guild.roles, name=settings["guest_role_name"])
+                guest_role = self._get_role(message.guild, settings["guest_role_name"])
                 if guest_role:
                     await message.author.add_roles(guest_role)
                     logging.info(f"Assigned Guest role to {message.author.name} ({message.author.id})")
@@ -310,7 +720,9 @@ class VerificationCog(commands.Cog):
                     logging.error(f"Guest role {settings['guest_role_name']} not found in guild {message.guild.name}")
                 
                 # Update verification stage
-                verification_data["stage"] = "rules"
+                await self.update_verification_data(
+                    message.author.id, message.guild.id, verification_data, stage="rules"
+                )
                 
                 embed = discord.Embed(
                     title="✅ Verification Successful!",
@@ -323,19 +735,10 @@ class VerificationCog(commands.Cog):
                     color=discord.Color.green()
                 )
 
-                # Create button for rules acknowledgment
-                view = discord.ui.View()
-                rules_button = discord.ui.Button(
-                    label="I've Read the Rules",
-                    style=discord.ButtonStyle.primary,
-                    custom_id="acknowledge_rules"
-                )
-                view.add_item(rules_button)
-
-                await message.channel.send(embed=embed, view=view)
+                await message.channel.send(embed=embed, view=self._rules_view)
                 
                 # Log success
-                astra_db_ops.log_verification_attempt(
+                self.log_attempt(
                     user_id=message.author.id,
                     username=message.author.name,
                     guild_id=message.guild.id,
@@ -344,39 +747,12 @@ class VerificationCog(commands.Cog):
                 )
             else:
                 # Not enough correct answers
-                embed = discord.Embed(
-                    title="❌ Verification Failed",
-                    description=(
-                        f"You got {correct_answers}/3 questions correct.\n"
-                        "A minimum of 2 correct answers is required.\n"
-                        "An admin has been notified and will review your case."
-                    ),
-                    color=discord.Color.red()
-                )
-                await message.channel.send(embed=embed)
-                
-                # Notify admins
-                settings = self.get_guild_settings(message.guild.id)
-                admin_channel = discord.utils.get(
-                    message.guild.channels,
-                    name=settings["admin_channel_name"]
-                )
-                if admin_channel:
-                    await admin_channel.send(
-                        f"⚠️ {message.author.mention} failed verification with {correct_answers}/3 correct answers.\n"
-                        f"Channel: {message.channel.mention}"
-                    )
-                
-                # Update verification data
-                verification_data["stage"] = "failed"
-                
-                # Log failure
-                astra_db_ops.log_verification_attempt(
-                    user_id=message.author.id,
-                    username=message.author.name,
-                    guild_id=message.guild.id,
-                    stage="verification_failed",
-                    success=False
+                await self._fail_verification(
+                    message,
+                    verification_data,
+                    f"You got {correct_answers}/3 questions correct.\n"
+                    "A minimum of 2 correct answers is required.",
+                    f"failed verification with {correct_answers}/3 correct answers.",
                 )
 
         except Exception as e:
@@ -385,26 +761,6 @@ class VerificationCog(commands.Cog):
                 "❌ An error occurred. Please contact an admin for assistance."
             )
 
-    @commands.Cog.listener()
-    async def on_interaction(self, interaction: discord.Interaction):
-        """Handle button interactions."""
-        if not interaction.type == discord.InteractionType.component:
-            return
-
-        # Get the custom_id from the interaction data
-        custom_id = interaction.data.get('custom_id')
-        if not custom_id:
-            return
-
-        if custom_id == "start_verification":
-            await self.handle_verification_button(interaction)
-        elif custom_id == "acknowledge_rules":
-            await self.handle_rules_acknowledgment(interaction)
-        elif custom_id == "done_selecting_roles":
-            await self.handle_role_selection_complete(interaction)
-        elif custom_id.startswith(("approve_", "deny_")):
-            await self.handle_admin_decision(interaction)
-
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         """Handle new member joins."""
@@ -412,11 +768,11 @@ class VerificationCog(commands.Cog):
             logging.debug(f"[DEBUG] Member joined: {member.name} (ID: {member.id}) in guild: {member.guild.name} (ID: {member.guild.id})")
             
             # Notify admins immediately
-            settings = self.get_guild_settings(member.guild.id)
+            settings = await self.get_guild_settings(member.guild.id)
             logging.debug(f"[DEBUG] Guild settings: {settings}")
-            admin_channel = discord.utils.get(member.guild.channels, name=settings["admin_channel_name"])
+            admin_channel = self._get_channel(member.guild, settings["admin_channel_name"])
             if admin_channel:
-                admin_role = discord.utils.get(member.guild.roles, name=settings["admin_role_name"])
+                admin_role = self._get_role(member.guild, settings["admin_role_name"])
                 admin_mention = admin_role.mention if admin_role else "@admin"
                 await admin_channel.send(
                     f"👋 {member.mention} has joined and is going through the verification process.\n"
@@ -432,16 +788,16 @@ class VerificationCog(commands.Cog):
             channel = await self.create_temp_verification_channel(member)
             logging.debug(f"[DEBUG] Created verification channel: {channel.name} (ID: {channel.id})")
 
-            # Generate verification questions using OpenAI
-            questions = await openai_utils.generate_openai_response("Generate 3 verification questions", intent="verification")
+            # Take a pre-generated set of verification questions
+            questions = await self.take_verification_questions(member.guild.id)
             logging.debug(f"[DEBUG] Generated verification questions for {member.name}")
 
             # Store verification state
-            self.save_verification_data(member.id, member.guild.id, channel.id, {
+            await self.save_verification_data(member.id, member.guild.id, channel.id, {
                 "stage": "verification",
                 "attempts": 0,
                 "timestamp": discord.utils.utcnow().timestamp(),
-                "selected_roles": set(),
+                "selected_roles": [],
                 "questions": questions
             })
             logging.debug(f"[DEBUG] Stored verification state for {member.name}")
@@ -462,21 +818,12 @@ class VerificationCog(commands.Cog):
                 color=discord.Color.blue()
             )
 
-            # Create verification button
-            view = discord.ui.View()
-            start_button = discord.ui.Button(
-                label="Start Verification",
-                style=discord.ButtonStyle.primary,
-                custom_id="start_verification"
-            )
-            view.add_item(start_button)
-
             # Send welcome message
             logging.debug(f"[DEBUG] Sending welcome message to {member.name}")
-            await channel.send(embed=embed, view=view)
+            await channel.send(embed=embed, view=self._start_view)
 
             # Log verification start
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=member.id,
                 username=member.name,
                 guild_id=member.guild.id,
@@ -496,12 +843,13 @@ class VerificationCog(commands.Cog):
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Handle messages for verification responses."""
-        if message.author.bot:
+        # Cheap filter first: almost every message is outside a verification channel
+        if message.channel.id not in self._verification_channels or message.author.bot:
             return
 
         # Check if this is a verification response
-        if message.author.id in self.active_verifications:
-            await self.handle_verification_response(message)
+        if self.has_verification(message.author.id, message.guild.id):
+            await self.run_for_user(message.author.id, self.handle_verification_response, message)
 
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
@@ -519,16 +867,16 @@ class VerificationCog(commands.Cog):
                 return
 
             # Check if user has Verified role
-            settings = self.get_guild_settings(reaction.message.guild.id)
-            verified_role = discord.utils.get(member.roles, name=settings["verified_role_name"])
-            if not verified_role:
+            settings = await self.get_guild_settings(reaction.message.guild.id)
+            verified_role = self._get_role(member.guild, settings["verified_role_name"])
+            if not verified_role or not member.get_role(verified_role.id):
                 return
 
             # Remove reaction to prevent spam
             await reaction.remove(user)
 
             # Log rules acknowledgment
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=user.id,
                 username=user.name,
                 guild_id=reaction.message.guild.id,
@@ -541,9 +889,9 @@ class VerificationCog(commands.Cog):
     async def setup_role_selection(self, member: discord.Member):
         """Set up the role selection process for a verified user."""
         try:
-            settings = self.get_guild_settings(member.guild.id)
+            settings = await self.get_guild_settings(member.guild.id)
             # Find or create roles channel
-            roles_channel = discord.utils.get(member.guild.channels, name=settings["roles_channel_name"])
+            roles_channel = self._get_channel(member.guild, settings["roles_channel_name"])
             if not roles_channel:
                 roles_channel = await member.guild.create_text_channel(settings["roles_channel_name"])
 
@@ -554,21 +902,14 @@ class VerificationCog(commands.Cog):
                 color=discord.Color.blue()
             )
 
-            # Create view with role buttons
-            view = RoleSelectionView(self, member, roles_channel.id)
-
-            # Send role selection message
-            message = await roles_channel.send(embed=embed, view=view)
+            # Send role selection message with the shared persistent "Done Selecting Roles" view
+            message = await roles_channel.send(embed=embed, view=self._done_view)
             
             # Store selection data
-            self.role_selections[member.id] = {
-                "message_id": message.id,
-                "selected_roles": set(),
-                "timestamp": discord.utils.utcnow()
-            }
+            self.role_selections[member.id] = RoleSelectionState(message.id)
 
             # Log role selection setup
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=member.id,
                 username=member.name,
                 guild_id=member.guild.id,
@@ -614,11 +955,13 @@ class VerificationCog(commands.Cog):
         """Configure verification settings for the server."""
         try:
             if action == "enable":
-                astra_db_ops.toggle_guild_verification(interaction.guild_id, True)
+                await asyncio.to_thread(astra_db_ops.toggle_guild_verification, interaction.guild_id, True)
+                self.invalidate_guild_settings(interaction.guild_id)
                 await interaction.response.send_message("✅ Verification system enabled!", ephemeral=True)
             
             elif action == "disable":
-                astra_db_ops.toggle_guild_verification(interaction.guild_id, False)
+                await asyncio.to_thread(astra_db_ops.toggle_guild_verification, interaction.guild_id, False)
+                self.invalidate_guild_settings(interaction.guild_id)
                 await interaction.response.send_message("✅ Verification system disabled!", ephemeral=True)
             
             elif action == "setup":
@@ -630,22 +973,26 @@ class VerificationCog(commands.Cog):
                     return
 
                 if channel and channel_type:
-                    astra_db_ops.update_guild_channel_settings(
+                    await asyncio.to_thread(
+                        astra_db_ops.update_guild_channel_settings,
                         interaction.guild_id,
                         channel_type,
                         channel.name
                     )
+                    self.invalidate_guild_settings(interaction.guild_id)
                     await interaction.response.send_message(
                         f"✅ Set {channel_type} channel to {channel.mention}",
                         ephemeral=True
                     )
                 
                 elif role and role_type:
-                    astra_db_ops.update_guild_role_settings(
+                    await asyncio.to_thread(
+                        astra_db_ops.update_guild_role_settings,
                         interaction.guild_id,
                         role_type,
                         role.name
                     )
+                    self.invalidate_guild_settings(interaction.guild_id)
                     await interaction.response.send_message(
                         f"✅ Set {role_type} role to {role.mention}",
                         ephemeral=True
@@ -669,7 +1016,7 @@ class VerificationCog(commands.Cog):
         """Check current verification settings for the server."""
         try:
             await interaction.response.defer(ephemeral=True)
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             
             embed = discord.Embed(
                 title="🔐 Verification Settings",
@@ -749,13 +1096,13 @@ class VerificationCog(commands.Cog):
         try:
             await interaction.response.defer(ephemeral=True)
             
-            if interaction.user.id not in self.active_verifications:
+            if not self.has_verification(interaction.user.id, interaction.guild_id):
                 await interaction.edit_original_response(
                     content="❌ No active verification session found."
                 )
                 return
 
-            verification_data = self.get_verification_data(interaction.user.id, interaction.guild.id)
+            verification_data = await self.get_verification_data(interaction.user.id, interaction.guild.id)
             if verification_data["channel_id"] != interaction.channel.id:
                 await interaction.edit_original_response(
                     content="❌ Please use your verification channel."
@@ -769,12 +1116,13 @@ class VerificationCog(commands.Cog):
                 return
 
             # Get guild settings
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
 
             # Update verification stage
-            verification_data["stage"] = "roles"
-            verification_data["rules_acknowledged"] = True
-            verification_data["rules_timestamp"] = discord.utils.utcnow().timestamp()
+            await self.update_verification_data(
+                interaction.user.id, interaction.guild.id, verification_data,
+                stage="roles", rules_acknowledged=True, rules_timestamp=discord.utils.utcnow().timestamp()
+            )
 
             # Create roles selection embed
             embed = discord.Embed(
@@ -789,19 +1137,10 @@ class VerificationCog(commands.Cog):
                 color=discord.Color.blue()
             )
 
-            # Create button for completing role selection
-            view = discord.ui.View()
-            done_button = discord.ui.Button(
-                label="Done Selecting Roles",
-                style=discord.ButtonStyle.primary,
-                custom_id="done_selecting_roles"
-            )
-            view.add_item(done_button)
-
-            await interaction.edit_original_response(embed=embed, view=view)
+            await interaction.edit_original_response(embed=embed, view=self._done_view)
 
             # Log rules acknowledgment
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=interaction.user.id,
                 username=interaction.user.name,
                 guild_id=interaction.guild_id,
@@ -827,14 +1166,10 @@ class VerificationCog(commands.Cog):
             await interaction.response.defer()
             
             # Get guild settings
-            settings = self.get_guild_settings(interaction.guild.id)
+            settings = await self.get_guild_settings(interaction.guild.id)
             
             # Get user's roles excluding @everyone and guest role
-            guest_role_name = settings["guest_role_name"]
-            user_roles = [
-                role.name for role in interaction.user.roles 
-                if role.name != "@everyone" and role.name != guest_role_name
-            ]
+            user_roles = self.selected_role_names(interaction.user, settings)
             
             if not user_roles:
                 await interaction.followup.send(
@@ -844,9 +1179,11 @@ class VerificationCog(commands.Cog):
                 return
             
             # Update verification state
-            verification_data = self.get_verification_data(interaction.user.id, interaction.guild.id)
-            verification_data["selected_roles"] = set(user_roles)
-            verification_data["stage"] = "roles_selected"
+            verification_data = await self.get_verification_data(interaction.user.id, interaction.guild.id)
+            await self.update_verification_data(
+                interaction.user.id, interaction.guild.id, verification_data,
+                selected_roles=user_roles, stage="roles_selected"
+            )
             
             # Show selected roles in temp channel
             embed = discord.Embed(
@@ -862,7 +1199,7 @@ class VerificationCog(commands.Cog):
             await interaction.followup.edit_message(interaction.message.id, embed=embed, view=None)
             
             # Log role selection
-            astra_db_ops.log_verification_attempt(
+            self.log_attempt(
                 user_id=interaction.user.id,
                 username=interaction.user.name,
                 guild_id=interaction.guild.id,
@@ -871,10 +1208,7 @@ class VerificationCog(commands.Cog):
             )
             
             # Notify admins with approve/deny buttons
-            admin_channel = discord.utils.get(
-                interaction.guild.channels,
-                name=settings["admin_channel_name"]
-            )
+            admin_channel = self._get_channel(interaction.guild, settings["admin_channel_name"])
             if admin_channel:
                 review_embed = discord.Embed(
                     title="👋 New Member Review",
@@ -887,25 +1221,10 @@ class VerificationCog(commands.Cog):
                     color=discord.Color.blue()
                 )
 
-                # Create approve/deny buttons
-                review_view = discord.ui.View()
-                approve_button = discord.ui.Button(
-                    label="Approve",
-                    style=discord.ButtonStyle.success,
-                    custom_id=f"approve_{interaction.user.id}"
-                )
-                deny_button = discord.ui.Button(
-                    label="Deny",
-                    style=discord.ButtonStyle.danger,
-                    custom_id=f"deny_{interaction.user.id}"
-                )
-                review_view.add_item(approve_button)
-                review_view.add_item(deny_button)
-
-                await admin_channel.send(embed=review_embed, view=review_view)
+                self.queue_admin_review(admin_channel, interaction.user, review_embed)
                 
                 # Log awaiting approval
-                astra_db_ops.log_verification_attempt(
+                self.log_attempt(
                     user_id=interaction.user.id,
                     username=interaction.user.name,
                     guild_id=interaction.guild.id,
@@ -920,7 +1239,7 @@ class VerificationCog(commands.Cog):
                 ephemeral=True
             )
 
-    async def handle_admin_decision(self, interaction: discord.Interaction):
+    async def handle_admin_decision(self, interaction: discord.Interaction, user_id: int, action: str):
         """Handle admin's approval or denial of a new member."""
         try:
             # Check if the user has admin permissions
@@ -928,32 +1247,21 @@ class VerificationCog(commands.Cog):
             has_admin = interaction.user.guild_permissions.administrator
             
             if not (is_owner or has_admin):
-                await interaction.response.send_message(
-                    "❌ You need administrator permissions to use this command.",
-                    ephemeral=True
-                )
+                await interaction.response.send_message(ADMIN_ONLY_MESSAGE, ephemeral=True)
                 return
 
-            # Extract user ID and decision from custom_id
-            custom_id = interaction.data.get('custom_id')
-            if not custom_id:
-                await interaction.response.send_message(
-                    "❌ Invalid interaction data.",
-                    ephemeral=True
-                )
-                return
-                
-            action, user_id = custom_id.split('_')
-            user_id = int(user_id)
-            
-            if user_id not in self.active_verifications:
+            # One index probe for this guild's session, then a single read of its data
+            verification_data = (
+                await self.get_verification_data(user_id, interaction.guild.id)
+                if self.has_verification(user_id, interaction.guild.id) else None
+            )
+            if verification_data is None:
                 await interaction.response.send_message(
                     "❌ Verification session not found.",
                     ephemeral=True
                 )
                 return
 
-            verification_data = self.get_verification_data(user_id, interaction.guild.id)
             member = interaction.guild.get_member(user_id)
             
             if not member:
@@ -961,31 +1269,29 @@ class VerificationCog(commands.Cog):
                     "❌ Member not found. They may have left the server.",
                     ephemeral=True
                 )
-                self.delete_verification_data(user_id, interaction.guild.id)
+                await self.delete_verification_data(user_id, interaction.guild.id)
                 return
 
             # Acknowledge the interaction first
             await interaction.response.defer()
 
             # Get roles
-            settings = self.get_guild_settings(interaction.guild_id)
-            guest_role = discord.utils.get(
-                interaction.guild.roles,
-                name=settings["guest_role_name"]
-            )
+            settings = await self.get_guild_settings(interaction.guild_id)
+            guest_role = self._get_role(interaction.guild, settings["guest_role_name"])
 
             if action == "approve":
                 # Get verified role
-                verified_role = discord.utils.get(
-                    interaction.guild.roles,
-                    name=settings["verified_role_name"]
-                )
+                verified_role = self._get_role(interaction.guild, settings["verified_role_name"])
 
-                # Apply roles
+                # Apply roles (each role is its own REST call, so they can run together)
+                role_changes = []
                 if verified_role:
-                    await member.add_roles(verified_role)
+                    role_changes.append(member.add_roles(verified_role))
                 if guest_role:
-                    await member.remove_roles(guest_role)
+                    role_changes.append(member.remove_roles(guest_role))
+                for result in await asyncio.gather(*role_changes, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        logging.error(f"Failed to update roles for {member.name} on approval: {result}")
 
                 # Update the original message
                 embed = discord.Embed(
@@ -999,7 +1305,7 @@ class VerificationCog(commands.Cog):
                     ),
                     color=discord.Color.green()
                 )
-                await interaction.message.edit(embed=embed, view=None)
+                await self._resolve_admin_review(interaction.message, user_id, embed)
 
                 # Send approval message to verification channel
                 channel = interaction.guild.get_channel(verification_data["channel_id"])
@@ -1014,20 +1320,10 @@ class VerificationCog(commands.Cog):
                         color=discord.Color.green()
                     )
                     await channel.send(embed=embed)
-                    
-                    # Schedule channel deletion in a background task
-                    async def delete_channel():
-                        try:
-                            await asyncio.sleep(60)
-                            await channel.delete()
-                        except Exception as e:
-                            logging.error(f"Failed to delete verification channel {channel.id}: {e}")
-                    
-                    # Start the deletion task
-                    asyncio.create_task(delete_channel())
+                    self._schedule_channel_delete(channel, 60)
 
                 # Log approval
-                astra_db_ops.log_verification_attempt(
+                self.log_attempt(
                     user_id=user_id,
                     username=member.name,
                     guild_id=interaction.guild_id,
@@ -1036,14 +1332,8 @@ class VerificationCog(commands.Cog):
                 )
 
                 # Send welcome message in welcome channel
-                welcome_channel = discord.utils.get(
-                    interaction.guild.channels,
-                    name=settings["welcome_channel_name"]
-                )
-                welcome_committee_role = discord.utils.get(
-                    interaction.guild.roles,
-                    name=settings["welcome_committee_role_name"]
-                )
+                welcome_channel = self._get_channel(interaction.guild, settings["welcome_channel_name"])
+                welcome_committee_role = self._get_role(interaction.guild, settings["welcome_committee_role_name"])
                 
                 if welcome_channel and welcome_committee_role:
                     # Send the role mention in the content
@@ -1082,10 +1372,14 @@ class VerificationCog(commands.Cog):
                     ),
                     color=discord.Color.red()
                 )
-                await interaction.message.edit(embed=embed, view=None)
+                await self._resolve_admin_review(interaction.message, user_id, embed)
 
-                # Send denial message to verification channel
+                # Send denial message to verification channel and DM the user together
                 channel = interaction.guild.get_channel(verification_data["channel_id"])
+                dm = member.send(
+                    "❌ Your verification request has been denied by an administrator.\n"
+                    "Please contact the server staff for more information."
+                )
                 if channel:
                     embed = discord.Embed(
                         title="❌ Verification Denied",
@@ -1096,30 +1390,19 @@ class VerificationCog(commands.Cog):
                         ),
                         color=discord.Color.red()
                     )
-                    await channel.send(embed=embed)
-                    
-                    # Schedule channel deletion in a background task
-                    async def delete_channel():
-                        try:
-                            await asyncio.sleep(60)
-                            await channel.delete()
-                        except Exception as e:
-                            logging.error(f"Failed to delete verification channel {channel.id}: {e}")
-                    
-                    # Start the deletion task
-                    asyncio.create_task(delete_channel())
-
-                # Send DM to user
-                try:
-                    await member.send(
-                        "❌ Your verification request has been denied by an administrator.\n"
-                        "Please contact the server staff for more information."
+                    dm_result, channel_result = await asyncio.gather(
+                        dm, channel.send(embed=embed), return_exceptions=True
                     )
-                except Exception as dm_error:
-                    logging.error(f"Failed to send denial DM to {member.name}: {dm_error}")
+                    if isinstance(channel_result, Exception):
+                        logging.error(f"Failed to send denial message in {channel.id}: {channel_result}")
+                    self._schedule_channel_delete(channel, 60)
+                else:
+                    dm_result, = await asyncio.gather(dm, return_exceptions=True)
+                if isinstance(dm_result, Exception):
+                    logging.error(f"Failed to send denial DM to {member.name}: {dm_result}")
 
                 # Log denial
-                astra_db_ops.log_verification_attempt(
+                self.log_attempt(
                     user_id=user_id,
                     username=member.name,
                     guild_id=interaction.guild_id,
@@ -1128,7 +1411,7 @@ class VerificationCog(commands.Cog):
                 )
 
             # Clean up
-            self.delete_verification_data(user_id, interaction.guild.id)
+            await self.delete_verification_data(user_id, interaction.guild.id)
 
         except Exception as e:
             logging.error(f"Error handling admin decision: {e}")
@@ -1138,6 +1421,84 @@ class VerificationCog(commands.Cog):
                     ephemeral=True
                 )
 
+    def _schedule_channel_delete(self, channel: discord.abc.GuildChannel, delay: float):
+        """Delete a verification channel after `delay` seconds without holding up the caller."""
+        task = asyncio.create_task(self._delayed_channel_delete(channel, delay))
+        # Keep a reference so the pending task isn't garbage collected
+        self._pending_deletes.add(task)
+        task.add_done_callback(self._pending_deletes.discard)
+
+    async def _delayed_channel_delete(self, channel: discord.abc.GuildChannel, delay: float):
+        await asyncio.sleep(delay)
+        try:
+            await channel.delete()
+        except discord.NotFound:
+            pass
+        except Exception as e:
+            logging.error(f"Failed to delete verification channel {channel.id}: {e}")
+
+    def queue_admin_review(self, channel: discord.TextChannel, member: discord.Member, embed: discord.Embed):
+        """Queue a member's review request; requests arriving together are sent as one message."""
+        self._review_buffer.setdefault(channel.id, []).append((member, embed))
+        if channel.id not in self._review_flushes:
+            task = asyncio.create_task(self._debounced_admin_review_flush(channel))
+            self._review_flushes[channel.id] = task
+            task.add_done_callback(lambda t: self._forget_review_flush(channel.id, t))
+
+    def _forget_review_flush(self, channel_id: int, task: asyncio.Task):
+        # A newer flush may already own this channel's slot
+        if self._review_flushes.get(channel_id) is task:
+            del self._review_flushes[channel_id]
+
+    async def _debounced_admin_review_flush(self, channel: discord.TextChannel):
+        await asyncio.sleep(ADMIN_REVIEW_DEBOUNCE)
+        await self._flush_admin_reviews(channel)
+
+    async def _flush_admin_reviews(self, channel: discord.TextChannel):
+        """Send buffered review requests, ADMIN_REVIEW_BATCH members per message."""
+        # Release the channel's flush slot along with its buffer, so reviews queued while we send get a flush of their own
+        self._forget_review_flush(channel.id, asyncio.current_task())
+        pending = self._review_buffer.pop(channel.id, [])
+        for i in range(0, len(pending), ADMIN_REVIEW_BATCH):
+            chunk = pending[i:i + ADMIN_REVIEW_BATCH]
+            view = discord.ui.View()
+            for row, (member, _) in enumerate(chunk):
+                # With several members per message, say whose buttons are whose
+                suffix = f" {member.display_name}"[:40] if len(chunk) > 1 else ""
+                view.add_item(AdminReviewButton(member.id, "approve", f"Approve{suffix}", row=row))
+                view.add_item(AdminReviewButton(member.id, "deny", f"Deny{suffix}", row=row))
+            try:
+                await channel.send(embeds=[embed for _, embed in chunk], view=view)
+            except Exception as e:
+                logging.error(f"Failed to send admin review requests in {channel.id}: {e}")
+
+    async def _resolve_admin_review(self, message: discord.Message, user_id: int, embed: discord.Embed):
+        """Replace a member's review request with the decision and remove their buttons."""
+        if len(message.embeds) <= 1:
+            await message.edit(embed=embed, view=None)
+            return
+
+        # Several members share this message: re-read it so concurrent decisions don't overwrite each other
+        lock = self._review_locks.setdefault(message.id, asyncio.Lock())
+        async with lock:
+            message = await message.channel.fetch_message(message.id)
+            mention, nick_mention = f"<@{user_id}>", f"<@!{user_id}>"
+            embeds = [
+                embed if (mention in (e.description or "") or nick_mention in (e.description or "")) else e
+                for e in message.embeds
+            ]
+            view = discord.ui.View()
+            for row, action_row in enumerate(message.components):
+                for component in getattr(action_row, "children", ()):
+                    match = re.fullmatch(ADMIN_REVIEW_CUSTOM_ID, component.custom_id or "")
+                    if match and int(match["user_id"]) != user_id:
+                        view.add_item(AdminReviewButton(int(match["user_id"]), match["action"], component.label, row=row))
+            if view.children:
+                await message.edit(embeds=embeds, view=view)
+            else:
+                await message.edit(embeds=embeds, view=None)
+                self._review_locks.pop(message.id, None)
+
     async def create_temp_verification_channel(self, member: discord.Member) -> discord.TextChannel:
         """Create a temporary verification channel for a new member."""
         try:
@@ -1173,16 +1534,14 @@ class VerificationCog(commands.Cog):
                 channel = await member.guild.create_text_channel(
                     name=f"verify-{member.name}",
                     category=category,
-                    overwrites=overwrites
+                    overwrites=overwrites,
+                    topic="This channel will be deleted after 24 hours of inactivity."
                 )
             except Exception as e:
                 logging.error(f"[ERROR] Failed to create channel: {e}")
                 logging.error(f"[ERROR] Bot permissions: {member.guild.me.guild_permissions}")
                 raise
 
-            # Set channel to be deleted after 24 hours
-            await channel.edit(topic="This channel will be deleted after 24 hours of inactivity.")
-            
             return channel
 
         except Exception as e:
@@ -1231,123 +1590,173 @@ class VerificationCog(commands.Cog):
         if interaction_id in self.pagination_state:
             del self.pagination_state[interaction_id]
 
-class RoleSelectionView(discord.ui.View):
-    def __init__(self, cog, member: discord.Member, roles_channel_id: int):
-        super().__init__(timeout=300)
+class StartVerificationView(discord.ui.View):
+    """Persistent 'Start Verification' button sent in every verification channel."""
+
+    def __init__(self, cog):
+        super().__init__(timeout=None)
         self.cog = cog
-        self.member = member
-        self.roles_channel_id = roles_channel_id
-        
-        # Add done button
-        done_button = discord.ui.Button(
-            label="Done Selecting Roles",
-            style=discord.ButtonStyle.primary,
-            custom_id="done_selecting_roles"
-        )
-        done_button.callback = self.cog.handle_role_selection_complete
-        self.add_item(done_button)
 
-    async def handle_role_selection_complete(self, interaction: discord.Interaction):
-        """Handle completion of role selection."""
-        try:
-            # Defer the interaction first
-            await interaction.response.defer()
-            
-            # Get guild settings
-            settings = self.cog.get_guild_settings(interaction.guild.id)
-            
-            # Get user's roles excluding @everyone and guest role
-            guest_role_name = settings["guest_role_name"]
-            user_roles = [
-                role.name for role in interaction.user.roles 
-                if role.name != "@everyone" and role.name != guest_role_name
-            ]
-            
-            if not user_roles:
-                await interaction.followup.send(
-                    f"❌ Please select at least one role in the #{settings['roles_channel_name']} channel before proceeding.",
-                    ephemeral=True
-                )
-                return
-            
-            # Update verification state
-            verification_data = self.cog.get_verification_data(interaction.user.id, interaction.guild.id)
-            verification_data["selected_roles"] = set(user_roles)
-            verification_data["stage"] = "roles_selected"
-            
-            # Show selected roles in temp channel
-            embed = discord.Embed(
-                title="✅ Roles Selected!",
-                description=(
-                    "Great! You've selected the following roles:\n\n"
-                    f"{', '.join(user_roles)}\n\n"
-                    "An admin will review your verification shortly."
-                ),
-                color=discord.Color.green()
-            )
-            
-            await interaction.followup.edit_message(interaction.message.id, embed=embed, view=None)
-            
-            # Log role selection
-            astra_db_ops.log_verification_attempt(
-                user_id=interaction.user.id,
-                username=interaction.user.name,
-                guild_id=interaction.guild.id,
-                stage="roles_selected",
-                success=True
-            )
-            
-            # Notify admins with approve/deny buttons
-            admin_channel = discord.utils.get(
-                interaction.guild.channels,
-                name=settings["admin_channel_name"]
-            )
-            if admin_channel:
-                review_embed = discord.Embed(
-                    title="👋 New Member Review",
-                    description=(
-                        f"**User:** {interaction.user.mention}\n"
-                        f"**Joined:** <t:{int(verification_data['timestamp'])}:R>\n"
-                        f"**Rules Acknowledged:** <t:{int(verification_data['rules_timestamp'])}:R>\n"
-                        f"**Selected Roles:**\n" + "\n".join(f"• {role}" for role in user_roles)
-                    ),
-                    color=discord.Color.blue()
-                )
+    @discord.ui.button(label="Start Verification", style=discord.ButtonStyle.primary, custom_id="start_verification")
+    async def start_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.cog.run_for_user(interaction.user.id, self.cog.handle_verification_button, interaction)
 
-                # Create approve/deny buttons
-                review_view = discord.ui.View()
-                approve_button = discord.ui.Button(
-                    label="Approve",
-                    style=discord.ButtonStyle.success,
-                    custom_id=f"approve_{interaction.user.id}"
-                )
-                deny_button = discord.ui.Button(
-                    label="Deny",
-                    style=discord.ButtonStyle.danger,
-                    custom_id=f"deny_{interaction.user.id}"
-                )
-                review_view.add_item(approve_button)
-                review_view.add_item(deny_button)
 
-                await admin_channel.send(embed=review_embed, view=review_view)
-                
-                # Log awaiting approval
-                astra_db_ops.log_verification_attempt(
-                    user_id=interaction.user.id,
-                    username=interaction.user.name,
-                    guild_id=interaction.guild.id,
-                    stage="awaiting_approval",
-                    success=True
-                )
-            
-        except Exception as e:
-            logging.error(f"Error handling role selection: {e}")
-            await interaction.response.send_message(
-                "❌ An error occurred. Please try again or contact an admin.",
-                ephemeral=True
-            )
+class AcknowledgeRulesView(discord.ui.View):
+    """Persistent 'I've Read the Rules' button sent after the questions are passed."""
+
+    def __init__(self, cog):
+        super().__init__(timeout=None)
+        self.cog = cog
+
+    @discord.ui.button(label="I've Read the Rules", style=discord.ButtonStyle.primary, custom_id="acknowledge_rules")
+    async def rules_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.cog.run_for_user(interaction.user.id, self.cog.handle_rules_acknowledgment, interaction)
+
+
+class DoneSelectingRolesView(discord.ui.View):
+    """Persistent 'Done Selecting Roles' button shown once the rules are acknowledged."""
+
+    def __init__(self, cog):
+        super().__init__(timeout=None)
+        self.cog = cog
+
+    @discord.ui.button(label="Done Selecting Roles", style=discord.ButtonStyle.primary, custom_id="done_selecting_roles")
+    async def done_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.cog.run_for_user(interaction.user.id, self.cog.handle_role_selection_complete, interaction)
+
+
+class AdminReviewButton(discord.ui.DynamicItem[discord.ui.Button], template=ADMIN_REVIEW_CUSTOM_ID):
+    """
+    Approve/deny button on an admin review request; the member and decision live in its custom_id.
+
+    Registered once with bot.add_dynamic_items, so clicks are routed after restarts without parsing
+    custom_ids in an on_interaction listener.
+    """
+    def __init__(self, user_id: int, action: str, label: str = None, row: Optional[int] = None):
+        super().__init__(discord.ui.Button(
+            label=label or action.capitalize(),
+            style=discord.ButtonStyle.success if action == "approve" else discord.ButtonStyle.danger,
+            custom_id=f"{action}_{user_id}",
+            row=row
+        ))
+        self.user_id = user_id
+        self.action = action
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str]):
+        return cls(int(match["user_id"]), match["action"], item.label)
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog("VerificationCog")
+        if cog is None:
+            return
+        # Serialize on the member being reviewed, not the admin who clicked
+        await cog.run_for_user(self.user_id, cog.handle_admin_decision, interaction, self.user_id, self.action)
+
+
+def admin_only(callback):
+    """Make a SetupWizardView callback reply with ADMIN_ONLY_MESSAGE unless the user passes is_admin()."""
+    @functools.wraps(callback)
+    async def wrapper(self, interaction: discord.Interaction, *args):
+        if not self.is_admin(interaction):
+            logging.warning(f"Setup wizard permission denied for {interaction.user.name}")
+            await interaction.response.send_message(ADMIN_ONLY_MESSAGE, ephemeral=True)
+            return
+        return await callback(self, interaction, *args)
+    return wrapper
+
 
 class SetupWizardView(discord.ui.View):
+    # Settings shown in the wizard's configuration summaries, in display order, with the name
+    # reported on completion for any step that was skipped
+    _SETTINGS_DISPLAY = (
+        ("guest_role_name", "👤 Guest Role", "Guest"),
+        ("verified_role_name", "✅ Verified Role", "Verified"),
+        ("admin_role_name", "👑 Admin Role", "Staff"),
+        ("rules_channel_name", "📜 Rules Channel", "rules"),
+        ("roles_channel_name", "🎭 Roles Channel", "roles"),
+        ("admin_channel_name", "⚠️ Admin Channel", "admin"),
+    )
+
+    # What each "Select ..." picker chooses, keyed by current_select
+    _PICKERS = {
+        "guest_role": WizardPicker("guest_role_name", "Guest role", "guest"),
+        "verified_role": WizardPicker("verified_role_name", "Verified role", "verified"),
+        "admin_role": WizardPicker("admin_role_name", "Admin role", "admin"),
+        "rules_channel": WizardPicker("rules_channel_name", "rules channel"),
+        "roles_channel": WizardPicker("roles_channel_name", "roles channel"),
+        "admin_channel": WizardPicker("admin_channel_name", "admin channel"),
+    }
+
+    # Description and buttons (by attribute name) for each wizard step, indexed by current_step
+    _STEPS = (
+        WizardStep(
+            "Welcome to the verification setup wizard! This will guide you through "
+            "configuring the verification system step by step.\n\n"
+            "The setup will:\n"
+            "1. Create necessary roles (Guest, Verified)\n"
+            "2. Create required channels (Rules, Roles, Admin)\n"
+            "3. Enable the verification system\n\n"
+            "Click 'Start Setup' to begin!",
+            ("start_setup",)
+        ),
+        WizardStep(
+            "**Step 1: Guest Role Setup**\n\n"
+            "First, let's set up the Guest role that new members will receive.\n"
+            "You can either:\n"
+            "1. Select an existing role\n"
+            "2. Create a new role",
+            ("select_guest_role", "create_guest_role", "next_step")
+        ),
+        WizardStep(
+            "**Step 2: Verified Role Setup**\n\n"
+            "Next, let's set up the Verified role that members will receive after verification.\n"
+            "You can either:\n"
+            "1. Select an existing role\n"
+            "2. Create a new role",
+            ("select_verified_role", "create_verified_role", "back_step", "next_step")
+        ),
+        WizardStep(
+            "**Step 3: Admin Role Setup**\n\n"
+            "Now, let's set up the Admin role that will be used for verification approvals.\n"
+            "You can either:\n"
+            "1. Select an existing role\n"
+            "2. Create a new role",
+            ("select_admin_role", "create_admin_role", "back_step", "next_step")
+        ),
+        WizardStep(
+            "**Step 4: Rules Channel Setup**\n\n"
+            "Let's set up the channel for server rules.\n"
+            "You can either:\n"
+            "1. Select an existing channel\n"
+            "2. Create a new channel",
+            ("select_rules_channel", "create_rules_channel", "back_step", "next_step")
+        ),
+        WizardStep(
+            "**Step 5: Roles Channel Setup**\n\n"
+            "Now, let's set up the channel for role selection.\n"
+            "You can either:\n"
+            "1. Select an existing channel\n"
+            "2. Create a new channel",
+            ("select_roles_channel", "create_roles_channel", "back_step", "next_step")
+        ),
+        WizardStep(
+            "**Step 6: Admin Channel Setup**\n\n"
+            "Let's set up the channel for admin approvals.\n"
+            "You can either:\n"
+            "1. Select an existing channel\n"
+            "2. Create a new channel",
+            ("select_admin_channel", "create_admin_channel", "back_step", "next_step")
+        ),
+        WizardStep(
+            "**Step 7: Review and Enable**\n\n"
+            "Please review your settings below. If everything looks correct, "
+            "click 'Enable Verification' to complete the setup.",
+            ("enable_verification", "back_step")
+        ),
+    )
+
     def __init__(self, cog, interaction: discord.Interaction):
         super().__init__(timeout=None)
         self.cog = cog
@@ -1356,51 +1765,55 @@ class SetupWizardView(discord.ui.View):
         self.settings = {}
         self.selection_active = False
         self.current_select = None
+        self._admin_checks: Dict[int, Tuple[float, bool]] = {}  # user_id -> (checked_at, is_admin)
+        # Roles and text channels offered by the pickers, built once per session (reset by the create_* buttons)
+        self._available_roles: Optional[List[discord.Role]] = None
+        self._text_channels: Optional[List[discord.TextChannel]] = None
+        # (kind, page) -> (candidate list the page was built from, options, has_more)
+        self._picker_options: Dict[Tuple[str, int], Tuple[list, List[discord.SelectOption], bool]] = {}
+
+        # Picker components are built once and re-added on every page instead of being recreated
+        self._picker_select = discord.ui.Select()
+        self._picker_select.callback = self._apply_picker_selection
+        self._prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
+        self._prev_button.callback = self._prev_picker_page
+        self._next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
+        self._next_button.callback = self._next_picker_page
+        self._cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
+        self._cancel_button.callback = self.cancel_selection
 
     def is_admin(self, interaction: discord.Interaction) -> bool:
-        """Check if the user has administrator permissions."""
-        try:
-            # For slash commands, interaction.user is already a Member object in guild context
-            # and has guild_permissions attribute
-            is_owner = interaction.user.id == interaction.guild.owner_id
-            has_admin = interaction.user.guild_permissions.administrator
-            
-            logging.info(f"Permission check for {interaction.user.name} in {interaction.guild.name}: is_owner={is_owner}, has_admin={has_admin}")
-            return is_owner or has_admin
-            
-        except Exception as e:
-            logging.error(f"Error checking permissions for {interaction.user.name}: {e}")
+        """Check if the user has administrator permissions (cached briefly per user)."""
+        now = time.monotonic()
+        cached = self._admin_checks.get(interaction.user.id)
+        if cached and now - cached[0] < ADMIN_CHECK_TTL:
+            return cached[1]
+        result = self._check_admin(interaction)
+        self._admin_checks[interaction.user.id] = (now, result)
+        return result
+
+    def _check_admin(self, interaction: discord.Interaction) -> bool:
+        # guild_permissions already grants everything to the guild owner, so one bit test covers both cases
+        if not isinstance(interaction.user, discord.Member):
             return False
+        return interaction.user.guild_permissions.administrator
 
-    def get_guild_settings(self, guild_id: int) -> dict:
+    async def get_guild_settings(self, guild_id: int) -> dict:
         """Get verification settings for a guild."""
-        return self.cog.get_guild_settings(guild_id)
+        return await self.cog.get_guild_settings(guild_id)
 
     @discord.ui.button(label="Start Setup", style=discord.ButtonStyle.primary)
+    @admin_only
     async def start_setup(self, interaction: discord.Interaction, button: discord.ui.Button):
         logging.info(f"Start Setup clicked by {interaction.user.name} (ID: {interaction.user.id})")
-        if not self.is_admin(interaction):
-            logging.error(f"Permission denied for {interaction.user.name}")
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
         self.current_step = 1
         button.disabled = True
         await interaction.response.edit_message(view=self)
         await self.show_current_step()
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.success)
+    @admin_only
     async def next_step(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
         if self.current_step == 0:
             await interaction.response.send_message(
                 "❌ Please click 'Start Setup' first.",
@@ -1424,14 +1837,8 @@ class SetupWizardView(discord.ui.View):
             await self.complete_setup(interaction)
 
     @discord.ui.button(label="Back", style=discord.ButtonStyle.secondary)
+    @admin_only
     async def back_step(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
         if self.current_step == 0:
             await interaction.response.send_message(
                 "❌ Please click 'Start Setup' first.",
@@ -1456,1078 +1863,87 @@ class SetupWizardView(discord.ui.View):
 
         # Add current settings summary if any exist
         if self.settings:
-            settings_summary = "**Current Settings:**\n"
-            if "guest_role_name" in self.settings:
-                settings_summary += f"👤 Guest Role: {self.settings['guest_role_name']}\n"
-            if "verified_role_name" in self.settings:
-                settings_summary += f"✅ Verified Role: {self.settings['verified_role_name']}\n"
-            if "admin_role_name" in self.settings:
-                settings_summary += f"👑 Admin Role: {self.settings['admin_role_name']}\n"
-            if "rules_channel_name" in self.settings:
-                settings_summary += f"📜 Rules Channel: {self.settings['rules_channel_name']}\n"
-            if "roles_channel_name" in self.settings:
-                settings_summary += f"🎭 Roles Channel: {self.settings['roles_channel_name']}\n"
-            if "admin_channel_name" in self.settings:
-                settings_summary += f"⚠️ Admin Channel: {self.settings['admin_channel_name']}\n"
-            embed.add_field(name="Current Configuration", value=settings_summary, inline=False)
-
-        if not self.selection_active:
-            if self.current_step == 0:
-                embed.description = (
-                    "Welcome to the verification setup wizard! This will guide you through "
-                    "configuring the verification system step by step.\n\n"
-                    "The setup will:\n"
-                    "1. Create necessary roles (Guest, Verified)\n"
-                    "2. Create required channels (Rules, Roles, Admin)\n"
-                    "3. Enable the verification system\n\n"
-                    "Click 'Start Setup' to begin!"
-                )
-                self.add_item(self.start_setup)
-            elif self.current_step == 1:
-                embed.description = (
-                    "**Step 1: Guest Role Setup**\n\n"
-                    "First, let's set up the Guest role that new members will receive.\n"
-                    "You can either:\n"
-                    "1. Select an existing role\n"
-                    "2. Create a new role"
-                )
-                self.add_item(self.select_guest_role)
-                self.add_item(self.create_guest_role)
-                self.add_item(self.next_step)
-            elif self.current_step == 2:
-                embed.description = (
-                    "**Step 2: Verified Role Setup**\n\n"
-                    "Next, let's set up the Verified role that members will receive after verification.\n"
-                    "You can either:\n"
-                    "1. Select an existing role\n"
-                    "2. Create a new role"
-                )
-                self.add_item(self.select_verified_role)
-                self.add_item(self.create_verified_role)
-                self.add_item(self.back_step)
-                self.add_item(self.next_step)
-            elif self.current_step == 3:
-                embed.description = (
-                    "**Step 3: Admin Role Setup**\n\n"
-                    "Now, let's set up the Admin role that will be used for verification approvals.\n"
-                    "You can either:\n"
-                    "1. Select an existing role\n"
-                    "2. Create a new role"
-                )
-                self.add_item(self.select_admin_role)
-                self.add_item(self.create_admin_role)
-                self.add_item(self.back_step)
-                self.add_item(self.next_step)
-            elif self.current_step == 4:
-                embed.description = (
-                    "**Step 4: Rules Channel Setup**\n\n"
-                    "Let's set up the channel for server rules.\n"
-                    "You can either:\n"
-                    "1. Select an existing channel\n"
-                    "2. Create a new channel"
-                )
-                self.add_item(self.select_rules_channel)
-                self.add_item(self.create_rules_channel)
-                self.add_item(self.back_step)
-                self.add_item(self.next_step)
-            elif self.current_step == 5:
-                embed.description = (
-                    "**Step 5: Roles Channel Setup**\n\n"
-                    "Now, let's set up the channel for role selection.\n"
-                    "You can either:\n"
-                    "1. Select an existing channel\n"
-                    "2. Create a new channel"
-                )
-                self.add_item(self.select_roles_channel)
-                self.add_item(self.create_roles_channel)
-                self.add_item(self.back_step)
-                self.add_item(self.next_step)
-            elif self.current_step == 6:
-                embed.description = (
-                    "**Step 6: Admin Channel Setup**\n\n"
-                    "Let's set up the channel for admin approvals.\n"
-                    "You can either:\n"
-                    "1. Select an existing channel\n"
-                    "2. Create a new channel"
-                )
-                self.add_item(self.select_admin_channel)
-                self.add_item(self.create_admin_channel)
-                self.add_item(self.back_step)
-                self.add_item(self.next_step)
-            elif self.current_step == 7:
-                embed.description = (
-                    "**Step 7: Review and Enable**\n\n"
-                    "Please review your settings below. If everything looks correct, "
-                    "click 'Enable Verification' to complete the setup."
-                )
-                self.add_item(self.enable_verification)
-                self.add_item(self.back_step)
+            parts = ["**Current Settings:**"]
+            parts.extend(
+                f"{label}: {self.settings[key]}" for key, label, _ in self._SETTINGS_DISPLAY if key in self.settings
+            )
+            embed.add_field(name="Current Configuration", value="\n".join(parts), inline=False)
+
+        if not self.selection_active and 0 <= self.current_step < len(self._STEPS):
+            step = self._STEPS[self.current_step]
+            embed.description = step.description
+            for name in step.buttons:
+                self.add_item(getattr(self, name))
 
         await self.interaction.edit_original_response(embed=embed, view=self)
 
     @discord.ui.button(label="Select Guest Role", style=discord.ButtonStyle.primary)
     async def select_guest_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get available roles
-        available_roles = [
-            role for role in interaction.guild.roles
-            if len(role.name) <= 25 and not role.is_default()
-        ]
-
-        if not available_roles:
-            await interaction.response.send_message(
-                "❌ No roles available. Please create a role first.",
-                ephemeral=True
-            )
-            return
-
-        # Get first page of roles
-        page_roles, has_more = self.cog._get_paginated_roles(available_roles, 1, "guest")
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Guest role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Guest role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_guest_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "guest_role"
-
-        # Add navigation buttons if there are more pages
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_guest_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Store pagination state using user ID
-        self.cog._update_pagination_state(interaction.user.id, {
-            "current_page": 1,
-            "role_type": "guest",
-            "roles": available_roles,
-            "message_id": interaction.message.id
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_guest_role_next_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get next page
-        current_page = pagination_state["current_page"] + 1
-        page_roles, has_more = self.cog._get_paginated_roles(
-            pagination_state["roles"],
-            current_page,
-            pagination_state["role_type"]
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Guest role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Guest role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_guest_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "guest_role"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_guest_role_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_guest_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_guest_role_prev_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get previous page
-        current_page = pagination_state["current_page"] - 1
-        page_roles, has_more = self.cog._get_paginated_roles(
-            pagination_state["roles"],
-            current_page,
-            pagination_state["role_type"]
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Guest role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Guest role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_guest_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "guest_role"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_guest_role_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_guest_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_guest_role_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        role_id = int(interaction.data["values"][0])
-        role = interaction.guild.get_role(role_id)
-        if role:
-            self.settings["guest_role_name"] = role.name
-            self.selection_active = False
-            self.current_select = None
-            # Clear pagination state
-            self.cog._clear_pagination_state(interaction.user.id)
-            await self.show_current_step()
-            await interaction.response.edit_message(view=self)
-        else:
-            await interaction.response.send_message("❌ Selected role not found.", ephemeral=True)
+        await self._open_picker(interaction, "guest_role")
 
     @discord.ui.button(label="Select Verified Role", style=discord.ButtonStyle.primary)
     async def select_verified_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get available roles
-        available_roles = [
-            role for role in interaction.guild.roles
-            if len(role.name) <= 25 and not role.is_default()
-        ]
-
-        if not available_roles:
-            await interaction.response.send_message(
-                "❌ No roles available. Please create a role first.",
-                ephemeral=True
-            )
-            return
-
-        # Get first page of roles
-        page_roles, has_more = self.cog._get_paginated_roles(available_roles, 1, "verified")
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Verified role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Verified role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_verified_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "verified_role"
-
-        # Add navigation buttons if there are more pages
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_verified_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Store pagination state using user ID
-        self.cog._update_pagination_state(interaction.user.id, {
-            "current_page": 1,
-            "role_type": "verified",
-            "roles": available_roles,
-            "message_id": interaction.message.id
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_verified_role_next_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get next page
-        current_page = pagination_state["current_page"] + 1
-        page_roles, has_more = self.cog._get_paginated_roles(
-            pagination_state["roles"],
-            current_page,
-            pagination_state["role_type"]
-        )
+        await self._open_picker(interaction, "verified_role")
 
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Verified role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Verified role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_verified_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "verified_role"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_verified_role_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_verified_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_verified_role_prev_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get previous page
-        current_page = pagination_state["current_page"] - 1
-        page_roles, has_more = self.cog._get_paginated_roles(
-            pagination_state["roles"],
-            current_page,
-            pagination_state["role_type"]
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Verified role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Verified role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_verified_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "verified_role"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_verified_role_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_verified_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
+    @discord.ui.button(label="Select Admin Role", style=discord.ButtonStyle.primary)
+    async def select_admin_role(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._open_picker(interaction, "admin_role")
 
     @discord.ui.button(label="Select Rules Channel", style=discord.ButtonStyle.primary)
     async def select_rules_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get all text channels from the guild
-        text_channels = [channel for channel in interaction.guild.channels if isinstance(channel, discord.TextChannel)]
-        
-        if not text_channels:
-            await interaction.response.send_message(
-                "❌ No text channels available. Please create a channel first.",
-                ephemeral=True
-            )
-            return
-
-        # Get first page of channels
-        page_channels, has_more = self.cog._get_paginated_channels(text_channels, 1)
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing rules channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as rules channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_rules_channel_selection
-        
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "rules_channel"
-
-        # Add navigation buttons if there are more pages
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_rules_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Store pagination state using user ID
-        self.cog._update_pagination_state(interaction.user.id, {
-            "current_page": 1,
-            "channels": text_channels,
-            "message_id": interaction.message.id
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_rules_channel_next_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get next page
-        current_page = pagination_state["current_page"] + 1
-        page_channels, has_more = self.cog._get_paginated_channels(
-            pagination_state["channels"],
-            current_page
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing rules channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as rules channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_rules_channel_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "rules_channel"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_rules_channel_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_rules_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_rules_channel_prev_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get previous page
-        current_page = pagination_state["current_page"] - 1
-        page_channels, has_more = self.cog._get_paginated_channels(
-            pagination_state["channels"],
-            current_page
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing rules channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as rules channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_rules_channel_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "rules_channel"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_rules_channel_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_rules_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
+        await self._open_picker(interaction, "rules_channel")
 
     @discord.ui.button(label="Select Roles Channel", style=discord.ButtonStyle.primary)
     async def select_roles_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get all text channels from the guild
-        text_channels = [channel for channel in interaction.guild.channels if isinstance(channel, discord.TextChannel)]
-        
-        if not text_channels:
-            await interaction.response.send_message(
-                "❌ No text channels available. Please create a channel first.",
-                ephemeral=True
-            )
-            return
-
-        # Get first page of channels
-        page_channels, has_more = self.cog._get_paginated_channels(text_channels, 1)
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing roles channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as roles channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_roles_channel_selection
-        
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "roles_channel"
-
-        # Add navigation buttons if there are more pages
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_roles_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Store pagination state using user ID
-        self.cog._update_pagination_state(interaction.user.id, {
-            "current_page": 1,
-            "channels": text_channels,
-            "message_id": interaction.message.id
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_roles_channel_next_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get next page
-        current_page = pagination_state["current_page"] + 1
-        page_channels, has_more = self.cog._get_paginated_channels(
-            pagination_state["channels"],
-            current_page
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing roles channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as roles channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_roles_channel_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "roles_channel"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_roles_channel_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_roles_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_roles_channel_prev_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get previous page
-        current_page = pagination_state["current_page"] - 1
-        page_channels, has_more = self.cog._get_paginated_channels(
-            pagination_state["channels"],
-            current_page
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing roles channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as roles channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_roles_channel_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "roles_channel"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_roles_channel_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_roles_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
+        await self._open_picker(interaction, "roles_channel")
 
     @discord.ui.button(label="Select Admin Channel", style=discord.ButtonStyle.primary)
     async def select_admin_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
+        await self._open_picker(interaction, "admin_channel")
+
+    @admin_only
+    async def _open_picker(self, interaction: discord.Interaction, kind: str):
+        """Replace the wizard buttons with a paginated select menu of existing roles or channels."""
+        picker = self._PICKERS[kind]
+        if picker.role_type:
+            if self._available_roles is None:
+                self._available_roles = [
+                    role for role in interaction.guild.roles
+                    if len(role.name) <= 25 and not role.is_default()
+                ]
+            items = self._available_roles
+        else:
+            if self._text_channels is None:
+                self._text_channels = interaction.guild.text_channels
+            items = self._text_channels
 
-        # Get all text channels from the guild
-        text_channels = [channel for channel in interaction.guild.channels if isinstance(channel, discord.TextChannel)]
-        
-        if not text_channels:
+        if not items:
+            entity = "roles" if picker.role_type else "text channels"
             await interaction.response.send_message(
-                "❌ No text channels available. Please create a channel first.",
+                f"❌ No {entity} available. Please create a {'role' if picker.role_type else 'channel'} first.",
                 ephemeral=True
             )
             return
 
-        # Get first page of channels
-        page_channels, has_more = self.cog._get_paginated_channels(text_channels, 1)
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing admin channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as admin channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_admin_channel_selection
-        
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "admin_channel"
-
-        # Add navigation buttons if there are more pages
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_admin_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
         # Store pagination state using user ID
-        self.cog._update_pagination_state(interaction.user.id, {
+        state = {
             "current_page": 1,
-            "channels": text_channels,
+            "kind": kind,
+            "items": items,
             "message_id": interaction.message.id
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_admin_channel_next_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get next page
-        current_page = pagination_state["current_page"] + 1
-        page_channels, has_more = self.cog._get_paginated_channels(
-            pagination_state["channels"],
-            current_page
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing admin channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as admin channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_admin_channel_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "admin_channel"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_admin_channel_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_admin_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_admin_channel_prev_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
+        }
+        self.cog._update_pagination_state(interaction.user.id, state)
+        self._show_picker_page(state)
+        await interaction.response.edit_message(view=self)
+
+    async def _next_picker_page(self, interaction: discord.Interaction):
+        await self._turn_picker_page(interaction, 1)
 
+    async def _prev_picker_page(self, interaction: discord.Interaction):
+        await self._turn_picker_page(interaction, -1)
+
+    @admin_only
+    async def _turn_picker_page(self, interaction: discord.Interaction, delta: int):
         # Get current pagination state using user ID
         pagination_state = self.cog._get_pagination_state(interaction.user.id)
         if not pagination_state:
@@ -2537,180 +1953,140 @@ class SetupWizardView(discord.ui.View):
             )
             return
 
-        # Get previous page
-        current_page = pagination_state["current_page"] - 1
-        page_channels, has_more = self.cog._get_paginated_channels(
-            pagination_state["channels"],
-            current_page
-        )
+        state = {**pagination_state, "current_page": pagination_state["current_page"] + delta}
+        self.cog._update_pagination_state(interaction.user.id, state)
+        self._show_picker_page(state)
+        await interaction.response.edit_message(view=self)
 
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing admin channel",
-            options=[
-                discord.SelectOption(
-                    label=channel.name,
-                    value=str(channel.id),
-                    description=f"Select {channel.name} as admin channel"
-                )
-                for channel in page_channels
-            ]
-        )
-        select.callback = self.handle_admin_channel_selection
+    def _show_picker_page(self, state: dict):
+        """Show one page of a picker's select menu with its navigation and cancel buttons."""
+        kind, page = state["kind"], state["current_page"]
+        picker = self._PICKERS[kind]
+        cached = self._picker_options.get((kind, page))
+        # Reuse the page's options unless a create_* button has since replaced the candidate list
+        if cached and cached[0] is state["items"]:
+            _, options, has_more = cached
+        else:
+            if picker.role_type:
+                page_items, has_more = self.cog._get_paginated_roles(state["items"], page, picker.role_type)
+            else:
+                page_items, has_more = self.cog._get_paginated_channels(state["items"], page)
+            options = [discord.SelectOption(label=item.name, value=str(item.id)) for item in page_items]
+            self._picker_options[(kind, page)] = (state["items"], options, has_more)
+
+        self._picker_select.placeholder = f"Choose an existing {picker.label}"
+        self._picker_select.options = list(options)
 
         # Update view with select menu
         self.clear_items()
-        self.add_item(select)
+        self.add_item(self._picker_select)
         self.selection_active = True
-        self.current_select = "admin_channel"
+        self.current_select = kind
 
         # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_admin_channel_prev_page
-            self.add_item(prev_button)
-
+        if page > 1:
+            self.add_item(self._prev_button)
         if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_admin_channel_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    @discord.ui.button(label="Create Guest Role", style=discord.ButtonStyle.primary)
-    async def create_guest_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
+            self.add_item(self._next_button)
+        self.add_item(self._cancel_button)
+
+    @admin_only
+    async def _apply_picker_selection(self, interaction: discord.Interaction):
+        picker = self._PICKERS[self.current_select]
+        # The options on the open page already carry each id's name; values stay ids since names needn't be unique
+        value = interaction.data["values"][0]
+        name = next((option.label for option in self._picker_select.options if option.value == value), None)
+        if name:
+            self.settings[picker.setting_key] = name
+            self.selection_active = False
+            self.current_select = None
+            # Clear pagination state
+            self.cog._clear_pagination_state(interaction.user.id)
+            await self.show_current_step()
+            await interaction.response.edit_message(view=self)
+        else:
             await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
+                f"❌ Selected {'role' if picker.role_type else 'channel'} not found.", ephemeral=True
             )
-            return
 
+    @discord.ui.button(label="Create Guest Role", style=discord.ButtonStyle.primary)
+    @admin_only
+    async def create_guest_role(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # Creating roles/channels can be slow under rate limits; acknowledge within Discord's 3s window first
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             role = await interaction.guild.create_role(name=settings["guest_role_name"])
             self.settings["guest_role_name"] = role.name
-            await interaction.response.send_message(f"✅ Created Guest role: {role.mention}", ephemeral=True)
+            self._available_roles = None
+            await interaction.followup.send(f"✅ Created Guest role: {role.mention}", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error creating Guest role: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error creating Guest role: {e}", ephemeral=True)
 
     @discord.ui.button(label="Create Verified Role", style=discord.ButtonStyle.primary)
+    @admin_only
     async def create_verified_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             role = await interaction.guild.create_role(name=settings["verified_role_name"])
             self.settings["verified_role_name"] = role.name
-            await interaction.response.send_message(f"✅ Created Verified role: {role.mention}", ephemeral=True)
+            self._available_roles = None
+            await interaction.followup.send(f"✅ Created Verified role: {role.mention}", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error creating Verified role: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error creating Verified role: {e}", ephemeral=True)
 
     @discord.ui.button(label="Create Rules Channel", style=discord.ButtonStyle.primary)
+    @admin_only
     async def create_rules_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             channel = await interaction.guild.create_text_channel(settings["rules_channel_name"])
             self.settings["rules_channel_name"] = channel.name
-            await interaction.response.send_message(f"✅ Created rules channel: {channel.mention}", ephemeral=True)
+            self._text_channels = None
+            await interaction.followup.send(f"✅ Created rules channel: {channel.mention}", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error creating rules channel: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error creating rules channel: {e}", ephemeral=True)
 
     @discord.ui.button(label="Create Roles Channel", style=discord.ButtonStyle.primary)
+    @admin_only
     async def create_roles_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             channel = await interaction.guild.create_text_channel(settings["roles_channel_name"])
             self.settings["roles_channel_name"] = channel.name
+            self._text_channels = None
             await self.show_current_step()
-            await interaction.response.send_message(f"✅ Created roles channel: {channel.mention}", ephemeral=True)
+            await interaction.followup.send(f"✅ Created roles channel: {channel.mention}", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error creating roles channel: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error creating roles channel: {e}", ephemeral=True)
 
     @discord.ui.button(label="Create Admin Channel", style=discord.ButtonStyle.primary)
+    @admin_only
     async def create_admin_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             channel = await interaction.guild.create_text_channel(settings["admin_channel_name"])
             self.settings["admin_channel_name"] = channel.name
+            self._text_channels = None
             await self.show_current_step()
-            await interaction.response.send_message(f"✅ Created admin channel: {channel.mention}", ephemeral=True)
+            await interaction.followup.send(f"✅ Created admin channel: {channel.mention}", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error creating admin channel: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error creating admin channel: {e}", ephemeral=True)
 
     @discord.ui.button(label="Enable Verification", style=discord.ButtonStyle.primary)
+    @admin_only
     async def enable_verification(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
         try:
             # Acknowledge the interaction first
             await interaction.response.defer()
             
-            # Then do the database operations
-            astra_db_ops.update_guild_verification_settings(interaction.guild_id, self.settings)
-            astra_db_ops.toggle_guild_verification(interaction.guild_id, True)
-            
-            # Create completion embed
-            embed = discord.Embed(
-                title="✅ Setup Complete!",
-                description="The verification system has been configured successfully.",
-                color=discord.Color.green()
-            )
-            
-            # Add summary of settings
-            settings_summary = (
-                f"👤 Guest Role: {self.settings.get('guest_role_name', 'Guest')}\n"
-                f"✅ Verified Role: {self.settings.get('verified_role_name', 'Verified')}\n"
-                f"👑 Admin Role: {self.settings.get('admin_role_name', 'Staff')}\n"
-                f"📜 Rules Channel: {self.settings.get('rules_channel_name', 'rules')}\n"
-                f"🎭 Roles Channel: {self.settings.get('roles_channel_name', 'roles')}\n"
-                f"⚠️ Admin Channel: {self.settings.get('admin_channel_name', 'admin')}"
-            )
-            embed.add_field(name="Configuration Summary", value=settings_summary, inline=False)
+            await self._persist_settings(interaction.guild_id)
             
-            # Clear all buttons
+            embed = self._build_summary_embed()
             self.clear_items()
             
             # Use followup to send the final message
@@ -2737,249 +2113,44 @@ class SetupWizardView(discord.ui.View):
             return True  # This step is completed by clicking the button
         return False
 
+    def _build_summary_embed(self) -> discord.Embed:
+        """Build the "Setup Complete!" embed listing the saved configuration."""
+        embed = discord.Embed(
+            title="✅ Setup Complete!",
+            description="The verification system has been configured successfully.",
+            color=discord.Color.green()
+        )
+        summary = "\n".join(
+            f"{label}: {self.settings.get(key, default)}"
+            for key, label, default in self._SETTINGS_DISPLAY
+        )
+        embed.add_field(name="Configuration Summary", value=summary, inline=False)
+        return embed
+
+    async def _persist_settings(self, guild_id: int):
+        """Save the wizard's settings and enable verification in a single upsert."""
+        # Picks are only held in self.settings until here, so this is the wizard's one database write
+        await asyncio.to_thread(
+            astra_db_ops.update_guild_verification_settings, guild_id, {**self.settings, "enabled": True}
+        )
+        self.cog.invalidate_guild_settings(guild_id)
+
     async def complete_setup(self, interaction: discord.Interaction):
+        # Acknowledge the interaction before the database write
+        await interaction.response.defer()
         try:
-            # Save all settings to database
-            astra_db_ops.update_guild_verification_settings(interaction.guild_id, self.settings)
+            await self._persist_settings(interaction.guild_id)
             
-            # Create completion embed
-            embed = discord.Embed(
-                title="✅ Setup Complete!",
-                description="The verification system has been configured successfully.",
-                color=discord.Color.green()
-            )
-            
-            # Add summary of settings
-            settings_summary = (
-                f"👤 Guest Role: {self.settings.get('guest_role_name', 'Guest')}\n"
-                f"✅ Verified Role: {self.settings.get('verified_role_name', 'Verified')}\n"
-                f"👑 Admin Role: {self.settings.get('admin_role_name', 'Staff')}\n"
-                f"📜 Rules Channel: {self.settings.get('rules_channel_name', 'rules')}\n"
-                f"🎭 Roles Channel: {self.settings.get('roles_channel_name', 'roles')}\n"
-                f"⚠️ Admin Channel: {self.settings.get('admin_channel_name', 'admin')}"
-            )
-            embed.add_field(name="Configuration Summary", value=settings_summary, inline=False)
-            
-            # Clear all buttons
+            embed = self._build_summary_embed()
             self.clear_items()
             
-            await interaction.response.edit_message(embed=embed, view=self)
+            await interaction.edit_original_response(embed=embed, view=self)
             
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error completing setup: {e}", ephemeral=True)
-
-    @discord.ui.button(label="Select Admin Role", style=discord.ButtonStyle.primary)
-    async def select_admin_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get available roles
-        available_roles = [
-            role for role in interaction.guild.roles
-            if len(role.name) <= 25 and not role.is_default()
-        ]
-
-        if not available_roles:
-            await interaction.response.send_message(
-                "❌ No roles available. Please create a role first.",
-                ephemeral=True
-            )
-            return
-
-        # Get first page of roles
-        page_roles, has_more = self.cog._get_paginated_roles(available_roles, 1, "admin")
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Admin role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Admin role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_admin_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "admin_role"
-
-        # Add navigation buttons if there are more pages
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_admin_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Store pagination state using user ID
-        self.cog._update_pagination_state(interaction.user.id, {
-            "current_page": 1,
-            "role_type": "admin",
-            "roles": available_roles,
-            "message_id": interaction.message.id
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_admin_role_next_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get next page
-        current_page = pagination_state["current_page"] + 1
-        page_roles, has_more = self.cog._get_paginated_roles(
-            pagination_state["roles"],
-            current_page,
-            pagination_state["role_type"]
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Admin role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Admin role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_admin_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "admin_role"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_admin_role_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_admin_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
-
-    async def handle_admin_role_prev_page(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        # Get current pagination state using user ID
-        pagination_state = self.cog._get_pagination_state(interaction.user.id)
-        if not pagination_state:
-            await interaction.response.send_message(
-                "❌ Pagination state not found. Please try again.",
-                ephemeral=True
-            )
-            return
-
-        # Get previous page
-        current_page = pagination_state["current_page"] - 1
-        page_roles, has_more = self.cog._get_paginated_roles(
-            pagination_state["roles"],
-            current_page,
-            pagination_state["role_type"]
-        )
-
-        # Create select menu
-        select = discord.ui.Select(
-            placeholder="Choose an existing Admin role",
-            options=[
-                discord.SelectOption(
-                    label=role.name,
-                    value=str(role.id),
-                    description=f"Select {role.name} as Admin role"
-                )
-                for role in page_roles
-            ]
-        )
-        select.callback = self.handle_admin_role_selection
-
-        # Update view with select menu
-        self.clear_items()
-        self.add_item(select)
-        self.selection_active = True
-        self.current_select = "admin_role"
-
-        # Add navigation buttons
-        if current_page > 1:
-            prev_button = discord.ui.Button(label="Previous Page", style=discord.ButtonStyle.secondary)
-            prev_button.callback = self.handle_admin_role_prev_page
-            self.add_item(prev_button)
-
-        if has_more:
-            next_button = discord.ui.Button(label="Next Page", style=discord.ButtonStyle.secondary)
-            next_button.callback = self.handle_admin_role_next_page
-            self.add_item(next_button)
-
-        # Add a cancel button
-        cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.secondary)
-        cancel_button.callback = self.cancel_selection
-        self.add_item(cancel_button)
-
-        # Update pagination state
-        self.cog._update_pagination_state(interaction.user.id, {
-            **pagination_state,
-            "current_page": current_page
-        })
-
-        await interaction.response.edit_message(view=self)
+            await interaction.followup.send(f"❌ Error completing setup: {e}", ephemeral=True)
 
+    @admin_only
     async def cancel_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
         self.selection_active = False
         self.current_select = None
         # Clear pagination state
@@ -2987,119 +2158,18 @@ class SetupWizardView(discord.ui.View):
         await self.show_current_step()
         await interaction.response.edit_message(view=self)
 
-    async def handle_verified_role_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        role_id = int(interaction.data["values"][0])
-        role = interaction.guild.get_role(role_id)
-        if role:
-            self.settings["verified_role_name"] = role.name
-            self.selection_active = False
-            self.current_select = None
-            await self.show_current_step()
-            await interaction.response.edit_message(view=self)
-        else:
-            await interaction.response.send_message("❌ Selected role not found.", ephemeral=True)
-
-    async def handle_rules_channel_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        channel_id = int(interaction.data["values"][0])
-        channel = interaction.guild.get_channel(channel_id)
-        if channel:
-            self.settings["rules_channel_name"] = channel.name
-            self.selection_active = False
-            self.current_select = None
-            await self.show_current_step()
-            await interaction.response.edit_message(view=self)
-        else:
-            await interaction.response.send_message("❌ Selected channel not found.", ephemeral=True)
-
-    async def handle_roles_channel_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        channel_id = int(interaction.data["values"][0])
-        channel = interaction.guild.get_channel(channel_id)
-        if channel:
-            self.settings["roles_channel_name"] = channel.name
-            self.selection_active = False
-            self.current_select = None
-            await self.show_current_step()
-            await interaction.response.edit_message(view=self)
-        else:
-            await interaction.response.send_message("❌ Selected channel not found.", ephemeral=True)
-
-    async def handle_admin_channel_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        channel_id = int(interaction.data["values"][0])
-        channel = interaction.guild.get_channel(channel_id)
-        if channel:
-            self.settings["admin_channel_name"] = channel.name
-            self.selection_active = False
-            self.current_select = None
-            await self.show_current_step()
-            await interaction.response.edit_message(view=self)
-        else:
-            await interaction.response.send_message("❌ Selected channel not found.", ephemeral=True)
-
-    async def handle_admin_role_selection(self, interaction: discord.Interaction):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
-        role_id = int(interaction.data["values"][0])
-        role = interaction.guild.get_role(role_id)
-        if role:
-            self.settings["admin_role_name"] = role.name
-            self.selection_active = False
-            self.current_select = None
-            # Clear pagination state
-            self.cog._clear_pagination_state(interaction.user.id)
-            await self.show_current_step()
-            await interaction.response.edit_message(view=self)
-        else:
-            await interaction.response.send_message("❌ Selected role not found.", ephemeral=True)
-
     @discord.ui.button(label="Create Admin Role", style=discord.ButtonStyle.primary)
+    @admin_only
     async def create_admin_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not self.is_admin(interaction):
-            await interaction.response.send_message(
-                "❌ You need administrator permissions to use this command.",
-                ephemeral=True
-            )
-            return
-
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            settings = self.get_guild_settings(interaction.guild_id)
+            settings = await self.get_guild_settings(interaction.guild_id)
             role = await interaction.guild.create_role(name=settings["admin_role_name"])
             self.settings["admin_role_name"] = role.name
-            await interaction.response.send_message(f"✅ Created Admin role: {role.mention}", ephemeral=True)
+            self._available_roles = None
+            await interaction.followup.send(f"✅ Created Admin role: {role.mention}", ephemeral=True)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error creating Admin role: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error creating Admin role: {e}", ephemeral=True)
 
 async def setup(bot):
     """Add the cog to the bot."""
@@ -133,3 +133,17 @@ SHIP_MESSAGES = {
     ],
 }
 
+
+# Shipping someone with themselves
+SELF_SHIP_MESSAGES = [
+    "Self-love is the longest relationship you'll ever have. 💅",
+    "You and you? Honestly, iconic. 🪞",
+    "No red flags here… except talking to the mirror. 🚩🪞",
+    "Treat yourself like the main character you are. 🎬",
+    "The only ship that never needs a second opinion. 🛳️",
+    "Solo ship sailing smoothly. ⛵",
+    "Dating yourself: zero drama, unlimited snacks. 🍿",
+    "Certified self-care moment. 🧖",
+    "You complete you. 🧩",
+    "The universe approves of this self-respect. 🌌",
+]
@@ -61,6 +61,11 @@ FAST_TRIVIA_QUESTION_BREAK_TIME = int(os.getenv("FAST_TRIVIA_QUESTION_BREAK_TIME
 
 active_trivia_games = {}
 
+# Bumped whenever trivia scores are written, so cached leaderboards know when they're stale
+LEADERBOARD_VERSION = 0
+# Rendered when there are no scores to show (or they couldn't be read)
+EMPTY_LEADERBOARD = "📊 **Trivia Leaderboard:**\nNo scores yet!"
+
 async def get_user_display_name(bot, user_id, guild_id):
     """Helper function to safely get user display name."""
     try:
@@ -374,6 +379,10 @@ async def start_trivia(source, category: str = "general", bot=None, num_question
                 astra_db_ops.update_user_stats(user_id, user_name, wrong_increment=1,
                                              guild_id=str(guild_id), guild_name=guild_name, channel_id=channel_id)
 
+        if view.correct_users or view.wrong_users:
+            global LEADERBOARD_VERSION
+            LEADERBOARD_VERSION += 1
+
         # Add no answer section if applicable
         if not view.answered_users:
             result_embed.add_field(name="No Answers", value="No one answered this question!", inline=False)
@@ -501,7 +510,7 @@ def create_trivia_leaderboard():
         leaderboard_table = "\n".join(table_rows)
         return f"📊 **Trivia Leaderboard:**\n```{leaderboard_table}```"
     else:
-        return "📊 **Trivia Leaderboard:**\nNo scores yet!"
+        return EMPTY_LEADERBOARD
 
 # Helper function to show the leaderboard
 async def show_leaderboard(source, guild_id, bot):
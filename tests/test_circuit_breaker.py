@@ -0,0 +1,83 @@
+"""
+Unit tests for utils.circuit_breaker.
+
+Run from the project root:
+    python -m pytest tests/test_circuit_breaker.py -v
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import utils.circuit_breaker as cb_mod
+from utils.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch.object(cb_mod.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker("test")
+
+    def _fail(self, times):
+        for _ in range(times):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record(False)
+
+    def test_stays_closed_below_min_calls(self):
+        self._fail(cb_mod.MIN_CALLS - 1)
+        self.assertEqual("closed", self.breaker.state)
+
+    def test_opens_when_failure_ratio_exceeded(self):
+        self._fail(cb_mod.MIN_CALLS)
+        self.assertEqual("open", self.breaker.state)
+        self.assertFalse(self.breaker.allow())
+
+    def test_mostly_successful_calls_keep_it_closed(self):
+        for i in range(cb_mod.WINDOW_SIZE):
+            self.breaker.record(i % 3 == 0 or i % 3 == 1)
+        self.assertEqual("closed", self.breaker.state)
+
+    def test_stale_failures_outside_window_are_ignored(self):
+        self._fail(cb_mod.MIN_CALLS - 1)
+        self.now += cb_mod.WINDOW_SECONDS + 1
+        self._fail(1)
+        self.assertEqual("closed", self.breaker.state)
+
+    def test_half_open_allows_single_probe(self):
+        self._fail(cb_mod.MIN_CALLS)
+        self.now += cb_mod.COOLDOWN_SECONDS
+        self.assertEqual("half-open", self.breaker.state)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow(), "only one probe while half-open")
+
+    def test_successful_probe_closes(self):
+        self._fail(cb_mod.MIN_CALLS)
+        self.now += cb_mod.COOLDOWN_SECONDS
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record(True)
+        self.assertEqual("closed", self.breaker.state)
+
+    def test_failed_probe_reopens(self):
+        self._fail(cb_mod.MIN_CALLS)
+        self.now += cb_mod.COOLDOWN_SECONDS
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record(False)
+        self.assertEqual("open", self.breaker.state)
+
+    def test_abandoned_probe_can_be_retried(self):
+        self._fail(cb_mod.MIN_CALLS)
+        self.now += cb_mod.COOLDOWN_SECONDS
+        self.assertTrue(self.breaker.allow())
+        self.breaker.abandon()
+        self.assertTrue(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
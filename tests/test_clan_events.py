@@ -15,6 +15,7 @@ Run from the project root:
 import sys
 import os
 import time
+import importlib
 import unittest
 from unittest.mock import MagicMock
 
@@ -31,7 +32,9 @@ for _mod in (
     "discord.ext.tasks",
     "discord.app_commands",
 ):
-    if _mod not in sys.modules:
+    try:
+        importlib.import_module(_mod)
+    except ImportError:
         sys.modules[_mod] = MagicMock()
 
 # ── imports under test ────────────────────────────────────────────────────────
@@ -0,0 +1,92 @@
+"""
+Unit tests for the truth or dare cog's question sources.
+
+Covers:
+  - Circuit breaker accounting for question sources (TruthDareCog._guarded)
+  - Serving cached API questions while the API is failing
+
+Run from the project root:
+    python -m pytest tests/test_truth_dare.py -v
+"""
+
+import sys
+import os
+import time
+import unittest
+from collections import deque
+from unittest.mock import AsyncMock, patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import cogs.truth_dare as truth_dare_mod
+import utils.circuit_breaker as cb_mod
+from cogs.truth_dare import TruthDareCog
+from utils.circuit_breaker import CircuitBreaker
+
+
+def _cog() -> TruthDareCog:
+    cog = TruthDareCog.__new__(TruthDareCog)
+    cog._breakers = {name: CircuitBreaker(f"tod-{name}") for name in truth_dare_mod.HEDGE_DELAYS}
+    cog._api_cache = {}
+    return cog
+
+
+class TestSourceBreakers(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cog = _cog()
+
+    async def _fetch_database(self, times: int):
+        for _ in range(times):
+            try:
+                await self.cog._guarded("database", lambda: self.cog._fetch_from_database("truth", "R"))
+            except Exception:
+                pass
+
+    async def test_empty_category_does_not_open_breaker(self):
+        with patch.object(truth_dare_mod.astra_db_ops, "get_random_truth_dare_question", return_value=None):
+            await self._fetch_database(cb_mod.MIN_CALLS * 2)
+        self.assertEqual("closed", self.cog._breakers["database"].state)
+
+    async def test_database_errors_open_breaker(self):
+        with patch.object(truth_dare_mod.astra_db_ops, "get_random_truth_dare_question",
+                          side_effect=RuntimeError("Astra down")):
+            await self._fetch_database(cb_mod.MIN_CALLS)
+        self.assertEqual("open", self.cog._breakers["database"].state)
+
+    async def test_found_question_is_returned(self):
+        row = {"question": "Truth?", "submitted_by": "u1", "_id": "q1", "source": "llm"}
+        with patch.object(truth_dare_mod.astra_db_ops, "get_random_truth_dare_question", return_value=row):
+            result = await self.cog._guarded("database", lambda: self.cog._fetch_from_database("truth", "R"))
+        self.assertEqual("Truth?", result.question)
+        self.assertTrue(result.is_ai)
+
+
+class TestStaleApiFallback(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cog = _cog()
+        self.cog._request_api_question = AsyncMock(side_effect=ConnectionError("API down"))
+
+    def _cache(self, count: int):
+        self.cog._api_cache[("truth", "PG13")] = deque(
+            ((time.monotonic(), f"Cached {i}?", f"id{i}") for i in range(count)),
+            maxlen=truth_dare_mod.API_CACHE_SIZE,
+        )
+
+    async def _fetch_api(self):
+        return await self.cog._guarded("api", lambda: self.cog._fetch_from_api("truth", "PG13"))
+
+    async def test_cached_question_served_but_failure_recorded(self):
+        self._cache(cb_mod.MIN_CALLS)
+        with patch.object(truth_dare_mod.random, "random", return_value=1.0):  # never a cache hit
+            results = [await self._fetch_api() for _ in range(cb_mod.MIN_CALLS)]
+        self.assertEqual([f"Cached {i}?" for i in range(cb_mod.MIN_CALLS)], [r.question for r in results])
+        self.assertEqual("open", self.cog._breakers["api"].state)
+
+    async def test_failure_without_cache_raises(self):
+        with self.assertRaises(ConnectionError):
+            await self._fetch_api()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+"""
+Unit tests for the verification cog.
+
+Covers:
+  - Answer helpers (normalize_answer / accepted_answers / prepare_questions)
+  - index_active_verifications (session index built at cog load)
+  - VerificationCog admin review batching (queue_admin_review / _flush_admin_reviews)
+  - Verification progress persistence (handle_verification_response)
+  - Abandoned session sweep (sweep_abandoned_verifications)
+  - Verification question pool (take_verification_questions / _question_refiller)
+
+Run from the project root:
+    python -m pytest tests/test_verification.py -v
+"""
+
+import sys
+import os
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import cogs.verification as verification_mod
+from cogs.verification import (
+    VerificationCog,
+    accepted_answers,
+    index_active_verifications,
+    normalize_answer,
+    prepare_questions,
+)
+
+
+class TestAnswerHelpers(unittest.TestCase):
+    def test_normalize_casefolds_and_strips(self):
+        # casefold, not lower: "ß" matches "ss"
+        self.assertEqual("strasse", normalize_answer("  Straße "))
+        self.assertEqual("paris", normalize_answer("\tParis \n"))
+
+    def test_normalize_accepts_non_strings(self):
+        self.assertEqual("4", normalize_answer(4))
+
+    def test_single_answer(self):
+        self.assertEqual(["paris"], accepted_answers({"answer": " Paris"}))
+
+    def test_list_aliases(self):
+        self.assertEqual(["4", "four"], accepted_answers({"answer": ["4", "FOUR "]}))
+
+    def test_missing_answer_accepts_only_empty(self):
+        self.assertEqual([""], accepted_answers({"question": "?"}))
+
+    def test_stored_accepted_answers_take_precedence(self):
+        self.assertEqual(["four"], accepted_answers({"answer": "4", "accepted_answers": ["four"]}))
+
+    def test_falls_back_to_answer_when_accepted_answers_missing(self):
+        # Sessions stored before prepare_questions existed only have "answer"
+        question = {"question": "2 + 2?", "answer": ["4", "Four"]}
+        self.assertNotIn("accepted_answers", question)
+        self.assertEqual(["4", "four"], accepted_answers(question))
+
+    def test_prepare_questions_stores_normalized_answers(self):
+        questions = prepare_questions([{"answer": "Blue "}, {"answer": ["A", "b"]}])
+        self.assertEqual(["blue"], questions[0]["accepted_answers"])
+        self.assertEqual(["a", "b"], questions[1]["accepted_answers"])
+
+    def test_prepare_questions_skips_non_dicts(self):
+        self.assertEqual(["not a question"], prepare_questions(["not a question"]))
+
+
+class TestIndexActiveVerifications(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual({}, index_active_verifications({}))
+
+    def test_groups_guilds_per_user(self):
+        index = index_active_verifications({
+            (1, 10): {"timestamp": 100.0},
+            (1, 20): {"timestamp": 200.0},
+            (2, 10): {"timestamp": 300.0},
+        })
+        self.assertEqual({1: {10: 100.0, 20: 200.0}, 2: {10: 300.0}}, index)
+
+    def test_missing_timestamp_uses_now(self):
+        with patch.object(verification_mod.time, "time", return_value=500.0):
+            index = index_active_verifications({(1, 10): {}})
+        self.assertEqual({1: {10: 500.0}}, index)
+
+
+def _member(user_id: int) -> MagicMock:
+    member = MagicMock()
+    member.id = user_id
+    member.display_name = f"member{user_id}"
+    return member
+
+
+class TestAdminReviewBatching(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = patch.object(verification_mod, "ADMIN_REVIEW_DEBOUNCE", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cog = VerificationCog.__new__(VerificationCog)
+        self.cog._review_buffer = {}
+        self.cog._review_flushes = {}
+
+        self.sent = []
+        self.release_send = asyncio.Event()
+        self.channel = MagicMock()
+        self.channel.id = 42
+
+        async def slow_send(embeds, view):
+            self.sent.append(embeds)
+            await self.release_send.wait()
+
+        self.channel.send = slow_send
+
+    async def _drain(self):
+        while self.cog._review_flushes:
+            await asyncio.gather(*self.cog._review_flushes.values())
+
+    async def test_reviews_queued_together_share_one_message(self):
+        self.release_send.set()
+        self.cog.queue_admin_review(self.channel, _member(1), "embed1")
+        self.cog.queue_admin_review(self.channel, _member(2), "embed2")
+        await self._drain()
+        self.assertEqual([["embed1", "embed2"]], self.sent)
+
+    async def test_review_queued_during_send_gets_its_own_flush(self):
+        self.cog.queue_admin_review(self.channel, _member(1), "embed1")
+        while not self.sent:
+            await asyncio.sleep(0)
+
+        # The first flush is still inside channel.send when the second member arrives
+        self.cog.queue_admin_review(self.channel, _member(2), "embed2")
+        self.release_send.set()
+        await self._drain()
+
+        self.assertEqual([["embed1"], ["embed2"]], self.sent)
+        self.assertEqual({}, self.cog._review_buffer)
+        self.assertEqual({}, self.cog._review_flushes)
+
+
+def _cog_with_session(user_id: int, guild_id: int, started_at: float) -> VerificationCog:
+    cog = VerificationCog.__new__(VerificationCog)
+    cog.bot = MagicMock()
+    cog.active_verifications = {user_id: {guild_id: started_at}}
+    cog._session_channels = {(user_id, guild_id): 10}
+    cog._verification_channels = {10}
+    cog.role_selections = {}
+    cog.log_attempt = MagicMock()
+    return cog
+
+
+class TestVerificationProgress(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = {
+            "channel_id": 10,
+            "stage": "answering",
+            "attempts": 0,
+            "current_question": 0,
+            "correct_answers": 0,
+            "questions": [{"question": "2 + 2?", "answer": "4"}] * 3,
+        }
+        self.cog = _cog_with_session(1, 2, time.time())
+        self.message = MagicMock()
+        self.message.author.id = 1
+        self.message.guild.id = 2
+        self.message.channel.id = 10
+        self.message.channel.send = AsyncMock()
+
+        patcher = patch.object(verification_mod, "astra_db_ops")
+        self.db = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.db.get_active_verification.return_value = self.session
+
+    async def test_correct_answer_is_persisted(self):
+        self.message.content = " 4 "
+        await self.cog.handle_verification_response(self.message)
+        self.db.update_active_verification.assert_called_once_with(
+            1, 2, {"attempts": 1, "correct_answers": 1, "current_question": 1}
+        )
+
+    async def test_wrong_answer_only_counts_the_attempt(self):
+        self.message.content = "5"
+        await self.cog.handle_verification_response(self.message)
+        self.db.update_active_verification.assert_called_once_with(1, 2, {"attempts": 1})
+
+
+class TestAbandonedSweep(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.started_at = time.time() - verification_mod.VERIFICATION_SESSION_TTL - 1
+        self.cog = _cog_with_session(1, 2, self.started_at)
+        self.cog.bot.get_channel.return_value.delete = AsyncMock()
+
+        patcher = patch.object(verification_mod, "astra_db_ops")
+        self.db = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _sweep(self, stage: str):
+        self.db.get_active_verification.return_value = {
+            "stage": stage, "timestamp": self.started_at, "channel_id": 10
+        }
+        await self.cog.sweep_abandoned_verifications.coro(self.cog)
+
+    async def test_session_awaiting_review_is_kept(self):
+        await self._sweep("roles_selected")
+        self.db.delete_active_verification.assert_not_called()
+        self.assertTrue(self.cog.has_verification(1, 2))
+
+    async def test_session_stuck_answering_is_removed(self):
+        await self._sweep("answering")
+        self.db.delete_active_verification.assert_called_once_with(1, 2)
+        self.assertFalse(self.cog.has_verification(1, 2))
+
+
+class TestQuestionPool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        for name, value in (("QUESTION_POOL_WAIT", 0.01), ("QUESTION_REFILL_BACKOFF", 60)):
+            patcher = patch.object(verification_mod, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.generate = AsyncMock()
+        patcher = patch.object(verification_mod.openai_utils, "generate_openai_response", self.generate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cog = VerificationCog.__new__(VerificationCog)
+        self.cog._question_pool = asyncio.Queue(maxsize=verification_mod.QUESTION_POOL_MAX)
+        self.cog._question_refill = asyncio.Event()
+        self.cog._question_task = None
+        self.cog._inflight_questions = {}
+
+    async def asyncTearDown(self):
+        if self.cog._question_task:
+            self.cog._question_task.cancel()
+
+    async def test_generated_sets_are_pooled(self):
+        self.generate.return_value = [{"question": "Capital of France?", "answer": "Paris"}]
+        questions = await self.cog.take_verification_questions(1)
+        self.assertEqual(["paris"], questions[0]["accepted_answers"])
+        await asyncio.sleep(0.05)
+        self.assertGreater(self.cog._question_pool.qsize(), 0)
+
+    async def test_failures_fall_back_per_join_without_pooling_or_retrying(self):
+        self.generate.side_effect = RuntimeError("OpenAI down")
+        self.assertIsNone(self.cog._question_task, "no OpenAI calls before the first join")
+
+        questions = await self.cog.take_verification_questions(1)
+        await asyncio.sleep(0.05)
+
+        defaults = [q["question"] for q in verification_mod.openai_utils.DEFAULT_VERIFICATION_QUESTIONS]
+        self.assertEqual(defaults, [q["question"] for q in questions])
+        self.assertEqual(0, self.cog._question_pool.qsize())
+        # One refill round plus the join's direct attempt, then the refiller backs off
+        self.assertEqual(verification_mod.QUESTION_REFILL_CONCURRENCY + 1, self.generate.await_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -245,6 +245,18 @@ def save_bot_status_channel(guild_id, channel_id):
     except Exception as e:
         logging.error(f"[ERROR] Failed to save/update bot status channel: {e}")
 
+# Remove several bot status channels from AstraDB in one request
+def bulk_clear_status_channels(guild_ids):
+    """Delete the bot status channel entries for the given guild IDs."""
+    if not guild_ids:
+        return
+    try:
+        collection = get_bot_status_channels_collection()
+        collection.delete_many({"guild_id": {"$in": list(guild_ids)}})
+        logging.debug(f"Bot status channels cleared for {len(guild_ids)} guild(s)")
+    except Exception as e:
+        logging.error(f"[ERROR] Failed to clear bot status channels: {e}")
+
 # Load stored bot status channels from AstraDB
 def load_bot_status_channels():
     """Load bot status channels from AstraDB."""
@@ -482,6 +494,25 @@ def list_registered_servers():
         logging.error(f"Error retrieving registered servers: {e}")
         return []
 
+def build_verification_attempt(
+    user_id: str,
+    username: str,
+    guild_id: str,
+    stage: str,
+    success: bool = None,
+    details: str = None
+) -> dict:
+    """Build the document stored for a verification attempt or stage completion."""
+    return {
+        "user_id": str(user_id),
+        "username": username,
+        "guild_id": str(guild_id),
+        "stage": stage,
+        "success": success,
+        "timestamp": datetime.datetime.utcnow().isoformat(),
+        "details": details
+    }
+
 def log_verification_attempt(
     user_id: str,
     username: str,
@@ -496,21 +527,26 @@ def log_verification_attempt(
         if collection is None:
             return
 
-        document = {
-            "user_id": str(user_id),
-            "username": username,
-            "guild_id": str(guild_id),
-            "stage": stage,
-            "success": success,
-            "timestamp": datetime.datetime.utcnow().isoformat(),
-            "details": details
-        }
-        
+        document = build_verification_attempt(user_id, username, guild_id, stage, success, details)
         collection.insert_one(document)
         logging.debug(f"Logged verification attempt for {username} at stage {stage}")
     except Exception as e:
         logging.error(f"Error logging verification attempt: {e}")
 
+def log_verification_attempts_batch(documents: list):
+    """Insert several documents from build_verification_attempt in one request."""
+    if not documents:
+        return
+    try:
+        collection = get_verification_attempts_collection()
+        if collection is None:
+            return
+
+        collection.insert_many(documents)
+        logging.debug(f"Logged {len(documents)} verification attempts")
+    except Exception as e:
+        logging.error(f"Error logging verification attempts: {e}")
+
 def get_verification_history(user_id: str, guild_id: str):
     """Get verification history for a user in a specific guild."""
     try:
@@ -580,7 +616,7 @@ def update_guild_verification_settings(guild_id: int, settings: dict):
         settings["guild_id"] = guild_id
         logging.debug(f"Updating settings for guild_id: {guild_id} (type: {type(guild_id)})")
         logging.debug(f"Settings being stored: {settings}")
-        collection.find_one_and_update(
+        collection.update_one(
             {"guild_id": guild_id},
             {"$set": settings},
             upsert=True
@@ -599,7 +635,7 @@ def toggle_guild_verification(guild_id: int, enabled: bool):
     """
     try:
         collection = get_guild_verification_settings_collection()
-        collection.find_one_and_update(
+        collection.update_one(
             {"guild_id": guild_id},
             {"$set": {"enabled": enabled}},
             upsert=True
@@ -620,7 +656,7 @@ def update_guild_channel_settings(guild_id: int, channel_type: str, channel_name
     try:
         collection = get_guild_verification_settings_collection()
         channel_key = f"{channel_type}_channel_name"
-        collection.find_one_and_update(
+        collection.update_one(
             {"guild_id": guild_id},
             {"$set": {channel_key: channel_name}},
             upsert=True
@@ -641,7 +677,7 @@ def update_guild_role_settings(guild_id: int, role_type: str, role_name: str):
     try:
         collection = get_guild_verification_settings_collection()
         role_key = f"{role_type}_role_name"
-        collection.find_one_and_update(
+        collection.update_one(
             {"guild_id": guild_id},
             {"$set": {role_key: role_name}},
             upsert=True
@@ -700,6 +736,28 @@ def save_active_verification(user_id: int, guild_id: int, channel_id: int, data:
     except Exception as e:
         logging.error(f"Error saving active verification: {e}")
 
+def update_active_verification(user_id: int, guild_id: int, fields: dict):
+    """
+    Update some fields of an existing active verification session.
+    
+    Args:
+        user_id: Discord user ID
+        guild_id: Discord guild ID
+        fields: Session fields to set (e.g. stage, attempts)
+    """
+    try:
+        collection = get_active_verifications_collection()
+        if collection is None:
+            return
+
+        collection.update_one(
+            {"user_id": user_id, "guild_id": guild_id},
+            {"$set": fields}
+        )
+        logging.debug(f"Updated active verification for user {user_id} in guild {guild_id}: {list(fields)}")
+    except Exception as e:
+        logging.error(f"Error updating active verification: {e}")
+
 def get_active_verification(user_id: int, guild_id: int):
     """
     Get an active verification session.
@@ -802,11 +860,16 @@ def get_truth_dare_questions_collection():
         return None
 
 def get_random_truth_dare_question(question_type: str, rating: str = "PG"):
-    """Get a random question from the database."""
+    """
+    Get a random question from the database.
+
+    Returns None when no approved question matches. Raises if the database can't be read,
+    so callers can tell an outage from an empty category.
+    """
     try:
         collection = get_truth_dare_questions_collection()
         if collection is None:
-            return None
+            raise RuntimeError("truth_dare_questions collection is unavailable")
         
         # Find approved questions of the specified type and rating
         # Note: AstraDB doesn't support $expr for field comparisons in filters,
@@ -838,7 +901,7 @@ def get_random_truth_dare_question(question_type: str, rating: str = "PG"):
         return None
     except Exception as e:
         logging.error(f"Error getting random truth/dare question: {e}")
-        return None
+        raise
 
 def save_truth_dare_question(guild_id: str, user_id: str, question: str, 
                            question_type: str, rating: str, source: str, 
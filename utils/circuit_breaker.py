@@ -0,0 +1,75 @@
+"""
+Circuit Breaker Module
+
+A lightweight closed/open/half-open circuit breaker for flaky external dependencies
+(third-party APIs, the database, OpenAI).
+
+While closed, every call is allowed and its outcome is recorded in a sliding window.
+When more than FAILURE_RATIO of the recent calls (at least MIN_CALLS of them, within
+WINDOW_SECONDS) have failed, the breaker opens and callers should skip the dependency
+for COOLDOWN_SECONDS. After the cooldown a single probe call is let through
+(half-open); its outcome closes or re-opens the breaker.
+"""
+
+import logging
+import time
+from collections import deque
+
+WINDOW_SIZE = 20
+WINDOW_SECONDS = 60
+FAILURE_RATIO = 0.5
+MIN_CALLS = 5
+COOLDOWN_SECONDS = 30
+
+
+class CircuitBreaker:
+    def __init__(self, name: str):
+        self.name = name
+        self.outcomes = deque(maxlen=WINDOW_SIZE)  # (timestamp, succeeded)
+        self.opened_at = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < COOLDOWN_SECONDS:
+            return "open"
+        return "half-open"
+
+    def allow(self) -> bool:
+        """Return True if a call should be attempted now."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record(self, succeeded: bool):
+        """Record the outcome of a call that allow() let through."""
+        now = time.monotonic()
+        if self.opened_at is not None:
+            # Half-open probe result decides the next state
+            self.probing = False
+            if succeeded:
+                logging.info(f"Circuit breaker '{self.name}' closed after successful probe")
+                self.opened_at = None
+                self.outcomes.clear()
+            else:
+                self.opened_at = now
+            return
+
+        self.outcomes.append((now, succeeded))
+        recent = [ok for ts, ok in self.outcomes if now - ts < WINDOW_SECONDS]
+        failures = recent.count(False)
+        if len(recent) >= MIN_CALLS and failures / len(recent) > FAILURE_RATIO:
+            logging.warning(
+                f"Circuit breaker '{self.name}' opened: {failures}/{len(recent)} recent calls failed"
+            )
+            self.opened_at = now
+
+    def abandon(self):
+        """Forget a call that allow() let through but which never completed (e.g. was cancelled)."""
+        self.probing = False
@@ -35,8 +35,8 @@ class MongoCollectionAdapter:
       - find_one_and_update(..., return_document="after"/"before")
         astrapy accepts strings; pymongo requires ReturnDocument constants.
 
-    All other methods (find_one, insert_one, update_one, delete_one,
-    delete_many) have identical signatures in both libraries and pass through
+    All other methods (find_one, insert_one, insert_many, update_one,
+    delete_one, delete_many) have identical signatures in both libraries and pass through
     directly to pymongo.
     """
 
@@ -68,6 +68,9 @@ class MongoCollectionAdapter:
     def insert_one(self, document):
         return self._coll.insert_one(document)
 
+    def insert_many(self, documents):
+        return self._coll.insert_many(documents)
+
     def update_one(self, filter, update, upsert=False, **_kwargs):
         return self._coll.update_one(filter, update, upsert=upsert)
 
@@ -57,6 +57,13 @@ VERIFICATION_MODEL = os.getenv("VERIFICATION_MODEL", "gpt-4.1-nano")
 # Initialize OpenAI async client
 client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
+# Questions callers can fall back to when verification question generation fails
+DEFAULT_VERIFICATION_QUESTIONS = (
+    {"question": "What is 2+2?", "answer": "4"},
+    {"question": "What color is the sky?", "answer": "blue"},
+    {"question": "How many days are in a week?", "answer": "7"},
+)
+
 async def generate_openai_response(prompt, intent="text", model=None):
     """
     Generates a response from OpenAI based on the provided intent.
@@ -75,7 +82,8 @@ async def generate_openai_response(prompt, intent="text", model=None):
       - If intent is "image": a URL string (DALL-E) or image bytes (GPT Image).
       - If intent is "verification": a list of verification questions.
       - Otherwise (intent is "text"): a string containing the generated text.
-      - On error, returns an error message (or a default dict for intent check).
+      - On error, returns a default dict for intent check and raises for every other intent
+        (verification callers can fall back to DEFAULT_VERIFICATION_QUESTIONS).
     """
     try:
         if model is None:
@@ -174,18 +182,11 @@ async def generate_openai_response(prompt, intent="text", model=None):
             if questions_json.startswith("```json"):
                 questions_json = questions_json.strip("```json").strip("```").strip()
             
-            try:
-                questions = json.loads(questions_json)
-                logging.debug(f"Generated verification questions: {questions}")
-                return questions
-            except json.JSONDecodeError as e:
-                logging.error(f"Failed to parse verification questions JSON: {questions_json}. Error: {e}")
-                # Return default questions as fallback
-                return [
-                    {"question": "What is 2+2?", "answer": "4"},
-                    {"question": "What color is the sky?", "answer": "blue"},
-                    {"question": "How many days are in a week?", "answer": "7"}
-                ]
+            questions = json.loads(questions_json)
+            if not isinstance(questions, list) or not questions:
+                raise ValueError(f"Expected a non-empty list of verification questions, got: {questions_json}")
+            logging.debug(f"Generated verification questions: {questions}")
+            return questions
 
         else:  # Default to text generation.
             response = await client.chat.completions.create(
@@ -212,15 +213,7 @@ async def generate_openai_response(prompt, intent="text", model=None):
         if intent == "intent":
             logging.warning(f"OpenAI API call failed for intent check, using fallback: {e}")
             return {"isAllowed": False, "intent": "text"}
-        # For verification: return default questions (fallback)
-        elif intent == "verification":
-            logging.warning(f"OpenAI API call failed for verification, using default questions: {e}")
-            return [
-                {"question": "What is 2+2?", "answer": "4"},
-                {"question": "What color is the sky?", "answer": "blue"},
-                {"question": "How many days are in a week?", "answer": "7"}
-            ]
-        # For text/image generation: raise exception so error handler can catch it with context
+        # For text/image/verification generation: raise exception so the caller can handle it with context
         else:
             logging.error(f"[ERROR] OpenAI API call failed for {intent} intent: {e}")
             raise